@@ -5,7 +5,8 @@ Admin Monitor - Administrative monitoring dashboard (FULLY FUNCTIONAL)
 import grpc
 import sys
 import os
-import threading
+import asyncio
+import itertools
 from datetime import datetime
 
 # Add parent directory to path
@@ -17,29 +18,86 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+# Keep the long-lived event stream's connection alive through idle periods,
+# and accept list responses larger than the 4 MB default
+CHANNEL_OPTIONS = [
+    ('grpc.keepalive_time_ms', 30000),
+    ('grpc.keepalive_timeout_ms', 10000),
+    ('grpc.keepalive_permit_without_calls', 1),
+    ('grpc.http2.max_pings_without_data', 0),
+    ('grpc.max_receive_message_length', 64 * 1024 * 1024),
+]
+
+# Rules framing every table and report
+SEPARATOR = "=" * 80
+DIVIDER = "-" * 80
+
 
 class AdminMonitor:
+    # Icons for the streamed event types
+    EVENT_ICONS = {
+        'USER_ENROLLED': '🟢',
+        'USER_LOGIN': '🔵',
+        'FILE_UPLOADED': '📤',
+        'FILE_DOWNLOADED': '📥',
+        'FILE_DELETED': '🗑️',
+        'NODE_REGISTERED': '💾',
+        'OTP_SENT': '📧',
+        'OTP_VERIFIED': '✅'
+    }
+    
+    # ASCII stand-ins for EVENT_ICONS when stdout is not a terminal
+    PLAIN_EVENT_ICONS = {
+        'USER_ENROLLED': '+',
+        'USER_LOGIN': '>',
+        'FILE_UPLOADED': '^',
+        'FILE_DOWNLOADED': 'v',
+        'FILE_DELETED': 'x',
+        'NODE_REGISTERED': '#',
+        'OTP_SENT': '@',
+        'OTP_VERIFIED': '='
+    }
+    
+    # Units for format_bytes, each 1024 times the last
+    BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+    
     def __init__(self, server_address='localhost:50051', admin_key=None):
         self.server_address = server_address
         self.admin_key = admin_key or os.getenv('ADMIN_KEY', 'admin123')
-        self.channel = grpc.insecure_channel(server_address)
+        self.channel = grpc.insecure_channel(server_address, options=CHANNEL_OPTIONS)
         self.admin_stub = cloud_storage_pb2_grpc.AdminServiceStub(self.channel)
-        self.monitoring = False
+        # Requests that carry only the admin key, built once and reused
+        self._status_request = cloud_storage_pb2.SystemStatusRequest(admin_key=self.admin_key)
+        self._list_users_request = cloud_storage_pb2.ListUsersRequest(admin_key=self.admin_key)
+        self._list_nodes_request = cloud_storage_pb2.ListNodesRequest(admin_key=self.admin_key)
+        self._stream_events_request = cloud_storage_pb2.StreamEventsRequest(admin_key=self.admin_key)
+        # Every 50-wide status bar, indexed by filled cells
+        self._bars = [('█' * i + '░' * (50 - i)) for i in range(51)]
+        # Piped output (logs, scrapers) gets plain ASCII instead of icons and bars
+        self._tty = sys.stdout.isatty()
     
     def format_bytes(self, bytes_value):
         """Format bytes to human-readable format"""
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if bytes_value < 1024.0:
-                return f"{bytes_value:.2f} {unit}"
-            bytes_value /= 1024.0
-        return f"{bytes_value:.2f} PB"
+        bytes_value = int(bytes_value)
+        if bytes_value < 1024:
+            return f"{bytes_value:.2f} B"
+        # Every 10 bits is one unit up
+        index = min((bytes_value.bit_length() - 1) // 10, len(self.BYTE_UNITS) - 1)
+        return f"{bytes_value / (1 << (10 * index)):.2f} {self.BYTE_UNITS[index]}"
+    
+    def format_timestamp(self, timestamp):
+        """Format an ISO timestamp as 'YYYY-MM-DD HH:MM:SS', or 'Never' if empty"""
+        if not timestamp:
+            return 'Never'
+        date, sep, time_part = timestamp.partition('T')
+        if not sep:
+            return timestamp[:19]
+        return f"{date} {time_part[:8]}"
     
     def get_system_status(self):
         """Get current system status"""
         try:
-            response = self.admin_stub.GetSystemStatus(
-                cloud_storage_pb2.SystemStatusRequest(admin_key=self.admin_key)
-            )
+            response = self.admin_stub.GetSystemStatus(self._status_request)
             return response
         except grpc.RpcError as e:
             print(f"✗ Failed to get system status: {e.details()}")
@@ -52,9 +110,13 @@ class AdminMonitor:
         if not status:
             return
         
-        print("\n" + "=" * 80)
+        if not self._tty:
+            self.write_plain_status(status)
+            return
+        
+        print("\n" + SEPARATOR)
         print("CLOUD STORAGE PLATFORM - SYSTEM STATUS")
-        print("=" * 80)
+        print(SEPARATOR)
         
         print("\n📊 STORAGE OVERVIEW:")
         print(f"  Total Capacity:     {self.format_bytes(status.global_capacity_bytes)}")
@@ -64,19 +126,19 @@ class AdminMonitor:
         
         # Storage bars
         if status.global_capacity_bytes > 0:
-            bar_length = 50
+            bar_length = len(self._bars) - 1
             
             # Allocation bar
             alloc_pct = (status.global_allocated_bytes / status.global_capacity_bytes) * 100
-            alloc_filled = int(bar_length * alloc_pct / 100)
-            alloc_bar = '█' * alloc_filled + '░' * (bar_length - alloc_filled)
+            alloc_filled = min(int(bar_length * alloc_pct / 100), bar_length)
+            alloc_bar = self._bars[alloc_filled]
             print(f"\n  Allocation: [{alloc_bar}] {alloc_pct:.1f}%")
             
             # Usage bar
             if status.global_allocated_bytes > 0:
                 usage_pct = (status.global_used_bytes / status.global_allocated_bytes) * 100
-                usage_filled = int(bar_length * usage_pct / 100)
-                usage_bar = '█' * usage_filled + '░' * (bar_length - usage_filled)
+                usage_filled = min(int(bar_length * usage_pct / 100), bar_length)
+                usage_bar = self._bars[usage_filled]
                 print(f"  Usage:      [{usage_bar}] {usage_pct:.1f}%")
         
         print("\n👥 USER STATISTICS:")
@@ -113,94 +175,149 @@ class AdminMonitor:
         print("\n🏥 SYSTEM HEALTH:")
         print(f"  Overall Health:     {status.system_health:.1f}%")
         
-        print("=" * 80)
+        print(SEPARATOR)
+    
+    def write_plain_status(self, status):
+        """Write system status as key=value lines, for non-terminal output"""
+        available = status.global_capacity_bytes - status.global_allocated_bytes
+        lines = [
+            f"total_capacity_bytes={status.global_capacity_bytes}",
+            f"allocated_bytes={status.global_allocated_bytes}",
+            f"used_bytes={status.global_used_bytes}",
+            f"available_bytes={available}",
+            f"total_users={status.total_users}",
+            f"total_nodes={status.total_nodes}",
+            f"online_nodes={status.online_nodes}",
+            f"offline_nodes={status.total_nodes - status.online_nodes}",
+        ]
+        
+        if status.total_nodes > 0:
+            node_health_pct = (status.online_nodes / status.total_nodes) * 100
+            if node_health_pct >= 80:
+                health_status = "OK"
+            elif node_health_pct >= 50:
+                health_status = "WARN"
+            else:
+                health_status = "CRIT"
+            lines.append(f"node_health={health_status}")
+            lines.append(f"node_health_pct={node_health_pct:.0f}")
+        
+        lines.append(f"total_files={status.total_files}")
+        lines.append(f"total_chunks={status.total_chunks}")
+        lines.append(f"system_health_pct={status.system_health:.1f}")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def list_all_users(self):
-        """List all users in the system"""
+        """List all users in the system
+        
+        Users arrive in pages, and each page is printed as soon as it arrives.
+        """
         try:
-            response = self.admin_stub.ListAllUsers(
-                cloud_storage_pb2.ListUsersRequest(admin_key=self.admin_key)
-            )
+            pages = self.admin_stub.ListAllUsers(self._list_users_request)
+            response = next(pages, None)
             
-            if not response.success:
+            if response is None or not response.success:
                 print("✗ Failed to retrieve users")
                 return
             
-            print("\n" + "=" * 80)
+            print("\n" + SEPARATOR)
             print("USER LIST")
-            print("=" * 80)
+            print(SEPARATOR)
             
             if not response.users:
                 print("\nNo users registered yet.")
-                print("=" * 80)
+                print(SEPARATOR)
                 return
             
             print(f"\n{'Email':<35} {'Name':<20} {'Storage Used':<15} {'Files':<8} {'Last Login':<20}")
-            print("-" * 80)
+            print(DIVIDER)
             
-            for user in response.users:
-                storage_used = self.format_bytes(user.storage_used)
-                storage_alloc = self.format_bytes(user.storage_allocated)
-                last_login = user.last_login[:19].replace('T', ' ') if user.last_login else 'Never'
+            # Render each page's rows first, then write them in one call
+            format_bytes = self.format_bytes
+            format_timestamp = self.format_timestamp
+            total_users = 0
+            for page in itertools.chain((response,), pages):
+                if not page.users:
+                    continue
+                
+                lines = [None] * len(page.users)
+                for i, user in enumerate(page.users):
+                    storage_used = format_bytes(user.storage_used)
+                    storage_alloc = format_bytes(user.storage_allocated)
+                    last_login = format_timestamp(user.last_login)
+                    
+                    lines[i] = f"{user.email:<35} {user.name:<20} {storage_used:>8}/{storage_alloc:<15} {user.file_count:<8} {last_login:<20}"
                 
-                print(f"{user.email:<35} {user.name:<20} {storage_used:>8}/{storage_alloc:<15} {user.file_count:<8} {last_login:<20}")
+                sys.stdout.write("\n".join(lines) + "\n")
+                total_users += len(lines)
             
-            print("=" * 80)
-            print(f"\nTotal Users: {len(response.users)}")
-            print("=" * 80)
+            print(SEPARATOR)
+            print(f"\nTotal Users: {total_users}")
+            print(SEPARATOR)
         
         except grpc.RpcError as e:
             print(f"✗ Failed to list users: {e.details()}")
     
     def list_all_nodes(self):
-        """List all storage nodes"""
+        """List all storage nodes, printing each page as it arrives"""
         try:
-            response = self.admin_stub.ListAllNodes(
-                cloud_storage_pb2.ListNodesRequest(admin_key=self.admin_key)
-            )
+            pages = self.admin_stub.ListAllNodes(self._list_nodes_request)
+            response = next(pages, None)
             
-            if not response.success:
+            if response is None or not response.success:
                 print("✗ Failed to retrieve nodes")
                 return
             
-            print("\n" + "=" * 80)
+            print("\n" + SEPARATOR)
             print("STORAGE NODES")
-            print("=" * 80)
+            print(SEPARATOR)
             
             if not response.nodes:
                 print("\nNo storage nodes registered yet.")
-                print("=" * 80)
+                print(SEPARATOR)
                 return
             
             print(f"\n{'Node ID':<15} {'Address':<25} {'Capacity':<12} {'Used':<12} {'Status':<10} {'Health':<8}")
-            print("-" * 80)
+            print(DIVIDER)
             
-            for node in response.nodes:
-                address = f"{node.host}:{node.port}"
-                capacity = self.format_bytes(node.storage_capacity)
-                used = self.format_bytes(node.storage_used)
-                
-                # Status indicator
-                if node.status == 'online':
-                    status_icon = "🟢 Online"
-                else:
-                    status_icon = "🔴 Offline"
+            # Render each page's rows first, then write them in one call
+            format_bytes = self.format_bytes
+            total_nodes = 0
+            online_count = 0
+            for page in itertools.chain((response,), pages):
+                if not page.nodes:
+                    continue
                 
-                health = f"{node.health_score:.0f}%"
-                
-                print(f"{node.node_id:<15} {address:<25} {capacity:<12} {used:<12} {status_icon:<10} {health:<8}")
+                lines = []
+                for node in page.nodes:
+                    address = f"{node.host}:{node.port}"
+                    capacity = format_bytes(node.storage_capacity)
+                    used = format_bytes(node.storage_used)
+                    
+                    # Status indicator
+                    if node.status == 'online':
+                        status_icon = "🟢 Online"
+                        online_count += 1
+                    else:
+                        status_icon = "🔴 Offline"
+                    
+                    health = f"{node.health_score:.0f}%"
+                    
+                    lines.append(f"{node.node_id:<15} {address:<25} {capacity:<12} {used:<12} {status_icon:<10} {health:<8}")
+                    
+                    # Last heartbeat
+                    if node.last_heartbeat:
+                        heartbeat = self.format_timestamp(node.last_heartbeat)
+                        lines.append(f"  └─ Last seen: {heartbeat}")
                 
-                # Last heartbeat
-                if node.last_heartbeat:
-                    heartbeat = node.last_heartbeat[:19].replace('T', ' ')
-                    print(f"  └─ Last seen: {heartbeat}")
+                sys.stdout.write("\n".join(lines) + "\n")
+                total_nodes += len(page.nodes)
             
-            print("=" * 80)
-            print(f"\nTotal Nodes: {len(response.nodes)}")
-            
-            online_count = sum(1 for n in response.nodes if n.status == 'online')
-            print(f"Online: {online_count} | Offline: {len(response.nodes) - online_count}")
-            print("=" * 80)
+            print(SEPARATOR)
+            print(f"\nTotal Nodes: {total_nodes}")
+            print(f"Online: {online_count} | Offline: {total_nodes - online_count}")
+            print(SEPARATOR)
         
         except grpc.RpcError as e:
             print(f"✗ Failed to list nodes: {e.details()}")
@@ -211,7 +328,8 @@ class AdminMonitor:
             response = self.admin_stub.GetUserDetails(
                 cloud_storage_pb2.UserDetailsRequest(
                     admin_key=self.admin_key,
-                    user_id=user_id
+                    user_id=user_id,
+                    max_files=5  # only the most recent are shown
                 )
             )
             
@@ -221,14 +339,14 @@ class AdminMonitor:
             
             user = response.user
             
-            print("\n" + "=" * 80)
+            print("\n" + SEPARATOR)
             print(f"USER DETAILS: {user.name}")
-            print("=" * 80)
+            print(SEPARATOR)
             
             print(f"\n📧 Email:           {user.email}")
             print(f"🆔 User ID:         {user.user_id}")
-            print(f"📅 Created:         {user.created_at[:19].replace('T', ' ')}")
-            print(f"🔐 Last Login:      {user.last_login[:19].replace('T', ' ') if user.last_login else 'Never'}")
+            print(f"📅 Created:         {self.format_timestamp(user.created_at)}")
+            print(f"🔐 Last Login:      {self.format_timestamp(user.last_login)}")
             
             print(f"\n💾 Storage:")
             storage_used = self.format_bytes(user.storage_used)
@@ -245,85 +363,121 @@ class AdminMonitor:
             bar = '█' * filled + '░' * (bar_length - filled)
             print(f"  [{bar}] {usage_pct:.1f}%")
             
-            print(f"\n📁 Files:           {len(response.files)}")
+            # The server sends only the newest files; file_count is the total
+            print(f"\n📁 Files:           {user.file_count}")
             
             if response.files:
                 print("\n  Recent Files:")
                 print(f"  {'Filename':<30} {'Size':<12} {'Type':<20}")
                 print("  " + "-" * 70)
                 
-                for file in response.files[:5]:  # Show first 5 files
+                for file in response.files:
                     size = self.format_bytes(file.file_size)
                     print(f"  {file.filename:<30} {size:<12} {file.mime_type:<20}")
                 
-                if len(response.files) > 5:
-                    print(f"  ... and {len(response.files) - 5} more files")
+                if user.file_count > len(response.files):
+                    print(f"  ... and {user.file_count - len(response.files)} more files")
             
-            print("=" * 80)
+            print(SEPARATOR)
         
         except grpc.RpcError as e:
             print(f"✗ Failed to get user details: {e.details()}")
     
-    def start_event_monitoring(self):
-        """Start monitoring system events in real-time"""
-        self.monitoring = True
-        
-        def monitor():
-            try:
-                print("\n" + "=" * 80)
-                print("REAL-TIME EVENT MONITOR")
-                print("=" * 80)
-                print("Listening for system events... (Press Ctrl+C to stop)\n")
-                
-                request = cloud_storage_pb2.StreamEventsRequest(admin_key=self.admin_key)
-                
-                for event in self.admin_stub.StreamSystemEvents(request):
-                    if not self.monitoring:
-                        break
-                    
-                    # Color codes for different event types
-                    event_colors = {
-                        'USER_ENROLLED': '🟢',
-                        'USER_LOGIN': '🔵',
-                        'FILE_UPLOADED': '📤',
-                        'FILE_DOWNLOADED': '📥',
-                        'FILE_DELETED': '🗑️',
-                        'NODE_REGISTERED': '💾',
-                        'OTP_SENT': '📧',
-                        'OTP_VERIFIED': '✅'
-                    }
-                    
-                    icon = event_colors.get(event.event_type, '⚪')
-                    
-                    print(f"{icon} [{event.timestamp[:19]}] {event.event_type}")
-                    print(f"   {event.message}")
+    def watch_events(self, until_enter=True):
+        """Show real-time system events in the foreground
+        
+        A single event loop waits on both the event stream and stdin, so
+        Enter returns to the menu at once and no event prints over its
+        prompt. With until_enter=False, events are shown until Ctrl+C.
+        """
+        print("\n" + SEPARATOR)
+        print("REAL-TIME EVENT MONITOR")
+        print(SEPARATOR)
+        if until_enter:
+            print("Listening for system events... (Press Enter to return to menu)\n")
+        else:
+            print("Listening for system events... (Press Ctrl+C to stop)\n")
+        
+        try:
+            asyncio.run(self._watch_events(until_enter))
+            print("\n✓ Monitoring stopped")
+        except grpc.RpcError as e:
+            if e.code() == grpc.StatusCode.CANCELLED:
+                print("\n✓ Monitoring stopped")
+            elif e.code() == grpc.StatusCode.PERMISSION_DENIED:
+                print("\n✗ Permission denied. Check admin key.")
+            else:
+                print(f"\n✗ Monitoring error: {e.details()}")
+    
+    async def _watch_events(self, until_enter):
+        """Stream events until Enter is pressed or the stream ends"""
+        stream = asyncio.ensure_future(self._stream_events())
+        if not until_enter:
+            await stream
+            return
+        
+        entered = self._wait_for_enter()
+        done, _ = await asyncio.wait({stream, entered}, return_when=asyncio.FIRST_COMPLETED)
+        stream.cancel()
+        entered.cancel()
+        
+        # Surface a stream error such as PERMISSION_DENIED
+        if stream in done:
+            stream.result()
+    
+    async def _stream_events(self):
+        """Print StreamSystemEvents batches as they arrive"""
+        async with grpc.aio.insecure_channel(self.server_address, options=CHANNEL_OPTIONS) as channel:
+            stub = cloud_storage_pb2_grpc.AdminServiceStub(channel)
+            
+            # Bound once, as the loop runs for every event
+            icon_for = (self.EVENT_ICONS if self._tty else self.PLAIN_EVENT_ICONS).get
+            default_icon = '⚪' if self._tty else '*'
+            write = sys.stdout.write
+            flush = sys.stdout.flush
+            
+            # The server coalesces events into batches; each batch is
+            # written to stdout in one call and flushed once
+            async for batch in stub.StreamSystemEvents(self._stream_events_request):
+                parts = []
+                append = parts.append
+                for event in batch.events:
+                    # Each protobuf field read goes through a descriptor, so read each once
+                    event_type, timestamp, message, user_id, details = (
+                        event.event_type, event.timestamp, event.message, event.user_id, event.details
+                    )
                     
-                    if event.user_id:
-                        print(f"   User: {event.user_id}")
+                    append(f"{icon_for(event_type, default_icon)} [{timestamp[:19]}] {event_type}\n")
+                    append(f"   {message}\n")
                     
-                    if event.details:
-                        print(f"   Details: {event.details}")
+                    if user_id:
+                        append(f"   User: {user_id}\n")
                     
-                    print()
+                    if details:
+                        append(f"   Details: {details}\n")
                     
-            except grpc.RpcError as e:
-                if e.code() == grpc.StatusCode.CANCELLED:
-                    print("\n✓ Monitoring stopped")
-                elif e.code() == grpc.StatusCode.PERMISSION_DENIED:
-                    print("\n✗ Permission denied. Check admin key.")
-                else:
-                    print(f"\n✗ Monitoring error: {e.details()}")
-            except Exception as e:
-                print(f"\n✗ Error: {e}")
-        
-        # Start monitoring in background thread
-        monitor_thread = threading.Thread(target=monitor, daemon=True)
-        monitor_thread.start()
-        return monitor_thread
+                    append("\n")
+                
+                write("".join(parts))
+                flush()
     
-    def stop_event_monitoring(self):
-        """Stop event monitoring"""
-        self.monitoring = False
+    def _wait_for_enter(self):
+        """Future that completes when a line is entered on stdin"""
+        loop = asyncio.get_running_loop()
+        try:
+            entered = loop.create_future()
+            
+            def on_stdin():
+                line = sys.stdin.readline()
+                if not entered.done():
+                    entered.set_result(line)
+            
+            loop.add_reader(sys.stdin, on_stdin)
+            entered.add_done_callback(lambda _: loop.remove_reader(sys.stdin))
+            return entered
+        except NotImplementedError:
+            # Windows event loops cannot watch stdin
+            return loop.run_in_executor(None, sys.stdin.readline)
     
     def close(self):
         """Close connection"""
@@ -332,9 +486,9 @@ class AdminMonitor:
 
 def admin_menu():
     """Interactive admin menu"""
-    print("=" * 80)
+    print(SEPARATOR)
     print("Cloud Storage Platform - Admin Monitor")
-    print("=" * 80)
+    print(SEPARATOR)
     
     admin_key = input("Enter admin key (or press Enter for default): ").strip()
     if not admin_key:
@@ -342,23 +496,21 @@ def admin_menu():
         print(f"Using default admin key from environment")
     
     monitor = AdminMonitor(admin_key=admin_key)
-    monitor_thread = None
     
     while True:
-        print("\n" + "=" * 80)
+        print("\n" + SEPARATOR)
         print("ADMIN MENU")
-        print("=" * 80)
+        print(SEPARATOR)
         print("1. View System Status")
         print("2. List All Users")
         print("3. List Storage Nodes")
         print("4. Get User Details (by ID)")
-        print("5. Start Real-Time Event Monitoring")
-        print("6. Stop Event Monitoring")
-        print("7. Refresh Display")
-        print("8. Exit")
-        print("=" * 80)
+        print("5. Watch Real-Time Events")
+        print("6. Refresh Display")
+        print("7. Exit")
+        print(SEPARATOR)
         
-        choice = input("Select option (1-8): ").strip()
+        choice = input("Select option (1-7): ").strip()
         
         if choice == '1':
             monitor.display_system_status()
@@ -377,27 +529,18 @@ def admin_menu():
                 print("✗ User ID required")
         
         elif choice == '5':
-            if monitor_thread and monitor_thread.is_alive():
-                print("✗ Monitoring already active!")
-            else:
-                monitor_thread = monitor.start_event_monitoring()
-                input("\nPress Enter to return to menu (monitoring continues in background)...\n")
+            monitor.watch_events()
         
         elif choice == '6':
-            monitor.stop_event_monitoring()
-            print("✓ Event monitoring stopped")
-        
-        elif choice == '7':
             monitor.display_system_status()
         
-        elif choice == '8':
+        elif choice == '7':
             print("\n✓ Shutting down admin monitor...")
-            monitor.stop_event_monitoring()
             monitor.close()
             break
         
         else:
-            print("✗ Invalid choice! Please select 1-8.")
+            print("✗ Invalid choice! Please select 1-7.")
 
 
 def main():
@@ -436,16 +579,13 @@ def main():
         return 0
     
     if args.monitor:
-        # Start monitoring and wait
-        monitor.start_event_monitoring()
+        # Show events until Ctrl+C
         try:
-            while True:
-                import time
-                time.sleep(1)
+            monitor.watch_events(until_enter=False)
         except KeyboardInterrupt:
             print("\n✓ Monitoring stopped")
-            monitor.close()
-            return 0
+        monitor.close()
+        return 0
     
     # Interactive menu
     try:
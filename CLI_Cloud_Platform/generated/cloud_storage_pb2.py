@@ -24,11 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-<<<<<<< HEAD
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x13\x63loud_storage.proto\x12\x0c\x63loudstorage\"\x1f\n\x0eSendOTPRequest\x12\r\n\x05\x65mail\x18\x01 \x01(\t\"3\n\x0fSendOTPResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\".\n\x10VerifyOTPRequest\x12\r\n\x05\x65mail\x18\x01 \x01(\t\x12\x0b\n\x03otp\x18\x02 \x01(\t\"5\n\x11VerifyOTPResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\"\x1d\n\x0cLoginRequest\x12\r\n\x05\x65mail\x18\x01 \x01(\t\"Y\n\rLoginResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x15\n\rsession_token\x18\x03 \x01(\t\x12\x0f\n\x07user_id\x18\x04 \x01(\t\"1\n\rEnrollRequest\x12\r\n\x05\x65mail\x18\x01 \x01(\t\x12\x11\n\tfull_name\x18\x02 \x01(\t\"Z\n\x0e\x45nrollResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x15\n\rsession_token\x18\x03 \x01(\t\x12\x0f\n\x07user_id\x18\x04 \x01(\t\"&\n\rLogoutRequest\x12\x15\n\rsession_token\x18\x01 \x01(\t\"2\n\x0eLogoutResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\"a\n\x11UploadFileRequest\x12.\n\x08metadata\x18\x01 \x01(\x0b\x32\x1a.cloudstorage.FileMetadataH\x00\x12\x14\n\nchunk_data\x18\x02 \x01(\x0cH\x00\x42\x06\n\x04\x64\x61ta\"w\n\x0c\x46ileMetadata\x12\x15\n\rsession_token\x18\x01 \x01(\t\x12\x10\n\x08\x66ilename\x18\x02 \x01(\t\x12\x11\n\tfile_size\x18\x03 \x01(\x03\x12\x11\n\tmime_type\x18\x04 \x01(\t\x12\x18\n\x10parent_folder_id\x18\x05 \x01(\t\"^\n\x12UploadFileResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x0f\n\x07\x66ile_id\x18\x03 \x01(\t\x12\x15\n\rchunks_stored\x18\x04 \x01(\x05\"=\n\x13\x44ownloadFileRequest\x12\x15\n\rsession_token\x18\x01 \x01(\t\x12\x0f\n\x07\x66ile_id\x18\x02 \x01(\t\"a\n\x14\x44ownloadFileResponse\x12+\n\tfile_info\x18\x01 \x01(\x0b\x32\x16.cloudstorage.FileInfoH\x00\x12\x14\n\nchunk_data\x18\x02 \x01(\x0cH\x00\x42\x06\n\x04\x64\x61ta\"X\n\x08\x46ileInfo\x12\x10\n\x08\x66ilename\x18\x01 \x01(\t\x12\x11\n\tfile_size\x18\x02 \x01(\x03\x12\x11\n\tmime_type\x18\x03 \x01(\t\x12\x14\n\x0ctotal_chunks\x18\x04 \x01(\x05\"U\n\x10ListFilesRequest\x12\x15\n\rsession_token\x18\x01 \x01(\t\x12\x11\n\tfolder_id\x18\x02 \x01(\t\x12\x17\n\x0finclude_deleted\x18\x03 \x01(\x08\"x\n\x11ListFilesResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12&\n\x05\x66iles\x18\x02 \x03(\x0b\x32\x17.cloudstorage.FileEntry\x12*\n\x07\x66olders\x18\x03 \x03(\x0b\x32\x19.cloudstorage.FolderEntry\"\x90\x01\n\tFileEntry\x12\x0f\n\x07\x66ile_id\x18\x01 \x01(\t\x12\x10\n\x08\x66ilename\x18\x02 \x01(\t\x12\x11\n\tfile_size\x18\x03 \x01(\x03\x12\x11\n\tmime_type\x18\x04 \x01(\t\x12\x12\n\ncreated_at\x18\x05 \x01(\t\x12\x13\n\x0bmodified_at\x18\x06 \x01(\t\x12\x11\n\tis_shared\x18\x07 \x01(\x08\"]\n\x0b\x46olderEntry\x12\x11\n\tfolder_id\x18\x01 \x01(\t\x12\x13\n\x0b\x66older_name\x18\x02 \x01(\t\x12\x12\n\ncreated_at\x18\x03 \x01(\t\x12\x12\n\nfile_count\x18\x04 \x01(\x05\"N\n\x11\x44\x65leteFileRequest\x12\x15\n\rsession_token\x18\x01 \x01(\t\x12\x0f\n\x07\x66ile_id\x18\x02 \x01(\t\x12\x11\n\tpermanent\x18\x03 \x01(\x08\"6\n\x12\x44\x65leteFileResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\"=\n\x13\x46ileMetadataRequest\x12\x15\n\rsession_token\x18\x01 \x01(\t\x12\x0f\n\x07\x66ile_id\x18\x02 \x01(\t\"u\n\x14\x46ileMetadataResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12%\n\x04\x66ile\x18\x02 \x01(\x0b\x32\x17.cloudstorage.FileEntry\x12\x13\n\x0b\x63hunk_count\x18\x03 \x01(\x05\x12\x10\n\x08\x63hecksum\x18\x04 \x01(\t\"[\n\x13\x43reateFolderRequest\x12\x15\n\rsession_token\x18\x01 \x01(\t\x12\x13\n\x0b\x66older_name\x18\x02 \x01(\t\x12\x18\n\x10parent_folder_id\x18\x03 \x01(\t\"K\n\x14\x43reateFolderResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x11\n\tfolder_id\x18\x03 \x01(\t\"h\n\x10ShareFileRequest\x12\x15\n\rsession_token\x18\x01 \x01(\t\x12\x0f\n\x07\x66ile_id\x18\x02 \x01(\t\x12\x18\n\x10share_with_email\x18\x03 \x01(\t\x12\x12\n\npermission\x18\x04 \x01(\t\"J\n\x11ShareFileResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x13\n\x0bshare_token\x18\x03 \x01(\t\".\n\x15GetSharedFilesRequest\x12\x15\n\rsession_token\x18\x01 \x01(\t\"^\n\x16GetSharedFilesResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x33\n\x0cshared_files\x18\x02 \x03(\x0b\x32\x1d.cloudstorage.SharedFileEntry\"t\n\x0fSharedFileEntry\x12\x0f\n\x07\x66ile_id\x18\x01 \x01(\t\x12\x10\n\x08\x66ilename\x18\x02 \x01(\t\x12\x17\n\x0fshared_by_email\x18\x03 \x01(\t\x12\x12\n\npermission\x18\x04 \x01(\t\x12\x11\n\tshared_at\x18\x05 \x01(\t\"+\n\x12StorageInfoRequest\x12\x15\n\rsession_token\x18\x01 \x01(\t\"\x86\x01\n\x13StorageInfoResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x17\n\x0f\x61llocated_bytes\x18\x02 \x01(\x03\x12\x12\n\nused_bytes\x18\x03 \x01(\x03\x12\x17\n\x0f\x61vailable_bytes\x18\x04 \x01(\x03\x12\x18\n\x10usage_percentage\x18\x05 \x01(\x01\",\n\x13StorageUsageRequest\x12\x15\n\rsession_token\x18\x01 \x01(\t\"\xd3\x01\n\x14StorageUsageResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12J\n\rusage_by_type\x18\x02 \x03(\x0b\x32\x33.cloudstorage.StorageUsageResponse.UsageByTypeEntry\x12\x13\n\x0btotal_files\x18\x03 \x01(\x05\x12\x15\n\rtotal_folders\x18\x04 \x01(\x05\x1a\x32\n\x10UsageByTypeEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x03:\x02\x38\x01\"o\n\x13RegisterNodeRequest\x12\x0f\n\x07node_id\x18\x01 \x01(\t\x12\x0c\n\x04host\x18\x02 \x01(\t\x12\x0c\n\x04port\x18\x03 \x01(\x05\x12\x18\n\x10storage_capacity\x18\x04 \x01(\x03\x12\x11\n\tcpu_cores\x18\x05 \x01(\x05\"8\n\x14RegisterNodeResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\"N\n\x10HeartbeatRequest\x12\x0f\n\x07node_id\x18\x01 \x01(\t\x12\x14\n\x0cstorage_used\x18\x02 \x01(\x03\x12\x13\n\x0b\x63hunk_count\x18\x03 \x01(\x05\"5\n\x11HeartbeatResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\"K\n\x11StoreChunkRequest\x12\x10\n\x08\x63hunk_id\x18\x01 \x01(\t\x12\x12\n\nchunk_data\x18\x02 \x01(\x0c\x12\x10\n\x08\x63hecksum\x18\x03 \x01(\t\"6\n\x12StoreChunkResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\"(\n\x14RetrieveChunkRequest\x12\x10\n\x08\x63hunk_id\x18\x01 \x01(\t\"M\n\x15RetrieveChunkResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x12\n\nchunk_data\x18\x02 \x01(\x0c\x12\x0f\n\x07message\x18\x03 \x01(\t\"&\n\x12\x44\x65leteChunkRequest\x12\x10\n\x08\x63hunk_id\x18\x01 \x01(\t\"7\n\x13\x44\x65leteChunkResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\"$\n\x11ListChunksRequest\x12\x0f\n\x07node_id\x18\x01 \x01(\t\"=\n\x12ListChunksResponse\x12\x11\n\tchunk_ids\x18\x01 \x03(\t\x12\x14\n\x0ctotal_chunks\x18\x02 \x01(\x05\"(\n\x13SystemStatusRequest\x12\x11\n\tadmin_key\x18\x01 \x01(\t\"\x83\x02\n\x14SystemStatusResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x1d\n\x15global_capacity_bytes\x18\x02 \x01(\x03\x12\x1e\n\x16global_allocated_bytes\x18\x03 \x01(\x03\x12\x19\n\x11global_used_bytes\x18\x04 \x01(\x03\x12\x13\n\x0btotal_users\x18\x05 \x01(\x05\x12\x13\n\x0btotal_nodes\x18\x06 \x01(\x05\x12\x14\n\x0conline_nodes\x18\x07 \x01(\x05\x12\x13\n\x0btotal_files\x18\x08 \x01(\x03\x12\x14\n\x0ctotal_chunks\x18\t \x01(\x03\x12\x15\n\rsystem_health\x18\n \x01(\x01\"B\n\x14UpdateStorageRequest\x12\x11\n\tadmin_key\x18\x01 \x01(\t\x12\x17\n\x0fnew_capacity_gb\x18\x02 \x01(\x03\"q\n\x15UpdateStorageResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x1a\n\x12old_capacity_bytes\x18\x03 \x01(\x03\x12\x1a\n\x12new_capacity_bytes\x18\x04 \x01(\x03\"(\n\x13StreamEventsRequest\x12\x11\n\tadmin_key\x18\x01 \x01(\t\"g\n\x0bSystemEvent\x12\x12\n\nevent_type\x18\x01 \x01(\t\x12\x11\n\ttimestamp\x18\x02 \x01(\t\x12\x0f\n\x07message\x18\x03 \x01(\t\x12\x0f\n\x07user_id\x18\x04 \x01(\t\x12\x0f\n\x07\x64\x65tails\x18\x05 \x01(\t\"%\n\x10ListUsersRequest\x12\x11\n\tadmin_key\x18\x01 \x01(\t\"K\n\x11ListUsersResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12%\n\x05users\x18\x02 \x03(\x0b\x32\x16.cloudstorage.UserInfo\"\xa5\x01\n\x08UserInfo\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\r\n\x05\x65mail\x18\x02 \x01(\t\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x19\n\x11storage_allocated\x18\x04 \x01(\x03\x12\x14\n\x0cstorage_used\x18\x05 \x01(\x03\x12\x12\n\ncreated_at\x18\x06 \x01(\t\x12\x12\n\nlast_login\x18\x07 \x01(\t\x12\x12\n\nfile_count\x18\x08 \x01(\x05\"%\n\x10ListNodesRequest\x12\x11\n\tadmin_key\x18\x01 \x01(\t\"K\n\x11ListNodesResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12%\n\x05nodes\x18\x02 \x03(\x0b\x32\x16.cloudstorage.NodeInfo\"\xba\x01\n\x08NodeInfo\x12\x0f\n\x07node_id\x18\x01 \x01(\t\x12\x0c\n\x04host\x18\x02 \x01(\t\x12\x0c\n\x04port\x18\x03 \x01(\x05\x12\x18\n\x10storage_capacity\x18\x04 \x01(\x03\x12\x14\n\x0cstorage_used\x18\x05 \x01(\x03\x12\x0e\n\x06status\x18\x06 \x01(\t\x12\x16\n\x0elast_heartbeat\x18\x07 \x01(\t\x12\x13\n\x0b\x63hunk_count\x18\x08 \x01(\x05\x12\x14\n\x0chealth_score\x18\t \x01(\x01\"8\n\x12UserDetailsRequest\x12\x11\n\tadmin_key\x18\x01 \x01(\t\x12\x0f\n\x07user_id\x18\x02 \x01(\t\"t\n\x13UserDetailsResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12$\n\x04user\x18\x02 \x01(\x0b\x32\x16.cloudstorage.UserInfo\x12&\n\x05\x66iles\x18\x03 \x03(\x0b\x32\x17.cloudstorage.FileEntry2\xef\x02\n\x0b\x41uthService\x12\x46\n\x07SendOTP\x12\x1c.cloudstorage.SendOTPRequest\x1a\x1d.cloudstorage.SendOTPResponse\x12L\n\tVerifyOTP\x12\x1e.cloudstorage.VerifyOTPRequest\x1a\x1f.cloudstorage.VerifyOTPResponse\x12@\n\x05Login\x12\x1a.cloudstorage.LoginRequest\x1a\x1b.cloudstorage.LoginResponse\x12\x43\n\x06\x45nroll\x12\x1b.cloudstorage.EnrollRequest\x1a\x1c.cloudstorage.EnrollResponse\x12\x43\n\x06Logout\x12\x1b.cloudstorage.LogoutRequest\x1a\x1c.cloudstorage.LogoutResponse2\xb4\x05\n\x0b\x46ileService\x12Q\n\nUploadFile\x12\x1f.cloudstorage.UploadFileRequest\x1a .cloudstorage.UploadFileResponse(\x01\x12W\n\x0c\x44ownloadFile\x12!.cloudstorage.DownloadFileRequest\x1a\".cloudstorage.DownloadFileResponse0\x01\x12L\n\tListFiles\x12\x1e.cloudstorage.ListFilesRequest\x1a\x1f.cloudstorage.ListFilesResponse\x12O\n\nDeleteFile\x12\x1f.cloudstorage.DeleteFileRequest\x1a .cloudstorage.DeleteFileResponse\x12X\n\x0fGetFileMetadata\x12!.cloudstorage.FileMetadataRequest\x1a\".cloudstorage.FileMetadataResponse\x12U\n\x0c\x43reateFolder\x12!.cloudstorage.CreateFolderRequest\x1a\".cloudstorage.CreateFolderResponse\x12L\n\tShareFile\x12\x1e.cloudstorage.ShareFileRequest\x1a\x1f.cloudstorage.ShareFileResponse\x12[\n\x0eGetSharedFiles\x12#.cloudstorage.GetSharedFilesRequest\x1a$.cloudstorage.GetSharedFilesResponse2\xc1\x01\n\x0eStorageService\x12U\n\x0eGetStorageInfo\x12 .cloudstorage.StorageInfoRequest\x1a!.cloudstorage.StorageInfoResponse\x12X\n\x0fGetStorageUsage\x12!.cloudstorage.StorageUsageRequest\x1a\".cloudstorage.StorageUsageResponse2\x82\x04\n\x0bNodeService\x12U\n\x0cRegisterNode\x12!.cloudstorage.RegisterNodeRequest\x1a\".cloudstorage.RegisterNodeResponse\x12L\n\tHeartbeat\x12\x1e.cloudstorage.HeartbeatRequest\x1a\x1f.cloudstorage.HeartbeatResponse\x12O\n\nStoreChunk\x12\x1f.cloudstorage.StoreChunkRequest\x1a .cloudstorage.StoreChunkResponse\x12X\n\rRetrieveChunk\x12\".cloudstorage.RetrieveChunkRequest\x1a#.cloudstorage.RetrieveChunkResponse\x12R\n\x0b\x44\x65leteChunk\x12 .cloudstorage.DeleteChunkRequest\x1a!.cloudstorage.DeleteChunkResponse\x12O\n\nListChunks\x12\x1f.cloudstorage.ListChunksRequest\x1a .cloudstorage.ListChunksResponse2\x97\x04\n\x0c\x41\x64minService\x12X\n\x0fGetSystemStatus\x12!.cloudstorage.SystemStatusRequest\x1a\".cloudstorage.SystemStatusResponse\x12^\n\x13UpdateGlobalStorage\x12\".cloudstorage.UpdateStorageRequest\x1a#.cloudstorage.UpdateStorageResponse\x12T\n\x12StreamSystemEvents\x12!.cloudstorage.StreamEventsRequest\x1a\x19.cloudstorage.SystemEvent0\x01\x12O\n\x0cListAllUsers\x12\x1e.cloudstorage.ListUsersRequest\x1a\x1f.cloudstorage.ListUsersResponse\x12O\n\x0cListAllNodes\x12\x1e.cloudstorage.ListNodesRequest\x1a\x1f.cloudstorage.ListNodesResponse\x12U\n\x0eGetUserDetails\x12 .cloudstorage.UserDetailsRequest\x1a!.cloudstorage.UserDetailsResponseb\x06proto3')
-=======
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x13\x63loud_storage.proto\x12\x0c\x63loudstorage\"\x1f\n\x0eSendOTPRequest\x12\r\n\x05\x65mail\x18\x01 \x01(\t\"3\n\x0fSendOTPResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\".\n\x10VerifyOTPRequest\x12\r\n\x05\x65mail\x18\x01 \x01(\t\x12\x0b\n\x03otp\x18\x02 \x01(\t\"5\n\x11VerifyOTPResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\"\x1d\n\x0cLoginRequest\x12\r\n\x05\x65mail\x18\x01 \x01(\t\"Y\n\rLoginResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x15\n\rsession_token\x18\x03 \x01(\t\x12\x0f\n\x07user_id\x18\x04 \x01(\t\"1\n\rEnrollRequest\x12\r\n\x05\x65mail\x18\x01 \x01(\t\x12\x11\n\tfull_name\x18\x02 \x01(\t\"Z\n\x0e\x45nrollResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x15\n\rsession_token\x18\x03 \x01(\t\x12\x0f\n\x07user_id\x18\x04 \x01(\t\"&\n\rLogoutRequest\x12\x15\n\rsession_token\x18\x01 \x01(\t\"2\n\x0eLogoutResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\"a\n\x11UploadFileRequest\x12.\n\x08metadata\x18\x01 \x01(\x0b\x32\x1a.cloudstorage.FileMetadataH\x00\x12\x14\n\nchunk_data\x18\x02 \x01(\x0cH\x00\x42\x06\n\x04\x64\x61ta\"w\n\x0c\x46ileMetadata\x12\x15\n\rsession_token\x18\x01 \x01(\t\x12\x10\n\x08\x66ilename\x18\x02 \x01(\t\x12\x11\n\tfile_size\x18\x03 \x01(\x03\x12\x11\n\tmime_type\x18\x04 \x01(\t\x12\x18\n\x10parent_folder_id\x18\x05 \x01(\t\"^\n\x12UploadFileResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x0f\n\x07\x66ile_id\x18\x03 \x01(\t\x12\x15\n\rchunks_stored\x18\x04 \x01(\x05\"=\n\x13\x44ownloadFileRequest\x12\x15\n\rsession_token\x18\x01 \x01(\t\x12\x0f\n\x07\x66ile_id\x18\x02 \x01(\t\"a\n\x14\x44ownloadFileResponse\x12+\n\tfile_info\x18\x01 \x01(\x0b\x32\x16.cloudstorage.FileInfoH\x00\x12\x14\n\nchunk_data\x18\x02 \x01(\x0cH\x00\x42\x06\n\x04\x64\x61ta\"X\n\x08\x46ileInfo\x12\x10\n\x08\x66ilename\x18\x01 \x01(\t\x12\x11\n\tfile_size\x18\x02 \x01(\x03\x12\x11\n\tmime_type\x18\x03 \x01(\t\x12\x14\n\x0ctotal_chunks\x18\x04 \x01(\x05\"U\n\x10ListFilesRequest\x12\x15\n\rsession_token\x18\x01 \x01(\t\x12\x11\n\tfolder_id\x18\x02 \x01(\t\x12\x17\n\x0finclude_deleted\x18\x03 \x01(\x08\"x\n\x11ListFilesResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12&\n\x05\x66iles\x18\x02 \x03(\x0b\x32\x17.cloudstorage.FileEntry\x12*\n\x07\x66olders\x18\x03 \x03(\x0b\x32\x19.cloudstorage.FolderEntry\"\x90\x01\n\tFileEntry\x12\x0f\n\x07\x66ile_id\x18\x01 \x01(\t\x12\x10\n\x08\x66ilename\x18\x02 \x01(\t\x12\x11\n\tfile_size\x18\x03 \x01(\x03\x12\x11\n\tmime_type\x18\x04 \x01(\t\x12\x12\n\ncreated_at\x18\x05 \x01(\t\x12\x13\n\x0bmodified_at\x18\x06 \x01(\t\x12\x11\n\tis_shared\x18\x07 \x01(\x08\"]\n\x0b\x46olderEntry\x12\x11\n\tfolder_id\x18\x01 \x01(\t\x12\x13\n\x0b\x66older_name\x18\x02 \x01(\t\x12\x12\n\ncreated_at\x18\x03 \x01(\t\x12\x12\n\nfile_count\x18\x04 \x01(\x05\"N\n\x11\x44\x65leteFileRequest\x12\x15\n\rsession_token\x18\x01 \x01(\t\x12\x0f\n\x07\x66ile_id\x18\x02 \x01(\t\x12\x11\n\tpermanent\x18\x03 \x01(\x08\"6\n\x12\x44\x65leteFileResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\"=\n\x13\x46ileMetadataRequest\x12\x15\n\rsession_token\x18\x01 \x01(\t\x12\x0f\n\x07\x66ile_id\x18\x02 \x01(\t\"u\n\x14\x46ileMetadataResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12%\n\x04\x66ile\x18\x02 \x01(\x0b\x32\x17.cloudstorage.FileEntry\x12\x13\n\x0b\x63hunk_count\x18\x03 \x01(\x05\x12\x10\n\x08\x63hecksum\x18\x04 \x01(\t\"[\n\x13\x43reateFolderRequest\x12\x15\n\rsession_token\x18\x01 \x01(\t\x12\x13\n\x0b\x66older_name\x18\x02 \x01(\t\x12\x18\n\x10parent_folder_id\x18\x03 \x01(\t\"K\n\x14\x43reateFolderResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x11\n\tfolder_id\x18\x03 \x01(\t\"h\n\x10ShareFileRequest\x12\x15\n\rsession_token\x18\x01 \x01(\t\x12\x0f\n\x07\x66ile_id\x18\x02 \x01(\t\x12\x18\n\x10share_with_email\x18\x03 \x01(\t\x12\x12\n\npermission\x18\x04 \x01(\t\"J\n\x11ShareFileResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x13\n\x0bshare_token\x18\x03 \x01(\t\".\n\x15GetSharedFilesRequest\x12\x15\n\rsession_token\x18\x01 \x01(\t\"^\n\x16GetSharedFilesResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x33\n\x0cshared_files\x18\x02 \x03(\x0b\x32\x1d.cloudstorage.SharedFileEntry\"t\n\x0fSharedFileEntry\x12\x0f\n\x07\x66ile_id\x18\x01 \x01(\t\x12\x10\n\x08\x66ilename\x18\x02 \x01(\t\x12\x17\n\x0fshared_by_email\x18\x03 \x01(\t\x12\x12\n\npermission\x18\x04 \x01(\t\x12\x11\n\tshared_at\x18\x05 \x01(\t\"+\n\x12StorageInfoRequest\x12\x15\n\rsession_token\x18\x01 \x01(\t\"\x86\x01\n\x13StorageInfoResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x17\n\x0f\x61llocated_bytes\x18\x02 \x01(\x03\x12\x12\n\nused_bytes\x18\x03 \x01(\x03\x12\x17\n\x0f\x61vailable_bytes\x18\x04 \x01(\x03\x12\x18\n\x10usage_percentage\x18\x05 \x01(\x01\",\n\x13StorageUsageRequest\x12\x15\n\rsession_token\x18\x01 \x01(\t\"\xd3\x01\n\x14StorageUsageResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12J\n\rusage_by_type\x18\x02 \x03(\x0b\x32\x33.cloudstorage.StorageUsageResponse.UsageByTypeEntry\x12\x13\n\x0btotal_files\x18\x03 \x01(\x05\x12\x15\n\rtotal_folders\x18\x04 \x01(\x05\x1a\x32\n\x10UsageByTypeEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x03:\x02\x38\x01\"\x18\n\x16GetStorageTiersRequest\"T\n\x17GetStorageTiersResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12(\n\x05tiers\x18\x02 \x03(\x0b\x32\x19.cloudstorage.StorageTier\"\x81\x01\n\x0bStorageTier\x12\x0f\n\x07tier_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x14\n\x0c\x64isplay_name\x18\x03 \x01(\t\x12\x15\n\rstorage_bytes\x18\x04 \x01(\x03\x12\x11\n\tprice_xaf\x18\x05 \x01(\x05\x12\x13\n\x0b\x64\x65scription\x18\x06 \x01(\t\"h\n\x16InitiatePaymentRequest\x12\x15\n\rsession_token\x18\x01 \x01(\t\x12\x0f\n\x07tier_id\x18\x02 \x01(\t\x12\x10\n\x08provider\x18\x03 \x01(\t\x12\x14\n\x0cphone_number\x18\x04 \x01(\t\"\x91\x01\n\x17InitiatePaymentResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x12\n\npayment_id\x18\x03 \x01(\t\x12\x17\n\x0ftransaction_ref\x18\x04 \x01(\t\x12\x13\n\x0bpayment_url\x18\x05 \x01(\t\x12\x12\n\namount_xaf\x18\x06 \x01(\x05\"F\n\x19\x43heckPaymentStatusRequest\x12\x15\n\rsession_token\x18\x01 \x01(\t\x12\x12\n\npayment_id\x18\x02 \x01(\t\"y\n\x1a\x43heckPaymentStatusResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x12\n\npayment_id\x18\x02 \x01(\t\x12\x0e\n\x06status\x18\x03 \x01(\t\x12\x0f\n\x07message\x18\x04 \x01(\t\x12\x15\n\rstorage_added\x18\x05 \x01(\x03\"@\n\x18GetPaymentHistoryRequest\x12\x15\n\rsession_token\x18\x01 \x01(\t\x12\r\n\x05limit\x18\x02 \x01(\x05\"[\n\x19GetPaymentHistoryResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12-\n\x08payments\x18\x02 \x03(\x0b\x32\x1b.cloudstorage.PaymentRecord\"\xad\x01\n\rPaymentRecord\x12\x12\n\npayment_id\x18\x01 \x01(\t\x12\x11\n\ttier_name\x18\x02 \x01(\t\x12\x12\n\namount_xaf\x18\x03 \x01(\x05\x12\x15\n\rstorage_bytes\x18\x04 \x01(\x03\x12\x10\n\x08provider\x18\x05 \x01(\t\x12\x0e\n\x06status\x18\x06 \x01(\t\x12\x12\n\ncreated_at\x18\x07 \x01(\t\x12\x14\n\x0c\x63ompleted_at\x18\x08 \x01(\t\"A\n\x14\x43\x61ncelPaymentRequest\x12\x15\n\rsession_token\x18\x01 \x01(\t\x12\x12\n\npayment_id\x18\x02 \x01(\t\"9\n\x15\x43\x61ncelPaymentResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\"H\n\x0eWebhookRequest\x12\x14\n\x0c\x65xternal_ref\x18\x01 \x01(\t\x12\x0e\n\x06status\x18\x02 \x01(\t\x12\x10\n\x08raw_data\x18\x03 \x01(\t\"3\n\x0fWebhookResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\"o\n\x13RegisterNodeRequest\x12\x0f\n\x07node_id\x18\x01 \x01(\t\x12\x0c\n\x04host\x18\x02 \x01(\t\x12\x0c\n\x04port\x18\x03 \x01(\x05\x12\x18\n\x10storage_capacity\x18\x04 \x01(\x03\x12\x11\n\tcpu_cores\x18\x05 \x01(\x05\"8\n\x14RegisterNodeResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\"N\n\x10HeartbeatRequest\x12\x0f\n\x07node_id\x18\x01 \x01(\t\x12\x14\n\x0cstorage_used\x18\x02 \x01(\x03\x12\x13\n\x0b\x63hunk_count\x18\x03 \x01(\x05\"5\n\x11HeartbeatResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\"K\n\x11StoreChunkRequest\x12\x10\n\x08\x63hunk_id\x18\x01 \x01(\t\x12\x12\n\nchunk_data\x18\x02 \x01(\x0c\x12\x10\n\x08\x63hecksum\x18\x03 \x01(\t\"6\n\x12StoreChunkResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\"(\n\x14RetrieveChunkRequest\x12\x10\n\x08\x63hunk_id\x18\x01 \x01(\t\"M\n\x15RetrieveChunkResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x12\n\nchunk_data\x18\x02 \x01(\x0c\x12\x0f\n\x07message\x18\x03 \x01(\t\"&\n\x12\x44\x65leteChunkRequest\x12\x10\n\x08\x63hunk_id\x18\x01 \x01(\t\"7\n\x13\x44\x65leteChunkResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\"$\n\x11ListChunksRequest\x12\x0f\n\x07node_id\x18\x01 \x01(\t\"=\n\x12ListChunksResponse\x12\x11\n\tchunk_ids\x18\x01 \x03(\t\x12\x14\n\x0ctotal_chunks\x18\x02 \x01(\x05\"(\n\x13SystemStatusRequest\x12\x11\n\tadmin_key\x18\x01 \x01(\t\"\x83\x02\n\x14SystemStatusResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x1d\n\x15global_capacity_bytes\x18\x02 \x01(\x03\x12\x1e\n\x16global_allocated_bytes\x18\x03 \x01(\x03\x12\x19\n\x11global_used_bytes\x18\x04 \x01(\x03\x12\x13\n\x0btotal_users\x18\x05 \x01(\x05\x12\x13\n\x0btotal_nodes\x18\x06 \x01(\x05\x12\x14\n\x0conline_nodes\x18\x07 \x01(\x05\x12\x13\n\x0btotal_files\x18\x08 \x01(\x03\x12\x14\n\x0ctotal_chunks\x18\t \x01(\x03\x12\x15\n\rsystem_health\x18\n \x01(\x01\"B\n\x14UpdateStorageRequest\x12\x11\n\tadmin_key\x18\x01 \x01(\t\x12\x17\n\x0fnew_capacity_gb\x18\x02 \x01(\x03\"q\n\x15UpdateStorageResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x1a\n\x12old_capacity_bytes\x18\x03 \x01(\x03\x12\x1a\n\x12new_capacity_bytes\x18\x04 \x01(\x03\"(\n\x13StreamEventsRequest\x12\x11\n\tadmin_key\x18\x01 \x01(\t\"g\n\x0bSystemEvent\x12\x12\n\nevent_type\x18\x01 \x01(\t\x12\x11\n\ttimestamp\x18\x02 \x01(\t\x12\x0f\n\x07message\x18\x03 \x01(\t\x12\x0f\n\x07user_id\x18\x04 \x01(\t\x12\x0f\n\x07\x64\x65tails\x18\x05 \x01(\t\"%\n\x10ListUsersRequest\x12\x11\n\tadmin_key\x18\x01 \x01(\t\"K\n\x11ListUsersResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12%\n\x05users\x18\x02 \x03(\x0b\x32\x16.cloudstorage.UserInfo\"\xa5\x01\n\x08UserInfo\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\r\n\x05\x65mail\x18\x02 \x01(\t\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x19\n\x11storage_allocated\x18\x04 \x01(\x03\x12\x14\n\x0cstorage_used\x18\x05 \x01(\x03\x12\x12\n\ncreated_at\x18\x06 \x01(\t\x12\x12\n\nlast_login\x18\x07 \x01(\t\x12\x12\n\nfile_count\x18\x08 \x01(\x05\"%\n\x10ListNodesRequest\x12\x11\n\tadmin_key\x18\x01 \x01(\t\"K\n\x11ListNodesResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12%\n\x05nodes\x18\x02 \x03(\x0b\x32\x16.cloudstorage.NodeInfo\"\xba\x01\n\x08NodeInfo\x12\x0f\n\x07node_id\x18\x01 \x01(\t\x12\x0c\n\x04host\x18\x02 \x01(\t\x12\x0c\n\x04port\x18\x03 \x01(\x05\x12\x18\n\x10storage_capacity\x18\x04 \x01(\x03\x12\x14\n\x0cstorage_used\x18\x05 \x01(\x03\x12\x0e\n\x06status\x18\x06 \x01(\t\x12\x16\n\x0elast_heartbeat\x18\x07 \x01(\t\x12\x13\n\x0b\x63hunk_count\x18\x08 \x01(\x05\x12\x14\n\x0chealth_score\x18\t \x01(\x01\"8\n\x12UserDetailsRequest\x12\x11\n\tadmin_key\x18\x01 \x01(\t\x12\x0f\n\x07user_id\x18\x02 \x01(\t\"t\n\x13UserDetailsResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12$\n\x04user\x18\x02 \x01(\x0b\x32\x16.cloudstorage.UserInfo\x12&\n\x05\x66iles\x18\x03 \x03(\x0b\x32\x17.cloudstorage.FileEntry\"(\n\x13PaymentStatsRequest\x12\x11\n\tadmin_key\x18\x01 \x01(\t\"\xcb\x01\n\x14PaymentStatsResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x16\n\x0etotal_payments\x18\x02 \x01(\x03\x12\x1a\n\x12\x63ompleted_payments\x18\x03 \x01(\x03\x12\x18\n\x10pending_payments\x18\x04 \x01(\x03\x12\x17\n\x0f\x66\x61iled_payments\x18\x05 \x01(\x03\x12\x19\n\x11total_revenue_xaf\x18\x06 \x01(\x03\x12 \n\x18total_storage_sold_bytes\x18\x07 \x01(\x03\"P\n\x15GetAllPaymentsRequest\x12\x11\n\tadmin_key\x18\x01 \x01(\t\x12\r\n\x05limit\x18\x02 \x01(\x05\x12\x15\n\rstatus_filter\x18\x03 \x01(\t\"]\n\x16GetAllPaymentsResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x32\n\x08payments\x18\x02 \x03(\x0b\x32 .cloudstorage.AdminPaymentRecord\"\xf5\x01\n\x12\x41\x64minPaymentRecord\x12\x12\n\npayment_id\x18\x01 \x01(\t\x12\x12\n\nuser_email\x18\x02 \x01(\t\x12\x11\n\ttier_name\x18\x03 \x01(\t\x12\x12\n\namount_xaf\x18\x04 \x01(\x05\x12\x15\n\rstorage_bytes\x18\x05 \x01(\x03\x12\x10\n\x08provider\x18\x06 \x01(\t\x12\x14\n\x0cphone_number\x18\x07 \x01(\t\x12\x0e\n\x06status\x18\x08 \x01(\t\x12\x17\n\x0ftransaction_ref\x18\t \x01(\t\x12\x12\n\ncreated_at\x18\n \x01(\t\x12\x14\n\x0c\x63ompleted_at\x18\x0b \x01(\t\"M\n\x14RefundPaymentRequest\x12\x11\n\tadmin_key\x18\x01 \x01(\t\x12\x12\n\npayment_id\x18\x02 \x01(\t\x12\x0e\n\x06reason\x18\x03 \x01(\t\"9\n\x15RefundPaymentResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t2\xef\x02\n\x0b\x41uthService\x12\x46\n\x07SendOTP\x12\x1c.cloudstorage.SendOTPRequest\x1a\x1d.cloudstorage.SendOTPResponse\x12L\n\tVerifyOTP\x12\x1e.cloudstorage.VerifyOTPRequest\x1a\x1f.cloudstorage.VerifyOTPResponse\x12@\n\x05Login\x12\x1a.cloudstorage.LoginRequest\x1a\x1b.cloudstorage.LoginResponse\x12\x43\n\x06\x45nroll\x12\x1b.cloudstorage.EnrollRequest\x1a\x1c.cloudstorage.EnrollResponse\x12\x43\n\x06Logout\x12\x1b.cloudstorage.LogoutRequest\x1a\x1c.cloudstorage.LogoutResponse2\xb4\x05\n\x0b\x46ileService\x12Q\n\nUploadFile\x12\x1f.cloudstorage.UploadFileRequest\x1a .cloudstorage.UploadFileResponse(\x01\x12W\n\x0c\x44ownloadFile\x12!.cloudstorage.DownloadFileRequest\x1a\".cloudstorage.DownloadFileResponse0\x01\x12L\n\tListFiles\x12\x1e.cloudstorage.ListFilesRequest\x1a\x1f.cloudstorage.ListFilesResponse\x12O\n\nDeleteFile\x12\x1f.cloudstorage.DeleteFileRequest\x1a .cloudstorage.DeleteFileResponse\x12X\n\x0fGetFileMetadata\x12!.cloudstorage.FileMetadataRequest\x1a\".cloudstorage.FileMetadataResponse\x12U\n\x0c\x43reateFolder\x12!.cloudstorage.CreateFolderRequest\x1a\".cloudstorage.CreateFolderResponse\x12L\n\tShareFile\x12\x1e.cloudstorage.ShareFileRequest\x1a\x1f.cloudstorage.ShareFileResponse\x12[\n\x0eGetSharedFiles\x12#.cloudstorage.GetSharedFilesRequest\x1a$.cloudstorage.GetSharedFilesResponse2\xc1\x01\n\x0eStorageService\x12U\n\x0eGetStorageInfo\x12 .cloudstorage.StorageInfoRequest\x1a!.cloudstorage.StorageInfoResponse\x12X\n\x0fGetStorageUsage\x12!.cloudstorage.StorageUsageRequest\x1a\".cloudstorage.StorageUsageResponse2\xc8\x04\n\x0ePaymentService\x12^\n\x0fGetStorageTiers\x12$.cloudstorage.GetStorageTiersRequest\x1a%.cloudstorage.GetStorageTiersResponse\x12^\n\x0fInitiatePayment\x12$.cloudstorage.InitiatePaymentRequest\x1a%.cloudstorage.InitiatePaymentResponse\x12g\n\x12\x43heckPaymentStatus\x12\'.cloudstorage.CheckPaymentStatusRequest\x1a(.cloudstorage.CheckPaymentStatusResponse\x12\x64\n\x11GetPaymentHistory\x12&.cloudstorage.GetPaymentHistoryRequest\x1a\'.cloudstorage.GetPaymentHistoryResponse\x12X\n\rCancelPayment\x12\".cloudstorage.CancelPaymentRequest\x1a#.cloudstorage.CancelPaymentResponse\x12M\n\x0eProcessWebhook\x12\x1c.cloudstorage.WebhookRequest\x1a\x1d.cloudstorage.WebhookResponse2\x82\x04\n\x0bNodeService\x12U\n\x0cRegisterNode\x12!.cloudstorage.RegisterNodeRequest\x1a\".cloudstorage.RegisterNodeResponse\x12L\n\tHeartbeat\x12\x1e.cloudstorage.HeartbeatRequest\x1a\x1f.cloudstorage.HeartbeatResponse\x12O\n\nStoreChunk\x12\x1f.cloudstorage.StoreChunkRequest\x1a .cloudstorage.StoreChunkResponse\x12X\n\rRetrieveChunk\x12\".cloudstorage.RetrieveChunkRequest\x1a#.cloudstorage.RetrieveChunkResponse\x12R\n\x0b\x44\x65leteChunk\x12 .cloudstorage.DeleteChunkRequest\x1a!.cloudstorage.DeleteChunkResponse\x12O\n\nListChunks\x12\x1f.cloudstorage.ListChunksRequest\x1a .cloudstorage.ListChunksResponse2\xa8\x06\n\x0c\x41\x64minService\x12X\n\x0fGetSystemStatus\x12!.cloudstorage.SystemStatusRequest\x1a\".cloudstorage.SystemStatusResponse\x12^\n\x13UpdateGlobalStorage\x12\".cloudstorage.UpdateStorageRequest\x1a#.cloudstorage.UpdateStorageResponse\x12T\n\x12StreamSystemEvents\x12!.cloudstorage.StreamEventsRequest\x1a\x19.cloudstorage.SystemEvent0\x01\x12O\n\x0cListAllUsers\x12\x1e.cloudstorage.ListUsersRequest\x1a\x1f.cloudstorage.ListUsersResponse\x12O\n\x0cListAllNodes\x12\x1e.cloudstorage.ListNodesRequest\x1a\x1f.cloudstorage.ListNodesResponse\x12U\n\x0eGetUserDetails\x12 .cloudstorage.UserDetailsRequest\x1a!.cloudstorage.UserDetailsResponse\x12X\n\x0fGetPaymentStats\x12!.cloudstorage.PaymentStatsRequest\x1a\".cloudstorage.PaymentStatsResponse\x12[\n\x0eGetAllPayments\x12#.cloudstorage.GetAllPaymentsRequest\x1a$.cloudstorage.GetAllPaymentsResponse\x12X\n\rRefundPayment\x12\".cloudstorage.RefundPaymentRequest\x1a#.cloudstorage.RefundPaymentResponseb\x06proto3')
->>>>>>> Rest_api
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x13\x63loud_storage.proto\x12\x0c\x63loudstorage\"\x1f\n\x0eSendOTPRequest\x12\r\n\x05\x65mail\x18\x01 \x01(\t\"3\n\x0fSendOTPResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\".\n\x10VerifyOTPRequest\x12\r\n\x05\x65mail\x18\x01 \x01(\t\x12\x0b\n\x03otp\x18\x02 \x01(\t\"5\n\x11VerifyOTPResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\"\x1d\n\x0cLoginRequest\x12\r\n\x05\x65mail\x18\x01 \x01(\t\"Y\n\rLoginResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x15\n\rsession_token\x18\x03 \x01(\t\x12\x0f\n\x07user_id\x18\x04 \x01(\t\"1\n\rEnrollRequest\x12\r\n\x05\x65mail\x18\x01 \x01(\t\x12\x11\n\tfull_name\x18\x02 \x01(\t\"Z\n\x0e\x45nrollResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x15\n\rsession_token\x18\x03 \x01(\t\x12\x0f\n\x07user_id\x18\x04 \x01(\t\"&\n\rLogoutRequest\x12\x15\n\rsession_token\x18\x01 \x01(\t\"2\n\x0eLogoutResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\"a\n\x11UploadFileRequest\x12.\n\x08metadata\x18\x01 \x01(\x0b\x32\x1a.cloudstorage.FileMetadataH\x00\x12\x14\n\nchunk_data\x18\x02 \x01(\x0cH\x00\x42\x06\n\x04\x64\x61ta\"w\n\x0c\x46ileMetadata\x12\x15\n\rsession_token\x18\x01 \x01(\t\x12\x10\n\x08\x66ilename\x18\x02 \x01(\t\x12\x11\n\tfile_size\x18\x03 \x01(\x03\x12\x11\n\tmime_type\x18\x04 \x01(\t\x12\x18\n\x10parent_folder_id\x18\x05 \x01(\t\"^\n\x12UploadFileResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x0f\n\x07\x66ile_id\x18\x03 \x01(\t\x12\x15\n\rchunks_stored\x18\x04 \x01(\x05\"=\n\x13\x44ownloadFileRequest\x12\x15\n\rsession_token\x18\x01 \x01(\t\x12\x0f\n\x07\x66ile_id\x18\x02 \x01(\t\"a\n\x14\x44ownloadFileResponse\x12+\n\tfile_info\x18\x01 \x01(\x0b\x32\x16.cloudstorage.FileInfoH\x00\x12\x14\n\nchunk_data\x18\x02 \x01(\x0cH\x00\x42\x06\n\x04\x64\x61ta\"X\n\x08\x46ileInfo\x12\x10\n\x08\x66ilename\x18\x01 \x01(\t\x12\x11\n\tfile_size\x18\x02 \x01(\x03\x12\x11\n\tmime_type\x18\x03 \x01(\t\x12\x14\n\x0ctotal_chunks\x18\x04 \x01(\x05\"U\n\x10ListFilesRequest\x12\x15\n\rsession_token\x18\x01 \x01(\t\x12\x11\n\tfolder_id\x18\x02 \x01(\t\x12\x17\n\x0finclude_deleted\x18\x03 \x01(\x08\"x\n\x11ListFilesResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12&\n\x05\x66iles\x18\x02 \x03(\x0b\x32\x17.cloudstorage.FileEntry\x12*\n\x07\x66olders\x18\x03 \x03(\x0b\x32\x19.cloudstorage.FolderEntry\"\x90\x01\n\tFileEntry\x12\x0f\n\x07\x66ile_id\x18\x01 \x01(\t\x12\x10\n\x08\x66ilename\x18\x02 \x01(\t\x12\x11\n\tfile_size\x18\x03 \x01(\x03\x12\x11\n\tmime_type\x18\x04 \x01(\t\x12\x12\n\ncreated_at\x18\x05 \x01(\t\x12\x13\n\x0bmodified_at\x18\x06 \x01(\t\x12\x11\n\tis_shared\x18\x07 \x01(\x08\"]\n\x0b\x46olderEntry\x12\x11\n\tfolder_id\x18\x01 \x01(\t\x12\x13\n\x0b\x66older_name\x18\x02 \x01(\t\x12\x12\n\ncreated_at\x18\x03 \x01(\t\x12\x12\n\nfile_count\x18\x04 \x01(\x05\"N\n\x11\x44\x65leteFileRequest\x12\x15\n\rsession_token\x18\x01 \x01(\t\x12\x0f\n\x07\x66ile_id\x18\x02 \x01(\t\x12\x11\n\tpermanent\x18\x03 \x01(\x08\"6\n\x12\x44\x65leteFileResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\"=\n\x13\x46ileMetadataRequest\x12\x15\n\rsession_token\x18\x01 \x01(\t\x12\x0f\n\x07\x66ile_id\x18\x02 \x01(\t\"u\n\x14\x46ileMetadataResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12%\n\x04\x66ile\x18\x02 \x01(\x0b\x32\x17.cloudstorage.FileEntry\x12\x13\n\x0b\x63hunk_count\x18\x03 \x01(\x05\x12\x10\n\x08\x63hecksum\x18\x04 \x01(\t\"[\n\x13\x43reateFolderRequest\x12\x15\n\rsession_token\x18\x01 \x01(\t\x12\x13\n\x0b\x66older_name\x18\x02 \x01(\t\x12\x18\n\x10parent_folder_id\x18\x03 \x01(\t\"K\n\x14\x43reateFolderResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x11\n\tfolder_id\x18\x03 \x01(\t\"h\n\x10ShareFileRequest\x12\x15\n\rsession_token\x18\x01 \x01(\t\x12\x0f\n\x07\x66ile_id\x18\x02 \x01(\t\x12\x18\n\x10share_with_email\x18\x03 \x01(\t\x12\x12\n\npermission\x18\x04 \x01(\t\"J\n\x11ShareFileResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x13\n\x0bshare_token\x18\x03 \x01(\t\".\n\x15GetSharedFilesRequest\x12\x15\n\rsession_token\x18\x01 \x01(\t\"^\n\x16GetSharedFilesResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x33\n\x0cshared_files\x18\x02 \x03(\x0b\x32\x1d.cloudstorage.SharedFileEntry\"t\n\x0fSharedFileEntry\x12\x0f\n\x07\x66ile_id\x18\x01 \x01(\t\x12\x10\n\x08\x66ilename\x18\x02 \x01(\t\x12\x17\n\x0fshared_by_email\x18\x03 \x01(\t\x12\x12\n\npermission\x18\x04 \x01(\t\x12\x11\n\tshared_at\x18\x05 \x01(\t\"+\n\x12StorageInfoRequest\x12\x15\n\rsession_token\x18\x01 \x01(\t\"\x86\x01\n\x13StorageInfoResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x17\n\x0f\x61llocated_bytes\x18\x02 \x01(\x03\x12\x12\n\nused_bytes\x18\x03 \x01(\x03\x12\x17\n\x0f\x61vailable_bytes\x18\x04 \x01(\x03\x12\x18\n\x10usage_percentage\x18\x05 \x01(\x01\",\n\x13StorageUsageRequest\x12\x15\n\rsession_token\x18\x01 \x01(\t\"\xd3\x01\n\x14StorageUsageResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12J\n\rusage_by_type\x18\x02 \x03(\x0b\x32\x33.cloudstorage.StorageUsageResponse.UsageByTypeEntry\x12\x13\n\x0btotal_files\x18\x03 \x01(\x05\x12\x15\n\rtotal_folders\x18\x04 \x01(\x05\x1a\x32\n\x10UsageByTypeEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x03:\x02\x38\x01\"\x18\n\x16GetStorageTiersRequest\"T\n\x17GetStorageTiersResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12(\n\x05tiers\x18\x02 \x03(\x0b\x32\x19.cloudstorage.StorageTier\"\x81\x01\n\x0bStorageTier\x12\x0f\n\x07tier_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x14\n\x0c\x64isplay_name\x18\x03 \x01(\t\x12\x15\n\rstorage_bytes\x18\x04 \x01(\x03\x12\x11\n\tprice_xaf\x18\x05 \x01(\x05\x12\x13\n\x0b\x64\x65scription\x18\x06 \x01(\t\"h\n\x16InitiatePaymentRequest\x12\x15\n\rsession_token\x18\x01 \x01(\t\x12\x0f\n\x07tier_id\x18\x02 \x01(\t\x12\x10\n\x08provider\x18\x03 \x01(\t\x12\x14\n\x0cphone_number\x18\x04 \x01(\t\"\x91\x01\n\x17InitiatePaymentResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x12\n\npayment_id\x18\x03 \x01(\t\x12\x17\n\x0ftransaction_ref\x18\x04 \x01(\t\x12\x13\n\x0bpayment_url\x18\x05 \x01(\t\x12\x12\n\namount_xaf\x18\x06 \x01(\x05\"F\n\x19\x43heckPaymentStatusRequest\x12\x15\n\rsession_token\x18\x01 \x01(\t\x12\x12\n\npayment_id\x18\x02 \x01(\t\"y\n\x1a\x43heckPaymentStatusResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x12\n\npayment_id\x18\x02 \x01(\t\x12\x0e\n\x06status\x18\x03 \x01(\t\x12\x0f\n\x07message\x18\x04 \x01(\t\x12\x15\n\rstorage_added\x18\x05 \x01(\x03\"@\n\x18GetPaymentHistoryRequest\x12\x15\n\rsession_token\x18\x01 \x01(\t\x12\r\n\x05limit\x18\x02 \x01(\x05\"[\n\x19GetPaymentHistoryResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12-\n\x08payments\x18\x02 \x03(\x0b\x32\x1b.cloudstorage.PaymentRecord\"\xad\x01\n\rPaymentRecord\x12\x12\n\npayment_id\x18\x01 \x01(\t\x12\x11\n\ttier_name\x18\x02 \x01(\t\x12\x12\n\namount_xaf\x18\x03 \x01(\x05\x12\x15\n\rstorage_bytes\x18\x04 \x01(\x03\x12\x10\n\x08provider\x18\x05 \x01(\t\x12\x0e\n\x06status\x18\x06 \x01(\t\x12\x12\n\ncreated_at\x18\x07 \x01(\t\x12\x14\n\x0c\x63ompleted_at\x18\x08 \x01(\t\"A\n\x14\x43\x61ncelPaymentRequest\x12\x15\n\rsession_token\x18\x01 \x01(\t\x12\x12\n\npayment_id\x18\x02 \x01(\t\"9\n\x15\x43\x61ncelPaymentResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\"H\n\x0eWebhookRequest\x12\x14\n\x0c\x65xternal_ref\x18\x01 \x01(\t\x12\x0e\n\x06status\x18\x02 \x01(\t\x12\x10\n\x08raw_data\x18\x03 \x01(\t\"3\n\x0fWebhookResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\"o\n\x13RegisterNodeRequest\x12\x0f\n\x07node_id\x18\x01 \x01(\t\x12\x0c\n\x04host\x18\x02 \x01(\t\x12\x0c\n\x04port\x18\x03 \x01(\x05\x12\x18\n\x10storage_capacity\x18\x04 \x01(\x03\x12\x11\n\tcpu_cores\x18\x05 \x01(\x05\"8\n\x14RegisterNodeResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\"N\n\x10HeartbeatRequest\x12\x0f\n\x07node_id\x18\x01 \x01(\t\x12\x14\n\x0cstorage_used\x18\x02 \x01(\x03\x12\x13\n\x0b\x63hunk_count\x18\x03 \x01(\x05\"5\n\x11HeartbeatResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\"K\n\x11StoreChunkRequest\x12\x10\n\x08\x63hunk_id\x18\x01 \x01(\t\x12\x12\n\nchunk_data\x18\x02 \x01(\x0c\x12\x10\n\x08\x63hecksum\x18\x03 \x01(\t\"6\n\x12StoreChunkResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\"(\n\x14RetrieveChunkRequest\x12\x10\n\x08\x63hunk_id\x18\x01 \x01(\t\"M\n\x15RetrieveChunkResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x12\n\nchunk_data\x18\x02 \x01(\x0c\x12\x0f\n\x07message\x18\x03 \x01(\t\"&\n\x12\x44\x65leteChunkRequest\x12\x10\n\x08\x63hunk_id\x18\x01 \x01(\t\"7\n\x13\x44\x65leteChunkResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\"$\n\x11ListChunksRequest\x12\x0f\n\x07node_id\x18\x01 \x01(\t\"=\n\x12ListChunksResponse\x12\x11\n\tchunk_ids\x18\x01 \x03(\t\x12\x14\n\x0ctotal_chunks\x18\x02 \x01(\x05\"(\n\x13SystemStatusRequest\x12\x11\n\tadmin_key\x18\x01 \x01(\t\"\x83\x02\n\x14SystemStatusResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x1d\n\x15global_capacity_bytes\x18\x02 \x01(\x03\x12\x1e\n\x16global_allocated_bytes\x18\x03 \x01(\x03\x12\x19\n\x11global_used_bytes\x18\x04 \x01(\x03\x12\x13\n\x0btotal_users\x18\x05 \x01(\x05\x12\x13\n\x0btotal_nodes\x18\x06 \x01(\x05\x12\x14\n\x0conline_nodes\x18\x07 \x01(\x05\x12\x13\n\x0btotal_files\x18\x08 \x01(\x03\x12\x14\n\x0ctotal_chunks\x18\t \x01(\x03\x12\x15\n\rsystem_health\x18\n \x01(\x01\"B\n\x14UpdateStorageRequest\x12\x11\n\tadmin_key\x18\x01 \x01(\t\x12\x17\n\x0fnew_capacity_gb\x18\x02 \x01(\x03\"q\n\x15UpdateStorageResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x1a\n\x12old_capacity_bytes\x18\x03 \x01(\x03\x12\x1a\n\x12new_capacity_bytes\x18\x04 \x01(\x03\"(\n\x13StreamEventsRequest\x12\x11\n\tadmin_key\x18\x01 \x01(\t\"g\n\x0bSystemEvent\x12\x12\n\nevent_type\x18\x01 \x01(\t\x12\x11\n\ttimestamp\x18\x02 \x01(\t\x12\x0f\n\x07message\x18\x03 \x01(\t\x12\x0f\n\x07user_id\x18\x04 \x01(\t\x12\x0f\n\x07\x64\x65tails\x18\x05 \x01(\t\"7\n\nEventBatch\x12)\n\x06\x65vents\x18\x01 \x03(\x0b\x32\x19.cloudstorage.SystemEvent\"%\n\x10ListUsersRequest\x12\x11\n\tadmin_key\x18\x01 \x01(\t\"K\n\x11ListUsersResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12%\n\x05users\x18\x02 \x03(\x0b\x32\x16.cloudstorage.UserInfo\"\xa5\x01\n\x08UserInfo\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\r\n\x05\x65mail\x18\x02 \x01(\t\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x19\n\x11storage_allocated\x18\x04 \x01(\x03\x12\x14\n\x0cstorage_used\x18\x05 \x01(\x03\x12\x12\n\ncreated_at\x18\x06 \x01(\t\x12\x12\n\nlast_login\x18\x07 \x01(\t\x12\x12\n\nfile_count\x18\x08 \x01(\x05\"%\n\x10ListNodesRequest\x12\x11\n\tadmin_key\x18\x01 \x01(\t\"K\n\x11ListNodesResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12%\n\x05nodes\x18\x02 \x03(\x0b\x32\x16.cloudstorage.NodeInfo\"\xba\x01\n\x08NodeInfo\x12\x0f\n\x07node_id\x18\x01 \x01(\t\x12\x0c\n\x04host\x18\x02 \x01(\t\x12\x0c\n\x04port\x18\x03 \x01(\x05\x12\x18\n\x10storage_capacity\x18\x04 \x01(\x03\x12\x14\n\x0cstorage_used\x18\x05 \x01(\x03\x12\x0e\n\x06status\x18\x06 \x01(\t\x12\x16\n\x0elast_heartbeat\x18\x07 \x01(\t\x12\x13\n\x0b\x63hunk_count\x18\x08 \x01(\x05\x12\x14\n\x0chealth_score\x18\t \x01(\x01\"K\n\x12UserDetailsRequest\x12\x11\n\tadmin_key\x18\x01 \x01(\t\x12\x0f\n\x07user_id\x18\x02 \x01(\t\x12\x11\n\tmax_files\x18\x03 \x01(\x05\"t\n\x13UserDetailsResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12$\n\x04user\x18\x02 \x01(\x0b\x32\x16.cloudstorage.UserInfo\x12&\n\x05\x66iles\x18\x03 \x03(\x0b\x32\x17.cloudstorage.FileEntry\"(\n\x13PaymentStatsRequest\x12\x11\n\tadmin_key\x18\x01 \x01(\t\"\xcb\x01\n\x14PaymentStatsResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x16\n\x0etotal_payments\x18\x02 \x01(\x03\x12\x1a\n\x12\x63ompleted_payments\x18\x03 \x01(\x03\x12\x18\n\x10pending_payments\x18\x04 \x01(\x03\x12\x17\n\x0f\x66\x61iled_payments\x18\x05 \x01(\x03\x12\x19\n\x11total_revenue_xaf\x18\x06 \x01(\x03\x12 \n\x18total_storage_sold_bytes\x18\x07 \x01(\x03\"P\n\x15GetAllPaymentsRequest\x12\x11\n\tadmin_key\x18\x01 \x01(\t\x12\r\n\x05limit\x18\x02 \x01(\x05\x12\x15\n\rstatus_filter\x18\x03 \x01(\t\"]\n\x16GetAllPaymentsResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x32\n\x08payments\x18\x02 \x03(\x0b\x32 .cloudstorage.AdminPaymentRecord\"\xf5\x01\n\x12\x41\x64minPaymentRecord\x12\x12\n\npayment_id\x18\x01 \x01(\t\x12\x12\n\nuser_email\x18\x02 \x01(\t\x12\x11\n\ttier_name\x18\x03 \x01(\t\x12\x12\n\namount_xaf\x18\x04 \x01(\x05\x12\x15\n\rstorage_bytes\x18\x05 \x01(\x03\x12\x10\n\x08provider\x18\x06 \x01(\t\x12\x14\n\x0cphone_number\x18\x07 \x01(\t\x12\x0e\n\x06status\x18\x08 \x01(\t\x12\x17\n\x0ftransaction_ref\x18\t \x01(\t\x12\x12\n\ncreated_at\x18\n \x01(\t\x12\x14\n\x0c\x63ompleted_at\x18\x0b \x01(\t\"M\n\x14RefundPaymentRequest\x12\x11\n\tadmin_key\x18\x01 \x01(\t\x12\x12\n\npayment_id\x18\x02 \x01(\t\x12\x0e\n\x06reason\x18\x03 \x01(\t\"9\n\x15RefundPaymentResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t2\xef\x02\n\x0b\x41uthService\x12\x46\n\x07SendOTP\x12\x1c.cloudstorage.SendOTPRequest\x1a\x1d.cloudstorage.SendOTPResponse\x12L\n\tVerifyOTP\x12\x1e.cloudstorage.VerifyOTPRequest\x1a\x1f.cloudstorage.VerifyOTPResponse\x12@\n\x05Login\x12\x1a.cloudstorage.LoginRequest\x1a\x1b.cloudstorage.LoginResponse\x12\x43\n\x06\x45nroll\x12\x1b.cloudstorage.EnrollRequest\x1a\x1c.cloudstorage.EnrollResponse\x12\x43\n\x06Logout\x12\x1b.cloudstorage.LogoutRequest\x1a\x1c.cloudstorage.LogoutResponse2\xb4\x05\n\x0b\x46ileService\x12Q\n\nUploadFile\x12\x1f.cloudstorage.UploadFileRequest\x1a .cloudstorage.UploadFileResponse(\x01\x12W\n\x0c\x44ownloadFile\x12!.cloudstorage.DownloadFileRequest\x1a\".cloudstorage.DownloadFileResponse0\x01\x12L\n\tListFiles\x12\x1e.cloudstorage.ListFilesRequest\x1a\x1f.cloudstorage.ListFilesResponse\x12O\n\nDeleteFile\x12\x1f.cloudstorage.DeleteFileRequest\x1a .cloudstorage.DeleteFileResponse\x12X\n\x0fGetFileMetadata\x12!.cloudstorage.FileMetadataRequest\x1a\".cloudstorage.FileMetadataResponse\x12U\n\x0c\x43reateFolder\x12!.cloudstorage.CreateFolderRequest\x1a\".cloudstorage.CreateFolderResponse\x12L\n\tShareFile\x12\x1e.cloudstorage.ShareFileRequest\x1a\x1f.cloudstorage.ShareFileResponse\x12[\n\x0eGetSharedFiles\x12#.cloudstorage.GetSharedFilesRequest\x1a$.cloudstorage.GetSharedFilesResponse2\xc1\x01\n\x0eStorageService\x12U\n\x0eGetStorageInfo\x12 .cloudstorage.StorageInfoRequest\x1a!.cloudstorage.StorageInfoResponse\x12X\n\x0fGetStorageUsage\x12!.cloudstorage.StorageUsageRequest\x1a\".cloudstorage.StorageUsageResponse2\xc8\x04\n\x0ePaymentService\x12^\n\x0fGetStorageTiers\x12$.cloudstorage.GetStorageTiersRequest\x1a%.cloudstorage.GetStorageTiersResponse\x12^\n\x0fInitiatePayment\x12$.cloudstorage.InitiatePaymentRequest\x1a%.cloudstorage.InitiatePaymentResponse\x12g\n\x12\x43heckPaymentStatus\x12\'.cloudstorage.CheckPaymentStatusRequest\x1a(.cloudstorage.CheckPaymentStatusResponse\x12\x64\n\x11GetPaymentHistory\x12&.cloudstorage.GetPaymentHistoryRequest\x1a\'.cloudstorage.GetPaymentHistoryResponse\x12X\n\rCancelPayment\x12\".cloudstorage.CancelPaymentRequest\x1a#.cloudstorage.CancelPaymentResponse\x12M\n\x0eProcessWebhook\x12\x1c.cloudstorage.WebhookRequest\x1a\x1d.cloudstorage.WebhookResponse2\x82\x04\n\x0bNodeService\x12U\n\x0cRegisterNode\x12!.cloudstorage.RegisterNodeRequest\x1a\".cloudstorage.RegisterNodeResponse\x12L\n\tHeartbeat\x12\x1e.cloudstorage.HeartbeatRequest\x1a\x1f.cloudstorage.HeartbeatResponse\x12O\n\nStoreChunk\x12\x1f.cloudstorage.StoreChunkRequest\x1a .cloudstorage.StoreChunkResponse\x12X\n\rRetrieveChunk\x12\".cloudstorage.RetrieveChunkRequest\x1a#.cloudstorage.RetrieveChunkResponse\x12R\n\x0b\x44\x65leteChunk\x12 .cloudstorage.DeleteChunkRequest\x1a!.cloudstorage.DeleteChunkResponse\x12O\n\nListChunks\x12\x1f.cloudstorage.ListChunksRequest\x1a .cloudstorage.ListChunksResponse2\xab\x06\n\x0c\x41\x64minService\x12X\n\x0fGetSystemStatus\x12!.cloudstorage.SystemStatusRequest\x1a\".cloudstorage.SystemStatusResponse\x12^\n\x13UpdateGlobalStorage\x12\".cloudstorage.UpdateStorageRequest\x1a#.cloudstorage.UpdateStorageResponse\x12S\n\x12StreamSystemEvents\x12!.cloudstorage.StreamEventsRequest\x1a\x18.cloudstorage.EventBatch0\x01\x12Q\n\x0cListAllUsers\x12\x1e.cloudstorage.ListUsersRequest\x1a\x1f.cloudstorage.ListUsersResponse0\x01\x12Q\n\x0cListAllNodes\x12\x1e.cloudstorage.ListNodesRequest\x1a\x1f.cloudstorage.ListNodesResponse0\x01\x12U\n\x0eGetUserDetails\x12 .cloudstorage.UserDetailsRequest\x1a!.cloudstorage.UserDetailsResponse\x12X\n\x0fGetPaymentStats\x12!.cloudstorage.PaymentStatsRequest\x1a\".cloudstorage.PaymentStatsResponse\x12[\n\x0eGetAllPayments\x12#.cloudstorage.GetAllPaymentsRequest\x1a$.cloudstorage.GetAllPaymentsResponse\x12X\n\rRefundPayment\x12\".cloudstorage.RefundPaymentRequest\x1a#.cloudstorage.RefundPaymentResponseb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -109,70 +105,6 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_STORAGEUSAGERESPONSE']._serialized_end=2974
   _globals['_STORAGEUSAGERESPONSE_USAGEBYTYPEENTRY']._serialized_start=2924
   _globals['_STORAGEUSAGERESPONSE_USAGEBYTYPEENTRY']._serialized_end=2974
-<<<<<<< HEAD
-  _globals['_REGISTERNODEREQUEST']._serialized_start=2976
-  _globals['_REGISTERNODEREQUEST']._serialized_end=3087
-  _globals['_REGISTERNODERESPONSE']._serialized_start=3089
-  _globals['_REGISTERNODERESPONSE']._serialized_end=3145
-  _globals['_HEARTBEATREQUEST']._serialized_start=3147
-  _globals['_HEARTBEATREQUEST']._serialized_end=3225
-  _globals['_HEARTBEATRESPONSE']._serialized_start=3227
-  _globals['_HEARTBEATRESPONSE']._serialized_end=3280
-  _globals['_STORECHUNKREQUEST']._serialized_start=3282
-  _globals['_STORECHUNKREQUEST']._serialized_end=3357
-  _globals['_STORECHUNKRESPONSE']._serialized_start=3359
-  _globals['_STORECHUNKRESPONSE']._serialized_end=3413
-  _globals['_RETRIEVECHUNKREQUEST']._serialized_start=3415
-  _globals['_RETRIEVECHUNKREQUEST']._serialized_end=3455
-  _globals['_RETRIEVECHUNKRESPONSE']._serialized_start=3457
-  _globals['_RETRIEVECHUNKRESPONSE']._serialized_end=3534
-  _globals['_DELETECHUNKREQUEST']._serialized_start=3536
-  _globals['_DELETECHUNKREQUEST']._serialized_end=3574
-  _globals['_DELETECHUNKRESPONSE']._serialized_start=3576
-  _globals['_DELETECHUNKRESPONSE']._serialized_end=3631
-  _globals['_LISTCHUNKSREQUEST']._serialized_start=3633
-  _globals['_LISTCHUNKSREQUEST']._serialized_end=3669
-  _globals['_LISTCHUNKSRESPONSE']._serialized_start=3671
-  _globals['_LISTCHUNKSRESPONSE']._serialized_end=3732
-  _globals['_SYSTEMSTATUSREQUEST']._serialized_start=3734
-  _globals['_SYSTEMSTATUSREQUEST']._serialized_end=3774
-  _globals['_SYSTEMSTATUSRESPONSE']._serialized_start=3777
-  _globals['_SYSTEMSTATUSRESPONSE']._serialized_end=4036
-  _globals['_UPDATESTORAGEREQUEST']._serialized_start=4038
-  _globals['_UPDATESTORAGEREQUEST']._serialized_end=4104
-  _globals['_UPDATESTORAGERESPONSE']._serialized_start=4106
-  _globals['_UPDATESTORAGERESPONSE']._serialized_end=4219
-  _globals['_STREAMEVENTSREQUEST']._serialized_start=4221
-  _globals['_STREAMEVENTSREQUEST']._serialized_end=4261
-  _globals['_SYSTEMEVENT']._serialized_start=4263
-  _globals['_SYSTEMEVENT']._serialized_end=4366
-  _globals['_LISTUSERSREQUEST']._serialized_start=4368
-  _globals['_LISTUSERSREQUEST']._serialized_end=4405
-  _globals['_LISTUSERSRESPONSE']._serialized_start=4407
-  _globals['_LISTUSERSRESPONSE']._serialized_end=4482
-  _globals['_USERINFO']._serialized_start=4485
-  _globals['_USERINFO']._serialized_end=4650
-  _globals['_LISTNODESREQUEST']._serialized_start=4652
-  _globals['_LISTNODESREQUEST']._serialized_end=4689
-  _globals['_LISTNODESRESPONSE']._serialized_start=4691
-  _globals['_LISTNODESRESPONSE']._serialized_end=4766
-  _globals['_NODEINFO']._serialized_start=4769
-  _globals['_NODEINFO']._serialized_end=4955
-  _globals['_USERDETAILSREQUEST']._serialized_start=4957
-  _globals['_USERDETAILSREQUEST']._serialized_end=5013
-  _globals['_USERDETAILSRESPONSE']._serialized_start=5015
-  _globals['_USERDETAILSRESPONSE']._serialized_end=5131
-  _globals['_AUTHSERVICE']._serialized_start=5134
-  _globals['_AUTHSERVICE']._serialized_end=5501
-  _globals['_FILESERVICE']._serialized_start=5504
-  _globals['_FILESERVICE']._serialized_end=6196
-  _globals['_STORAGESERVICE']._serialized_start=6199
-  _globals['_STORAGESERVICE']._serialized_end=6392
-  _globals['_NODESERVICE']._serialized_start=6395
-  _globals['_NODESERVICE']._serialized_end=6909
-  _globals['_ADMINSERVICE']._serialized_start=6912
-  _globals['_ADMINSERVICE']._serialized_end=7447
-=======
   _globals['_GETSTORAGETIERSREQUEST']._serialized_start=2976
   _globals['_GETSTORAGETIERSREQUEST']._serialized_end=3000
   _globals['_GETSTORAGETIERSRESPONSE']._serialized_start=3002
@@ -237,47 +169,48 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_STREAMEVENTSREQUEST']._serialized_end=5542
   _globals['_SYSTEMEVENT']._serialized_start=5544
   _globals['_SYSTEMEVENT']._serialized_end=5647
-  _globals['_LISTUSERSREQUEST']._serialized_start=5649
-  _globals['_LISTUSERSREQUEST']._serialized_end=5686
-  _globals['_LISTUSERSRESPONSE']._serialized_start=5688
-  _globals['_LISTUSERSRESPONSE']._serialized_end=5763
-  _globals['_USERINFO']._serialized_start=5766
-  _globals['_USERINFO']._serialized_end=5931
-  _globals['_LISTNODESREQUEST']._serialized_start=5933
-  _globals['_LISTNODESREQUEST']._serialized_end=5970
-  _globals['_LISTNODESRESPONSE']._serialized_start=5972
-  _globals['_LISTNODESRESPONSE']._serialized_end=6047
-  _globals['_NODEINFO']._serialized_start=6050
-  _globals['_NODEINFO']._serialized_end=6236
-  _globals['_USERDETAILSREQUEST']._serialized_start=6238
-  _globals['_USERDETAILSREQUEST']._serialized_end=6294
-  _globals['_USERDETAILSRESPONSE']._serialized_start=6296
-  _globals['_USERDETAILSRESPONSE']._serialized_end=6412
-  _globals['_PAYMENTSTATSREQUEST']._serialized_start=6414
-  _globals['_PAYMENTSTATSREQUEST']._serialized_end=6454
-  _globals['_PAYMENTSTATSRESPONSE']._serialized_start=6457
-  _globals['_PAYMENTSTATSRESPONSE']._serialized_end=6660
-  _globals['_GETALLPAYMENTSREQUEST']._serialized_start=6662
-  _globals['_GETALLPAYMENTSREQUEST']._serialized_end=6742
-  _globals['_GETALLPAYMENTSRESPONSE']._serialized_start=6744
-  _globals['_GETALLPAYMENTSRESPONSE']._serialized_end=6837
-  _globals['_ADMINPAYMENTRECORD']._serialized_start=6840
-  _globals['_ADMINPAYMENTRECORD']._serialized_end=7085
-  _globals['_REFUNDPAYMENTREQUEST']._serialized_start=7087
-  _globals['_REFUNDPAYMENTREQUEST']._serialized_end=7164
-  _globals['_REFUNDPAYMENTRESPONSE']._serialized_start=7166
-  _globals['_REFUNDPAYMENTRESPONSE']._serialized_end=7223
-  _globals['_AUTHSERVICE']._serialized_start=7226
-  _globals['_AUTHSERVICE']._serialized_end=7593
-  _globals['_FILESERVICE']._serialized_start=7596
-  _globals['_FILESERVICE']._serialized_end=8288
-  _globals['_STORAGESERVICE']._serialized_start=8291
-  _globals['_STORAGESERVICE']._serialized_end=8484
-  _globals['_PAYMENTSERVICE']._serialized_start=8487
-  _globals['_PAYMENTSERVICE']._serialized_end=9071
-  _globals['_NODESERVICE']._serialized_start=9074
-  _globals['_NODESERVICE']._serialized_end=9588
-  _globals['_ADMINSERVICE']._serialized_start=9591
-  _globals['_ADMINSERVICE']._serialized_end=10399
->>>>>>> Rest_api
+  _globals['_EVENTBATCH']._serialized_start=5649
+  _globals['_EVENTBATCH']._serialized_end=5704
+  _globals['_LISTUSERSREQUEST']._serialized_start=5706
+  _globals['_LISTUSERSREQUEST']._serialized_end=5743
+  _globals['_LISTUSERSRESPONSE']._serialized_start=5745
+  _globals['_LISTUSERSRESPONSE']._serialized_end=5820
+  _globals['_USERINFO']._serialized_start=5823
+  _globals['_USERINFO']._serialized_end=5988
+  _globals['_LISTNODESREQUEST']._serialized_start=5990
+  _globals['_LISTNODESREQUEST']._serialized_end=6027
+  _globals['_LISTNODESRESPONSE']._serialized_start=6029
+  _globals['_LISTNODESRESPONSE']._serialized_end=6104
+  _globals['_NODEINFO']._serialized_start=6107
+  _globals['_NODEINFO']._serialized_end=6293
+  _globals['_USERDETAILSREQUEST']._serialized_start=6295
+  _globals['_USERDETAILSREQUEST']._serialized_end=6370
+  _globals['_USERDETAILSRESPONSE']._serialized_start=6372
+  _globals['_USERDETAILSRESPONSE']._serialized_end=6488
+  _globals['_PAYMENTSTATSREQUEST']._serialized_start=6490
+  _globals['_PAYMENTSTATSREQUEST']._serialized_end=6530
+  _globals['_PAYMENTSTATSRESPONSE']._serialized_start=6533
+  _globals['_PAYMENTSTATSRESPONSE']._serialized_end=6736
+  _globals['_GETALLPAYMENTSREQUEST']._serialized_start=6738
+  _globals['_GETALLPAYMENTSREQUEST']._serialized_end=6818
+  _globals['_GETALLPAYMENTSRESPONSE']._serialized_start=6820
+  _globals['_GETALLPAYMENTSRESPONSE']._serialized_end=6913
+  _globals['_ADMINPAYMENTRECORD']._serialized_start=6916
+  _globals['_ADMINPAYMENTRECORD']._serialized_end=7161
+  _globals['_REFUNDPAYMENTREQUEST']._serialized_start=7163
+  _globals['_REFUNDPAYMENTREQUEST']._serialized_end=7240
+  _globals['_REFUNDPAYMENTRESPONSE']._serialized_start=7242
+  _globals['_REFUNDPAYMENTRESPONSE']._serialized_end=7299
+  _globals['_AUTHSERVICE']._serialized_start=7302
+  _globals['_AUTHSERVICE']._serialized_end=7669
+  _globals['_FILESERVICE']._serialized_start=7672
+  _globals['_FILESERVICE']._serialized_end=8364
+  _globals['_STORAGESERVICE']._serialized_start=8367
+  _globals['_STORAGESERVICE']._serialized_end=8560
+  _globals['_PAYMENTSERVICE']._serialized_start=8563
+  _globals['_PAYMENTSERVICE']._serialized_end=9147
+  _globals['_NODESERVICE']._serialized_start=9150
+  _globals['_NODESERVICE']._serialized_end=9664
+  _globals['_ADMINSERVICE']._serialized_start=9667
+  _globals['_ADMINSERVICE']._serialized_end=10478
 # @@protoc_insertion_point(module_scope)
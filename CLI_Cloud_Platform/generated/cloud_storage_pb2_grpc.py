@@ -784,8 +784,6 @@ class StorageService(object):
             _registered_method=True)
 
 
-<<<<<<< HEAD
-=======
 class PaymentServiceStub(object):
     """============================================================================
     Payment Service
@@ -1082,7 +1080,6 @@ class PaymentService(object):
             _registered_method=True)
 
 
->>>>>>> Rest_api
 class NodeServiceStub(object):
     """============================================================================
     Node Service (Internal)
@@ -1404,14 +1401,14 @@ class AdminServiceStub(object):
         self.StreamSystemEvents = channel.unary_stream(
                 '/cloudstorage.AdminService/StreamSystemEvents',
                 request_serializer=cloud__storage__pb2.StreamEventsRequest.SerializeToString,
-                response_deserializer=cloud__storage__pb2.SystemEvent.FromString,
+                response_deserializer=cloud__storage__pb2.EventBatch.FromString,
                 _registered_method=True)
-        self.ListAllUsers = channel.unary_unary(
+        self.ListAllUsers = channel.unary_stream(
                 '/cloudstorage.AdminService/ListAllUsers',
                 request_serializer=cloud__storage__pb2.ListUsersRequest.SerializeToString,
                 response_deserializer=cloud__storage__pb2.ListUsersResponse.FromString,
                 _registered_method=True)
-        self.ListAllNodes = channel.unary_unary(
+        self.ListAllNodes = channel.unary_stream(
                 '/cloudstorage.AdminService/ListAllNodes',
                 request_serializer=cloud__storage__pb2.ListNodesRequest.SerializeToString,
                 response_deserializer=cloud__storage__pb2.ListNodesResponse.FromString,
@@ -1421,8 +1418,6 @@ class AdminServiceStub(object):
                 request_serializer=cloud__storage__pb2.UserDetailsRequest.SerializeToString,
                 response_deserializer=cloud__storage__pb2.UserDetailsResponse.FromString,
                 _registered_method=True)
-<<<<<<< HEAD
-=======
         self.GetPaymentStats = channel.unary_unary(
                 '/cloudstorage.AdminService/GetPaymentStats',
                 request_serializer=cloud__storage__pb2.PaymentStatsRequest.SerializeToString,
@@ -1438,7 +1433,6 @@ class AdminServiceStub(object):
                 request_serializer=cloud__storage__pb2.RefundPaymentRequest.SerializeToString,
                 response_deserializer=cloud__storage__pb2.RefundPaymentResponse.FromString,
                 _registered_method=True)
->>>>>>> Rest_api
 
 
 class AdminServiceServicer(object):
@@ -1483,8 +1477,6 @@ class AdminServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
-<<<<<<< HEAD
-=======
     def GetPaymentStats(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -1503,7 +1495,6 @@ class AdminServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
->>>>>>> Rest_api
 
 def add_AdminServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -1520,14 +1511,14 @@ def add_AdminServiceServicer_to_server(servicer, server):
             'StreamSystemEvents': grpc.unary_stream_rpc_method_handler(
                     servicer.StreamSystemEvents,
                     request_deserializer=cloud__storage__pb2.StreamEventsRequest.FromString,
-                    response_serializer=cloud__storage__pb2.SystemEvent.SerializeToString,
+                    response_serializer=cloud__storage__pb2.EventBatch.SerializeToString,
             ),
-            'ListAllUsers': grpc.unary_unary_rpc_method_handler(
+            'ListAllUsers': grpc.unary_stream_rpc_method_handler(
                     servicer.ListAllUsers,
                     request_deserializer=cloud__storage__pb2.ListUsersRequest.FromString,
                     response_serializer=cloud__storage__pb2.ListUsersResponse.SerializeToString,
             ),
-            'ListAllNodes': grpc.unary_unary_rpc_method_handler(
+            'ListAllNodes': grpc.unary_stream_rpc_method_handler(
                     servicer.ListAllNodes,
                     request_deserializer=cloud__storage__pb2.ListNodesRequest.FromString,
                     response_serializer=cloud__storage__pb2.ListNodesResponse.SerializeToString,
@@ -1537,8 +1528,6 @@ def add_AdminServiceServicer_to_server(servicer, server):
                     request_deserializer=cloud__storage__pb2.UserDetailsRequest.FromString,
                     response_serializer=cloud__storage__pb2.UserDetailsResponse.SerializeToString,
             ),
-<<<<<<< HEAD
-=======
             'GetPaymentStats': grpc.unary_unary_rpc_method_handler(
                     servicer.GetPaymentStats,
                     request_deserializer=cloud__storage__pb2.PaymentStatsRequest.FromString,
@@ -1554,7 +1543,6 @@ def add_AdminServiceServicer_to_server(servicer, server):
                     request_deserializer=cloud__storage__pb2.RefundPaymentRequest.FromString,
                     response_serializer=cloud__storage__pb2.RefundPaymentResponse.SerializeToString,
             ),
->>>>>>> Rest_api
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'cloudstorage.AdminService', rpc_method_handlers)
@@ -1639,7 +1627,7 @@ class AdminService(object):
             target,
             '/cloudstorage.AdminService/StreamSystemEvents',
             cloud__storage__pb2.StreamEventsRequest.SerializeToString,
-            cloud__storage__pb2.SystemEvent.FromString,
+            cloud__storage__pb2.EventBatch.FromString,
             options,
             channel_credentials,
             insecure,
@@ -1661,7 +1649,7 @@ class AdminService(object):
             wait_for_ready=None,
             timeout=None,
             metadata=None):
-        return grpc.experimental.unary_unary(
+        return grpc.experimental.unary_stream(
             request,
             target,
             '/cloudstorage.AdminService/ListAllUsers',
@@ -1688,7 +1676,7 @@ class AdminService(object):
             wait_for_ready=None,
             timeout=None,
             metadata=None):
-        return grpc.experimental.unary_unary(
+        return grpc.experimental.unary_stream(
             request,
             target,
             '/cloudstorage.AdminService/ListAllNodes',
@@ -1730,8 +1718,6 @@ class AdminService(object):
             timeout,
             metadata,
             _registered_method=True)
-<<<<<<< HEAD
-=======
 
     @staticmethod
     def GetPaymentStats(request,
@@ -1813,4 +1799,3 @@ class AdminService(object):
             timeout,
             metadata,
             _registered_method=True)
->>>>>>> Rest_api
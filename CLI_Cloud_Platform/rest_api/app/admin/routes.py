@@ -688,29 +688,30 @@ def list_nodes():
     client = get_grpc_client()
     
     try:
-        response = client.admin_stub.ListAllNodes(
+        pages = list(client.admin_stub.ListAllNodes(
             cloud_storage_pb2.ListNodesRequest(admin_key=admin_key.strip())
-        )
+        ))
         
-        if response.success:
+        if pages and pages[0].success:
             nodes = []
-            for n in response.nodes:
-                pid = read_pid_file(n.node_id)
-                is_running = pid and is_process_running(pid)
-                
-                nodes.append({
-                    'node_id': n.node_id,
-                    'host': n.host,
-                    'port': n.port,
-                    'storage_capacity': n.storage_capacity,
-                    'storage_used': n.storage_used,
-                    'status': n.status,
-                    'last_heartbeat': n.last_heartbeat,
-                    'chunk_count': n.chunk_count,
-                    'health_score': n.health_score,
-                    'process_running': is_running,
-                    'pid': pid if is_running else None
-                })
+            for page in pages:
+                for n in page.nodes:
+                    pid = read_pid_file(n.node_id)
+                    is_running = pid and is_process_running(pid)
+                    
+                    nodes.append({
+                        'node_id': n.node_id,
+                        'host': n.host,
+                        'port': n.port,
+                        'storage_capacity': n.storage_capacity,
+                        'storage_used': n.storage_used,
+                        'status': n.status,
+                        'last_heartbeat': n.last_heartbeat,
+                        'chunk_count': n.chunk_count,
+                        'health_score': n.health_score,
+                        'process_running': is_running,
+                        'pid': pid if is_running else None
+                    })
             
             # Add capacity metrics
             metrics = calculate_capacity_metrics()
@@ -794,15 +795,16 @@ def stream_events():
             yield f"data: {json.dumps({'event_type': 'CONNECTED', 'message': 'Event stream connected', 'timestamp': datetime.now().isoformat()})}\n\n"
             
             stream_request = cloud_storage_pb2.StreamEventsRequest(admin_key=admin_key.strip())
-            for event in client.admin_stub.StreamSystemEvents(stream_request):
-                data = {
-                    'event_type': event.event_type,
-                    'timestamp': event.timestamp,
-                    'message': event.message,
-                    'user_id': event.user_id,
-                    'details': event.details
-                }
-                yield f"data: {json.dumps(data)}\n\n"
+            for batch in client.admin_stub.StreamSystemEvents(stream_request):
+                for event in batch.events:
+                    data = {
+                        'event_type': event.event_type,
+                        'timestamp': event.timestamp,
+                        'message': event.message,
+                        'user_id': event.user_id,
+                        'details': event.details
+                    }
+                    yield f"data: {json.dumps(data)}\n\n"
         except Exception as e:
             print(f"[ERROR] SSE exception: {str(e)}")
             yield f"data: {json.dumps({'error': str(e)})}\n\n"
@@ -828,11 +830,11 @@ def list_users():
     client = get_grpc_client()
     
     try:
-        response = client.admin_stub.ListAllUsers(
+        pages = list(client.admin_stub.ListAllUsers(
             cloud_storage_pb2.ListUsersRequest(admin_key=admin_key.strip())
-        )
+        ))
         
-        if response.success:
+        if pages and pages[0].success:
             users = [{
                 'user_id': u.user_id,
                 'email': u.email,
@@ -842,7 +844,7 @@ def list_users():
                 'created_at': u.created_at,
                 'last_login': u.last_login,
                 'file_count': u.file_count
-            } for u in response.users]
+            } for page in pages for u in page.users]
             
             return success_response({'users': users})
         else:
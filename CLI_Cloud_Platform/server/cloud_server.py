@@ -4,6 +4,7 @@ import sys
 import os
 import queue
 import threading
+import time
 from datetime import datetime, timezone, timedelta
 import json
 import traceback
@@ -39,6 +40,13 @@ node_manager = NodeManager()
 # Event queue for real-time streaming
 event_queue = queue.Queue()
 
+# Users or nodes per page of the streamed admin listings
+LIST_PAGE_SIZE = 256
+
+# Events coalesced into one stream message, and how long to wait for them
+EVENT_BATCH_SIZE = 64
+EVENT_BATCH_WINDOW = 0.05  # seconds
+
 
 def get_utcnow():
     """Get current UTC datetime in a cross-version compatible way"""
@@ -1120,18 +1128,19 @@ class AdminServiceServicer(cloud_storage_pb2_grpc.AdminServiceServicer):
             context.abort(grpc.StatusCode.INTERNAL, str(e))
     
     def ListAllUsers(self, request, context):
-        """List all users - NOW IMPLEMENTED"""
+        """List all users, streamed in pages of LIST_PAGE_SIZE"""
         try:
             if request.admin_key != ADMIN_KEY:
                 context.abort(grpc.StatusCode.PERMISSION_DENIED, "Invalid admin key")
             
+            # Listings repeat a lot (domains, statuses), so gzip the response
+            context.set_compression(grpc.Compression.Gzip)
+            
             with get_db_session() as session:
                 from db.models import User, File
                 
-                users = session.query(User).all()
-                
                 user_list = []
-                for user in users:
+                for user in session.query(User).yield_per(LIST_PAGE_SIZE):
                     file_count = session.query(File).filter_by(
                         user_id=user.user_id,
                         deleted_at=None
@@ -1147,8 +1156,13 @@ class AdminServiceServicer(cloud_storage_pb2_grpc.AdminServiceServicer):
                         last_login=user.last_login.isoformat() if user.last_login else "",
                         file_count=file_count
                     ))
+                    
+                    if len(user_list) == LIST_PAGE_SIZE:
+                        yield cloud_storage_pb2.ListUsersResponse(success=True, users=user_list)
+                        user_list = []
                 
-                return cloud_storage_pb2.ListUsersResponse(
+                # The last page may be empty, so an empty listing still reports success
+                yield cloud_storage_pb2.ListUsersResponse(
                     success=True,
                     users=user_list
                 )
@@ -1158,19 +1172,21 @@ class AdminServiceServicer(cloud_storage_pb2_grpc.AdminServiceServicer):
             context.abort(grpc.StatusCode.INTERNAL, str(e))
     
     def ListAllNodes(self, request, context):
+        """List all storage nodes, streamed in pages of LIST_PAGE_SIZE"""
         try:
             if request.admin_key != ADMIN_KEY:
                 context.abort(grpc.StatusCode.PERMISSION_DENIED, "Invalid admin key")
             
+            # Listings repeat a lot (domains, statuses), so gzip the response
+            context.set_compression(grpc.Compression.Gzip)
+            
             with get_db_session() as session:
                 from db.models import StorageNode, Chunk
                 
-                nodes = session.query(StorageNode).all()
-                
                 online_threshold = get_utcnow() - timedelta(minutes=2)
                 
                 node_list = []
-                for node in nodes:
+                for node in session.query(StorageNode).yield_per(LIST_PAGE_SIZE):
                     chunk_count = session.query(Chunk).filter_by(
                         primary_node_id=node.node_id
                     ).count()
@@ -1197,8 +1213,13 @@ class AdminServiceServicer(cloud_storage_pb2_grpc.AdminServiceServicer):
                         chunk_count=chunk_count,
                         health_score=node.health_score
                     ))
+                    
+                    if len(node_list) == LIST_PAGE_SIZE:
+                        yield cloud_storage_pb2.ListNodesResponse(success=True, nodes=node_list)
+                        node_list = []
                 
-                return cloud_storage_pb2.ListNodesResponse(
+                # The last page may be empty, so an empty listing still reports success
+                yield cloud_storage_pb2.ListNodesResponse(
                     success=True,
                     nodes=node_list
                 )
@@ -1213,6 +1234,9 @@ class AdminServiceServicer(cloud_storage_pb2_grpc.AdminServiceServicer):
         try:
             if request.admin_key != ADMIN_KEY:
                 context.abort(grpc.StatusCode.PERMISSION_DENIED, "Invalid admin key")
+            
+            # The file list repeats a lot (mime types, dates), so gzip the response
+            context.set_compression(grpc.Compression.Gzip)
                 
             user_id = request.user_id
             
@@ -1224,10 +1248,15 @@ class AdminServiceServicer(cloud_storage_pb2_grpc.AdminServiceServicer):
                 if not user:
                     context.abort(grpc.StatusCode.NOT_FOUND, "User not found")
                 
-                files = session.query(File).filter_by(
+                file_query = session.query(File).filter_by(
                     user_id=user_id,
                     deleted_at=None
-                ).order_by(File.created_at.desc()).all()
+                )
+                file_count = file_query.count()
+                
+                files = file_query.order_by(File.created_at.desc())
+                if request.max_files > 0:
+                    files = files.limit(request.max_files)
                 
                 file_entries = []
                 for file in files:
@@ -1251,7 +1280,7 @@ class AdminServiceServicer(cloud_storage_pb2_grpc.AdminServiceServicer):
                         storage_used=user.storage_used,
                         created_at=user.created_at.isoformat(),
                         last_login=user.last_login.isoformat() if user.last_login else "",
-                        file_count=len(files)
+                        file_count=file_count
                     ),
                     files=file_entries
                 )
@@ -1261,7 +1290,11 @@ class AdminServiceServicer(cloud_storage_pb2_grpc.AdminServiceServicer):
             context.abort(grpc.StatusCode.INTERNAL, str(e))
         
     def StreamSystemEvents(self, request, context):
-        """Stream real-time system events"""
+        """Stream real-time system events
+        
+        Events that arrive within EVENT_BATCH_WINDOW of each other are
+        sent together as one EventBatch message.
+        """
         try:
             if request.admin_key != ADMIN_KEY:
                 context.abort(grpc.StatusCode.PERMISSION_DENIED, "Invalid admin key")
@@ -1273,9 +1306,19 @@ class AdminServiceServicer(cloud_storage_pb2_grpc.AdminServiceServicer):
             
             while context.is_active():
                 try:
-                    event = event_queue.get(timeout=2.0)
-                    print(f"[ADMIN] Streaming event: {event.event_type}")
-                    yield event
+                    batch = [event_queue.get(timeout=2.0)]
+                    deadline = time.monotonic() + EVENT_BATCH_WINDOW
+                    while len(batch) < EVENT_BATCH_SIZE:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        try:
+                            batch.append(event_queue.get(timeout=remaining))
+                        except queue.Empty:
+                            break
+                    
+                    print(f"[ADMIN] Streaming batch of {len(batch)} event(s)")
+                    yield cloud_storage_pb2.EventBatch(events=batch)
                     last_keepalive = datetime.now()
                     
                 except queue.Empty:
@@ -1288,7 +1331,7 @@ class AdminServiceServicer(cloud_storage_pb2_grpc.AdminServiceServicer):
                             user_id='',
                             details=''
                         )
-                        yield keepalive
+                        yield cloud_storage_pb2.EventBatch(events=[keepalive])
                         last_keepalive = now
                     continue
                     
@@ -1400,8 +1443,16 @@ def serve():
         print("Current Global Storage: 0 GB (no nodes registered)")
     print("Storage will grow as nodes are added!")
     
-    # Create gRPC server
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=50))
+    # Create gRPC server; accept the admin monitor's 30s keepalive pings,
+    # which the default policy would answer with GOAWAY on an idle stream
+    server = grpc.server(
+        futures.ThreadPoolExecutor(max_workers=50),
+        options=[
+            ('grpc.keepalive_permit_without_calls', 1),
+            ('grpc.http2.min_recv_ping_interval_without_data_ms', 20000),
+            ('grpc.http2.max_ping_strikes', 0),
+        ]
+    )
     
     # Add servicers
     cloud_storage_pb2_grpc.add_AuthServiceServicer_to_server(
@@ -1,28 +1,183 @@
 import grpc
 import sys
 import os
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import itertools
+import queue
+from collections import OrderedDict
 
 # Add parent directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+# Use the C (upb) protobuf runtime unless one was chosen explicitly;
+# it must be set before the first protobuf import
+os.environ.setdefault('PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION', 'upb')
+
 from generated import calculator_pb2
 from generated import calculator_pb2_grpc
 
+# Each pooled channel gets its own connection (local subchannel pool),
+# kept alive between menu choices
+CHANNEL_OPTIONS = [
+    ('grpc.use_local_subchannel_pool', 1),
+    ('grpc.keepalive_time_ms', 30000),
+    ('grpc.keepalive_timeout_ms', 10000),
+    ('grpc.keepalive_permit_without_calls', 1),
+    ('grpc.http2.max_pings_without_data', 0),
+]
+
+# Channels (connections) per client: the concurrent demo's fan-out
+POOL_SIZE = 4
+
+# Batch and Session streams are gzipped; single unary calls are too small to gain
+STREAM_COMPRESSION = grpc.Compression.Gzip
+
+# Results a calculator session remembers, most recently used first out
+SESSION_CACHE_SIZE = 1024
+
+# Deadline in seconds for each unary call (SendOtp includes sending the email)
+CALL_TIMEOUT = 10.0
+
+# Section rules for the console output
+SEPARATOR = "=" * 60
+DIVIDER = "-" * 60
+
+# Streamed operation codes and display symbols, by operation name
+OPERATION_CODES = {
+    'add': calculator_pb2.OP_ADD,
+    'sub': calculator_pb2.OP_SUB,
+    'mul': calculator_pb2.OP_MUL,
+    'div': calculator_pb2.OP_DIV,
+    'mod': calculator_pb2.OP_MOD,
+}
+OPERATION_SYMBOLS = {'add': '+', 'sub': '-', 'mul': '*', 'div': '//', 'mod': '%'}
+
+# Unary Calculator method and request message, by operation name
+OPERATION_METHODS = {
+    'add': ('Add', calculator_pb2.AddRequest),
+    'sub': ('Sub', calculator_pb2.SubRequest),
+    'mul': ('Mul', calculator_pb2.MulRequest),
+    'div': ('Div', calculator_pb2.DivRequest),
+    'mod': ('Mod', calculator_pb2.ModRequest),
+}
+
+# Calculator menu choices that run an operation
+MENU_OPERATIONS = {'1': 'add', '2': 'sub', '3': 'mul', '4': 'div', '5': 'mod'}
+
+# Units for format_bytes, each 1024 times the last
+BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+# Every storage bar, indexed by its filled length out of 40
+STORAGE_BARS = tuple('█' * filled + '░' * (40 - filled) for filled in range(41))
+
+# Menus, each written to the console in one piece
+MAIN_MENU = "\n".join([
+    "",
+    SEPARATOR,
+    "MAIN MENU",
+    SEPARATOR,
+    "1. Login (Existing User)",
+    "2. Enroll (New User)",
+    "3. Exit",
+    SEPARATOR,
+    "",
+])
+CALCULATOR_MENU = "\n".join([
+    "",
+    SEPARATOR,
+    "CALCULATOR OPERATIONS",
+    SEPARATOR,
+    "1. Addition",
+    "2. Subtraction",
+    "3. Multiplication",
+    "4. Division",
+    "5. Modulo",
+    "6. Run Concurrent Operations Demo",
+    "7. View Storage Information",
+    "8. Logout",
+    SEPARATOR,
+    "",
+])
+
+
+def auth_metadata(session_token):
+    """Call metadata carrying the session token to the Calculator service"""
+    return (('authorization', f'Bearer {session_token}'),) if session_token else ()
+
 
 class CloudGrpcClient:
-    def __init__(self, host='localhost:50051'):
-        self.channel = grpc.insecure_channel(host)
+    """Blocking calculator client; reuses its messages, so use it from one thread"""
+    # Fixed attribute set, read on every call
+    __slots__ = (
+        'host', 'timeout', 'channels', 'channel', 'auth_stub', 'calc_stub', '_calc_stubs',
+        '_add_calls', '_sub_calls', '_mul_calls', '_div_calls', '_mod_calls',
+        '_add_request', '_sub_request', '_mul_request', '_div_request', '_mod_request',
+        '_session_token', '_metadata',
+    )
+    
+    def __init__(self, host='localhost:50051', pool_size=POOL_SIZE, timeout=CALL_TIMEOUT):
+        # Calculator calls rotate over a pool of channels so concurrent
+        # calls are not serialized on one HTTP/2 connection
+        self.host = host
+        self.timeout = timeout
+        self.channels = [grpc.insecure_channel(host, options=CHANNEL_OPTIONS) for _ in range(pool_size)]
+        self.channel = self.channels[0]
         self.auth_stub = calculator_pb2_grpc.AuthServiceStub(self.channel)
         self.calc_stub = calculator_pb2_grpc.CalculatorStub(self.channel)
+        self._calc_stubs = itertools.cycle(
+            [calculator_pb2_grpc.CalculatorStub(channel) for channel in self.channels]
+        )
+        # Per-operation callables, one rotation across the pool each
+        self._add_calls = self._unary_calls('Add', calculator_pb2.AddRequest, calculator_pb2.AddResponse)
+        self._sub_calls = self._unary_calls('Sub', calculator_pb2.SubRequest, calculator_pb2.SubResponse)
+        self._mul_calls = self._unary_calls('Mul', calculator_pb2.MulRequest, calculator_pb2.MulResponse)
+        self._div_calls = self._unary_calls('Div', calculator_pb2.DivRequest, calculator_pb2.DivResponse)
+        self._mod_calls = self._unary_calls('Mod', calculator_pb2.ModRequest, calculator_pb2.ModResponse)
+        # One reusable request per operation; a call only sets a and b
+        self._add_request = calculator_pb2.AddRequest()
+        self._sub_request = calculator_pb2.SubRequest()
+        self._mul_request = calculator_pb2.MulRequest()
+        self._div_request = calculator_pb2.DivRequest()
+        self._mod_request = calculator_pb2.ModRequest()
         self.session_token = None
-        self.current_user = None
+    
+    @property
+    def session_token(self):
+        return self._session_token
+    
+    @session_token.setter
+    def session_token(self, token):
+        # The token travels as metadata, built once per token
+        self._session_token = token
+        self._metadata = auth_metadata(token)
+    
+    def _unary_calls(self, method, request_class, response_class):
+        """Build a Calculator method's callable on every pooled channel
+        
+        Like the generated stub, except each response is parsed into one
+        reused message rather than a new one per call.
+        """
+        response = response_class()
+        
+        def parse_response(data):
+            response.ParseFromString(data)
+            return response
+        
+        return itertools.cycle([
+            channel.unary_unary(
+                f'/cloudgrpc.Calculator/{method}',
+                request_serializer=request_class.SerializeToString,
+                response_deserializer=parse_response,
+                _registered_method=True
+            )
+            for channel in self.channels
+        ])
     
     def send_otp(self, email):
         """Send OTP to email"""
         try:
             response = self.auth_stub.SendOtp(
-                calculator_pb2.SendOtpRequest(email=email)
+                calculator_pb2.SendOtpRequest(email=email),
+                timeout=self.timeout
             )
             print(f"✓ {response.message}")
             return response.success
@@ -34,7 +189,8 @@ class CloudGrpcClient:
         """Verify OTP"""
         try:
             response = self.auth_stub.VerifyOtp(
-                calculator_pb2.VerifyOtpRequest(email=email, otp=otp)
+                calculator_pb2.VerifyOtpRequest(email=email, otp=otp),
+                timeout=self.timeout
             )
             print(f"✓ {response.message}")
             return response.success
@@ -46,7 +202,8 @@ class CloudGrpcClient:
         """Login existing user"""
         try:
             response = self.auth_stub.Login(
-                calculator_pb2.LoginRequest(email=email)
+                calculator_pb2.LoginRequest(email=email),
+                timeout=self.timeout
             )
             self.session_token = response.session_token
             print(f"✓ {response.message}")
@@ -59,10 +216,10 @@ class CloudGrpcClient:
         """Enroll new user"""
         try:
             response = self.auth_stub.Enroll(
-                calculator_pb2.EnrollRequest(email=email, full_name=full_name)
+                calculator_pb2.EnrollRequest(email=email, full_name=full_name),
+                timeout=self.timeout
             )
             self.session_token = response.session_token
-            self.current_user = full_name
             print(f"✓ {response.message}")
             print(f"✓ Session token received!")
             return True
@@ -70,11 +227,47 @@ class CloudGrpcClient:
             print(f"✗ Enrollment failed: [{e.code().name}] {e.details()}")
             return False
     
+    def enroll_with_otp(self, email, full_name, read_otp):
+        """Send the OTP, verify it and enroll over one EnrollmentFlow stream
+        
+        read_otp() is called once the OTP is on its way and returns the
+        code the user entered. Returns True once enrolled.
+        """
+        steps = queue.Queue()
+        # None in the queue ends the request stream
+        responses = self.auth_stub.EnrollmentFlow(iter(steps.get, None))
+        try:
+            steps.put(calculator_pb2.EnrollStep(email=email, full_name=full_name))
+            sent = next(responses)
+            if not sent.success:
+                print(f"✗ {sent.message}")
+                return False
+            print(f"✓ {sent.message}")
+            
+            steps.put(calculator_pb2.EnrollStep(otp=read_otp()))
+            verified = next(responses)
+            if not verified.success:
+                print(f"✗ OTP verification failed: {verified.message}")
+                return False
+            print(f"✓ {verified.message}")
+            
+            enrolled = next(responses)
+            self.session_token = enrolled.session_token
+            print(f"✓ {enrolled.message}")
+            print(f"✓ Session token received!")
+            return True
+        except grpc.RpcError as e:
+            print(f"✗ Enrollment failed: [{e.code().name}] {e.details()}")
+            return False
+        finally:
+            steps.put(None)
+    
     def get_storage_info(self):
         """Get user's storage information"""
         try:
             response = self.auth_stub.GetStorageInfo(
-                calculator_pb2.StorageInfoRequest(session_token=self.session_token)
+                calculator_pb2.StorageInfoRequest(session_token=self.session_token),
+                timeout=self.timeout
             )
             return {
                 'success': response.success,
@@ -89,10 +282,11 @@ class CloudGrpcClient:
     
     def add(self, a, b):
         """Add two numbers"""
+        request = self._add_request
+        request.a = a
+        request.b = b
         try:
-            response = self.calc_stub.Add(
-                calculator_pb2.AddRequest(session_token=self.session_token, a=a, b=b)
-            )
+            response = next(self._add_calls)(request, metadata=self._metadata, timeout=self.timeout)
             return response.result
         except grpc.RpcError as e:
             print(f"✗ Add failed: [{e.code().name}] {e.details()}")
@@ -100,10 +294,11 @@ class CloudGrpcClient:
     
     def sub(self, a, b):
         """Subtract two numbers"""
+        request = self._sub_request
+        request.a = a
+        request.b = b
         try:
-            response = self.calc_stub.Sub(
-                calculator_pb2.SubRequest(session_token=self.session_token, a=a, b=b)
-            )
+            response = next(self._sub_calls)(request, metadata=self._metadata, timeout=self.timeout)
             return response.result
         except grpc.RpcError as e:
             print(f"✗ Sub failed: [{e.code().name}] {e.details()}")
@@ -111,10 +306,11 @@ class CloudGrpcClient:
     
     def mul(self, a, b):
         """Multiply two numbers"""
+        request = self._mul_request
+        request.a = a
+        request.b = b
         try:
-            response = self.calc_stub.Mul(
-                calculator_pb2.MulRequest(session_token=self.session_token, a=a, b=b)
-            )
+            response = next(self._mul_calls)(request, metadata=self._metadata, timeout=self.timeout)
             return response.result
         except grpc.RpcError as e:
             print(f"✗ Mul failed: [{e.code().name}] {e.details()}")
@@ -122,10 +318,11 @@ class CloudGrpcClient:
     
     def div(self, a, b):
         """Divide two numbers"""
+        request = self._div_request
+        request.a = a
+        request.b = b
         try:
-            response = self.calc_stub.Div(
-                calculator_pb2.DivRequest(session_token=self.session_token, a=a, b=b)
-            )
+            response = next(self._div_calls)(request, metadata=self._metadata, timeout=self.timeout)
             return response.result
         except grpc.RpcError as e:
             print(f"✗ Div failed: [{e.code().name}] {e.details()}")
@@ -133,27 +330,230 @@ class CloudGrpcClient:
     
     def mod(self, a, b):
         """Modulo operation"""
+        request = self._mod_request
+        request.a = a
+        request.b = b
         try:
-            response = self.calc_stub.Mod(
-                calculator_pb2.ModRequest(session_token=self.session_token, a=a, b=b)
-            )
+            response = next(self._mod_calls)(request, metadata=self._metadata, timeout=self.timeout)
             return response.result
         except grpc.RpcError as e:
             print(f"✗ Mod failed: [{e.code().name}] {e.details()}")
             return None
     
+    def start(self, op, a, b):
+        """Start one operation ('add', 'sub', 'mul', 'div' or 'mod') without waiting
+        
+        Returns the call's grpc future. Each call gets its own request and
+        response, so any number can be in flight at once.
+        """
+        method, request_class = OPERATION_METHODS[op]
+        stub = next(self._calc_stubs)
+        return getattr(stub, method).future(
+            request_class(a=a, b=b),
+            metadata=self._metadata,
+            timeout=self.timeout
+        )
+    
+    def batch(self, operations):
+        """Run several (op, a, b) operations in one streaming call
+        
+        op is 'add', 'sub', 'mul', 'div' or 'mod'. Returns one result per
+        operation, in order, with None where an operation failed.
+        """
+        requests = (
+            calculator_pb2.CalcRequest(
+                op=OPERATION_CODES[op],
+                a=a,
+                b=b
+            )
+            for op, a, b in operations
+        )
+        try:
+            results = []
+            responses = self.calc_stub.Batch(
+                requests,
+                metadata=self._metadata,
+                compression=STREAM_COMPRESSION
+            )
+            for response in responses:
+                if not response.success:
+                    print(f"✗ {response.message}")
+                results.append(response.result if response.success else None)
+            return results
+        except grpc.RpcError as e:
+            print(f"✗ Batch failed: [{e.code().name}] {e.details()}")
+            return [None] * len(operations)
+    
+    def open_session(self):
+        """Open a streaming calculator session for the logged-in user"""
+        return CalculatorSession(self.calc_stub, self.session_token)
+    
     def close(self):
+        """Close every pooled channel"""
+        for channel in self.channels:
+            channel.close()
+
+
+class CalculatorSession:
+    """One Session stream carrying every operation of an interactive session
+    
+    Requests are queued onto the open stream and each call waits for its
+    answer, so a menu choice costs one message instead of a full RPC.
+    Repeated operations are answered from a cache that lasts as long as
+    the session, without reaching the server.
+    """
+    def __init__(self, calc_stub, session_token):
+        self._calc_stub = calc_stub
+        self._metadata = auth_metadata(session_token)
+        self._open()
+        # (op, a, b) -> result, least recently used first
+        self._results = OrderedDict()
+    
+    def _open(self):
+        """Start a new Session stream"""
+        self._requests = queue.Queue()
+        # None in the queue ends the request stream
+        self._responses = self._calc_stub.Session(
+            iter(self._requests.get, None),
+            metadata=self._metadata,
+            compression=STREAM_COMPRESSION
+        )
+    
+    def calculate(self, op, a, b):
+        """Run one operation ('add', 'sub', 'mul', 'div' or 'mod'); None on failure"""
+        key = (op, a, b)
+        result = self._results.get(key)
+        if result is not None:
+            self._results.move_to_end(key)
+            return result
+        
+        request = calculator_pb2.CalcRequest(
+            op=OPERATION_CODES[op],
+            a=a,
+            b=b
+        )
+        self._requests.put(request)
+        try:
+            response = next(self._responses)
+        except grpc.RpcError as e:
+            print(f"✗ {op.capitalize()} failed: [{e.code().name}] {e.details()}")
+            # A failed stream stays failed; the next operation gets a fresh one
+            self._requests.put(None)
+            self._open()
+            return None
+        
+        if not response.success:
+            print(f"✗ {response.message}")
+            return None
+        
+        self._results[key] = response.result
+        if len(self._results) > SESSION_CACHE_SIZE:
+            self._results.popitem(last=False)
+        return response.result
+    
+    def close(self):
+        """End the session stream and forget its results"""
+        self._requests.put(None)
+        self._results.clear()
+
+
+class AsyncCloudGrpcClient:
+    """Calculator client on grpc.aio, for issuing many calls from one event loop
+    
+    Use it inside a running loop, as an async context manager, with the
+    session token from a logged-in CloudGrpcClient.
+    """
+    def __init__(self, host='localhost:50051', session_token=None, timeout=CALL_TIMEOUT):
+        self.timeout = timeout
+        self.channel = grpc.aio.insecure_channel(host, options=CHANNEL_OPTIONS)
+        self.calc_stub = calculator_pb2_grpc.CalculatorStub(self.channel)
+        self.session_token = session_token
+        self._metadata = auth_metadata(session_token)
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.close()
+    
+    async def add(self, a, b):
+        """Add two numbers"""
+        try:
+            response = await self.calc_stub.Add(
+                calculator_pb2.AddRequest(a=a, b=b),
+                metadata=self._metadata,
+                timeout=self.timeout
+            )
+            return response.result
+        except grpc.RpcError as e:
+            print(f"✗ Add failed: [{e.code().name}] {e.details()}")
+            return None
+    
+    async def sub(self, a, b):
+        """Subtract two numbers"""
+        try:
+            response = await self.calc_stub.Sub(
+                calculator_pb2.SubRequest(a=a, b=b),
+                metadata=self._metadata,
+                timeout=self.timeout
+            )
+            return response.result
+        except grpc.RpcError as e:
+            print(f"✗ Sub failed: [{e.code().name}] {e.details()}")
+            return None
+    
+    async def mul(self, a, b):
+        """Multiply two numbers"""
+        try:
+            response = await self.calc_stub.Mul(
+                calculator_pb2.MulRequest(a=a, b=b),
+                metadata=self._metadata,
+                timeout=self.timeout
+            )
+            return response.result
+        except grpc.RpcError as e:
+            print(f"✗ Mul failed: [{e.code().name}] {e.details()}")
+            return None
+    
+    async def div(self, a, b):
+        """Divide two numbers"""
+        try:
+            response = await self.calc_stub.Div(
+                calculator_pb2.DivRequest(a=a, b=b),
+                metadata=self._metadata,
+                timeout=self.timeout
+            )
+            return response.result
+        except grpc.RpcError as e:
+            print(f"✗ Div failed: [{e.code().name}] {e.details()}")
+            return None
+    
+    async def mod(self, a, b):
+        """Modulo operation"""
+        try:
+            response = await self.calc_stub.Mod(
+                calculator_pb2.ModRequest(a=a, b=b),
+                metadata=self._metadata,
+                timeout=self.timeout
+            )
+            return response.result
+        except grpc.RpcError as e:
+            print(f"✗ Mod failed: [{e.code().name}] {e.details()}")
+            return None
+    
+    async def close(self):
         """Close the channel"""
-        self.channel.close()
+        await self.channel.close()
 
 
 def format_bytes(bytes_value):
     """Format bytes to human-readable format"""
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if bytes_value < 1024.0:
-            return f"{bytes_value:.2f} {unit}"
-        bytes_value /= 1024.0
-    return f"{bytes_value:.2f} TB"
+    bytes_value = int(bytes_value)
+    if bytes_value < 1024:
+        return f"{bytes_value:.2f} B"
+    # Every 10 bits is one unit up
+    index = min((bytes_value.bit_length() - 1) // 10, len(BYTE_UNITS) - 1)
+    return f"{bytes_value / (1 << (10 * index)):.2f} {BYTE_UNITS[index]}"
 
 
 def display_storage_info(client):
@@ -161,37 +561,37 @@ def display_storage_info(client):
     storage_info = client.get_storage_info()
     
     if storage_info:
-        print("\n" + "="*60)
+        print("\n" + SEPARATOR)
         print("STORAGE INFORMATION")
-        print("="*60)
+        print(SEPARATOR)
         print(f"Allocated:  {format_bytes(storage_info['allocated'])}")
         print(f"Used:       {format_bytes(storage_info['used'])}")
         print(f"Available:  {format_bytes(storage_info['available'])}")
         print(f"Usage:      {storage_info['usage_percentage']:.2f}%")
         
         # Visual progress bar
-        bar_length = 40
+        bar_length = len(STORAGE_BARS) - 1
         filled_length = int(bar_length * storage_info['usage_percentage'] / 100)
-        bar = '█' * filled_length + '░' * (bar_length - filled_length)
+        bar = STORAGE_BARS[max(0, min(filled_length, bar_length))]
         print(f"[{bar}] {storage_info['usage_percentage']:.2f}%")
-        print("="*60)
+        print(SEPARATOR)
 
 
 def calculator_menu(client):
     """Interactive calculator menu"""
+    # Operations share one stream for as long as the user stays logged in
+    session = client.open_session()
+    try:
+        run_calculator_menu(client, session)
+    finally:
+        session.close()
+
+
+def run_calculator_menu(client, session):
+    """Menu loop; each operation goes over the open session"""
     while True:
-        print("\n" + "="*60)
-        print("CALCULATOR OPERATIONS")
-        print("="*60)
-        print("1. Addition")
-        print("2. Subtraction")
-        print("3. Multiplication")
-        print("4. Division")
-        print("5. Modulo")
-        print("6. Run Concurrent Operations Demo")
-        print("7. View Storage Information")
-        print("8. Logout")
-        print("="*60)
+        # input() flushes the menu along with its prompt
+        sys.stdout.write(CALCULATOR_MENU)
         
         choice = input("Select operation (1-8): ").strip()
         
@@ -207,46 +607,38 @@ def calculator_menu(client):
             run_concurrent_demo(client)
             continue
         
-        if choice not in ['1', '2', '3', '4', '5']:
+        operation = MENU_OPERATIONS.get(choice)
+        if operation is None:
             print("✗ Invalid choice! Please select 1-8.")
             continue
         
+        a = read_int("Enter first number: ")
+        b = read_int("Enter second number: ") if a is not None else None
+        if b is None:
+            print("✗ Invalid input! Please enter valid numbers.")
+            continue
+        
         try:
-            a = int(input("Enter first number: ").strip())
-            b = int(input("Enter second number: ").strip())
-            
-            result = None
-            if choice == '1':
-                result = client.add(a, b)
-                op = "+"
-            elif choice == '2':
-                result = client.sub(a, b)
-                op = "-"
-            elif choice == '3':
-                result = client.mul(a, b)
-                op = "*"
-            elif choice == '4':
-                result = client.div(a, b)
-                op = "//"
-            elif choice == '5':
-                result = client.mod(a, b)
-                op = "%"
-            
+            result = session.calculate(operation, a, b)
             if result is not None:
-                print(f"\n✓ Result: {a} {op} {b} = {result}")
-        
-        except ValueError:
-            print("✗ Invalid input! Please enter valid numbers.")
+                print(f"\n✓ Result: {a} {OPERATION_SYMBOLS[operation]} {b} = {result}")
         except Exception as e:
             print(f"✗ Error: {e}")
 
 
+def read_int(prompt):
+    """Read a whole number, or return None if the input is not one"""
+    raw = input(prompt).strip()
+    digits = raw[1:] if raw[:1] in ('-', '+') else raw
+    return int(raw) if digits.isdecimal() else None
+
+
 def run_concurrent_demo(client):
     """Run concurrent calculator operations"""
-    print("\n" + "="*60)
+    print("\n" + SEPARATOR)
     print("CONCURRENT OPERATIONS DEMO")
-    print("="*60)
-    print("Running 4 operations concurrently...")
+    print(SEPARATOR)
+    print("Running 4 operations concurrently...", flush=True)
     
     operations = [
         ('add', 633, 27),
@@ -255,47 +647,44 @@ def run_concurrent_demo(client):
         ('mod', 633, 27)
     ]
     
-    with ThreadPoolExecutor(max_workers=4) as executor:
-        futures = []
-        for op, a, b in operations:
-            if op == 'add':
-                future = executor.submit(client.add, a, b)
-            elif op == 'sub':
-                future = executor.submit(client.sub, a, b)
-            elif op == 'div':
-                future = executor.submit(client.div, a, b)
-            elif op == 'mod':
-                future = executor.submit(client.mod, a, b)
-            futures.append((op, a, b, future))
-        
-        # Display results
-        for op, a, b, future in futures:
-            result = future.result()
-            if result is not None:
-                op_symbol = {
-                    'add': '+', 'sub': '-', 'div': '//', 'mod': '%'
-                }[op]
-                print(f"  ✓ {a} {op_symbol} {b} = {result}")
+    # All four calls are in flight at once on the pooled channels; no worker threads
+    results = run_concurrent_operations(client, operations)
+    
+    # Display results
+    for (op, a, b), result in zip(operations, results):
+        if result is not None:
+            print(f"  ✓ {a} {OPERATION_SYMBOLS[op]} {b} = {result}")
     
     print("\n✓ All concurrent operations completed!")
 
 
+def run_concurrent_operations(client, operations):
+    """Start every (op, a, b) operation as a gRPC future; results in order"""
+    futures = [client.start(op, a, b) for op, a, b in operations]
+    results = []
+    for (op, a, b), future in zip(operations, futures):
+        try:
+            results.append(future.result().result)
+        except grpc.RpcError as e:
+            print(f"✗ {op.capitalize()} failed: [{e.code().name}] {e.details()}")
+            results.append(None)
+    return results
+
+
 def main():
     """Main application loop"""
-    print("="*60)
+    # Block-buffer the console: input() flushes each menu and its output in
+    # one write, and progress lines before a slow call flush themselves
+    sys.stdout.reconfigure(line_buffering=False)
+    
+    print(SEPARATOR)
     print("CloudGrpc - Secure Calculator Service")
-    print("="*60)
+    print(SEPARATOR)
     
     client = CloudGrpcClient()
     
     while True:
-        print("\n" + "="*60)
-        print("MAIN MENU")
-        print("="*60)
-        print("1. Login (Existing User)")
-        print("2. Enroll (New User)")
-        print("3. Exit")
-        print("="*60)
+        sys.stdout.write(MAIN_MENU)
         
         choice = input("Select option (1-3): ").strip()
         
@@ -306,16 +695,16 @@ def main():
         
         if choice == '1':
             # LOGIN FLOW (Existing User)
-            print("\n" + "-"*60)
+            print("\n" + DIVIDER)
             print("LOGIN - Existing User")
-            print("-"*60)
+            print(DIVIDER)
             
             email = input("Enter your email: ").strip()
             if not email or '@' not in email:
                 print("✗ Invalid email address!")
                 continue
             
-            print(f"\n📧 Sending OTP to {email}...")
+            print(f"\n📧 Sending OTP to {email}...", flush=True)
             if not client.send_otp(email):
                 continue
             
@@ -323,20 +712,20 @@ def main():
             if not client.verify_otp(email, otp):
                 continue
             
-            print(f"\n🔐 Logging in...")
+            print(f"\n🔐 Logging in...", flush=True)
             if not client.login(email):
                 continue
             
             # Successfully logged in, go to calculator menu
-            print(f"\n✓ Welcome back!")
+            print(f"\n✓ Welcome back!", flush=True)
             display_storage_info(client)
             calculator_menu(client)
         
         elif choice == '2':
             # ENROLLMENT FLOW (New User)
-            print("\n" + "-"*60)
+            print("\n" + DIVIDER)
             print("ENROLLMENT - New User")
-            print("-"*60)
+            print(DIVIDER)
             
             email = input("Enter your email: ").strip()
             if not email or '@' not in email:
@@ -348,20 +737,18 @@ def main():
                 print("✗ Name cannot be empty!")
                 continue
             
-            print(f"\n📧 Sending OTP to {email}...")
-            if not client.send_otp(email):
-                continue
-            
-            otp = input("\nEnter the OTP sent to your email: ").strip()
-            if not client.verify_otp(email, otp):
-                continue
+            def read_otp():
+                otp = input("\nEnter the OTP sent to your email: ").strip()
+                print(f"\n📝 Verifying OTP and enrolling {full_name}...", flush=True)
+                return otp
             
-            print(f"\n📝 Enrolling {full_name}...")
-            if not client.enroll(email, full_name):
+            # OTP, verification and enrollment share one stream
+            print(f"\n📧 Sending OTP to {email}...", flush=True)
+            if not client.enroll_with_otp(email, full_name, read_otp):
                 continue
             
             # Successfully enrolled, go to calculator menu
-            print(f"\n✓ Welcome, {full_name}!")
+            print(f"\n✓ Welcome, {full_name}!", flush=True)
             display_storage_info(client)
             calculator_menu(client)
         
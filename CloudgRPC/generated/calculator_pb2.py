@@ -24,69 +24,77 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x10\x63\x61lculator.proto\x12\tcloudgrpc\"9\n\nAddRequest\x12\x15\n\rsession_token\x18\x01 \x01(\t\x12\t\n\x01\x61\x18\x02 \x01(\x03\x12\t\n\x01\x62\x18\x03 \x01(\x03\"?\n\x0b\x41\x64\x64Response\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x0e\n\x06result\x18\x03 \x01(\x03\"9\n\nSubRequest\x12\x15\n\rsession_token\x18\x01 \x01(\t\x12\t\n\x01\x61\x18\x02 \x01(\x03\x12\t\n\x01\x62\x18\x03 \x01(\x03\"?\n\x0bSubResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x0e\n\x06result\x18\x03 \x01(\x03\"9\n\nMulRequest\x12\x15\n\rsession_token\x18\x01 \x01(\t\x12\t\n\x01\x61\x18\x02 \x01(\x03\x12\t\n\x01\x62\x18\x03 \x01(\x03\"?\n\x0bMulResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x0e\n\x06result\x18\x03 \x01(\x03\"9\n\nDivRequest\x12\x15\n\rsession_token\x18\x01 \x01(\t\x12\t\n\x01\x61\x18\x02 \x01(\x03\x12\t\n\x01\x62\x18\x03 \x01(\x03\"?\n\x0b\x44ivResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x0e\n\x06result\x18\x03 \x01(\x03\"9\n\nModRequest\x12\x15\n\rsession_token\x18\x01 \x01(\t\x12\t\n\x01\x61\x18\x02 \x01(\x03\x12\t\n\x01\x62\x18\x03 \x01(\x03\"?\n\x0bModResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x0e\n\x06result\x18\x03 \x01(\x03\"\x1f\n\x0eSendOtpRequest\x12\r\n\x05\x65mail\x18\x01 \x01(\t\"3\n\x0fSendOtpResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\".\n\x10VerifyOtpRequest\x12\r\n\x05\x65mail\x18\x01 \x01(\t\x12\x0b\n\x03otp\x18\x02 \x01(\t\"5\n\x11VerifyOtpResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\"\x1d\n\x0cLoginRequest\x12\r\n\x05\x65mail\x18\x01 \x01(\t\"H\n\rLoginResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x15\n\rsession_token\x18\x03 \x01(\t\"1\n\rEnrollRequest\x12\r\n\x05\x65mail\x18\x01 \x01(\t\x12\x11\n\tfull_name\x18\x02 \x01(\t\"I\n\x0e\x45nrollResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x15\n\rsession_token\x18\x03 \x01(\t\"+\n\x12StorageInfoRequest\x12\x15\n\rsession_token\x18\x01 \x01(\t\"\x97\x01\n\x13StorageInfoResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x17\n\x0f\x61llocated_bytes\x18\x03 \x01(\x03\x12\x12\n\nused_bytes\x18\x04 \x01(\x03\x12\x17\n\x0f\x61vailable_bytes\x18\x05 \x01(\x03\x12\x18\n\x10usage_percentage\x18\x06 \x01(\x01\"(\n\x13SystemStatusRequest\x12\x11\n\tadmin_key\x18\x01 \x01(\t\"\x93\x02\n\x14SystemStatusResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x1d\n\x15global_capacity_bytes\x18\x03 \x01(\x03\x12\x1e\n\x16global_allocated_bytes\x18\x04 \x01(\x03\x12\x1e\n\x16global_available_bytes\x18\x05 \x01(\x03\x12\x19\n\x11global_used_bytes\x18\x06 \x01(\x03\x12\x13\n\x0btotal_users\x18\x07 \x01(\x05\x12\x11\n\tmax_users\x18\x08 \x01(\x05\x12\x1d\n\x15\x61llocation_percentage\x18\t \x01(\x01\x12\x18\n\x10usage_percentage\x18\n \x01(\x01\"B\n\x14UpdateStorageRequest\x12\x11\n\tadmin_key\x18\x01 \x01(\t\x12\x17\n\x0fnew_capacity_gb\x18\x02 \x01(\x03\"q\n\x15UpdateStorageResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x1a\n\x12old_capacity_bytes\x18\x03 \x01(\x03\x12\x1a\n\x12new_capacity_bytes\x18\x04 \x01(\x03\"(\n\x13SystemEventsRequest\x12\x11\n\tadmin_key\x18\x01 \x01(\t\"q\n\x0bSystemEvent\x12\x12\n\nevent_type\x18\x01 \x01(\t\x12\x11\n\ttimestamp\x18\x02 \x01(\t\x12\x0f\n\x07message\x18\x03 \x01(\t\x12\x12\n\nuser_email\x18\x04 \x01(\t\x12\x16\n\x0estorage_change\x18\x05 \x01(\x03\x32\x9a\x02\n\nCalculator\x12\x34\n\x03\x41\x64\x64\x12\x15.cloudgrpc.AddRequest\x1a\x16.cloudgrpc.AddResponse\x12\x34\n\x03Sub\x12\x15.cloudgrpc.SubRequest\x1a\x16.cloudgrpc.SubResponse\x12\x34\n\x03Mul\x12\x15.cloudgrpc.MulRequest\x1a\x16.cloudgrpc.MulResponse\x12\x34\n\x03\x44iv\x12\x15.cloudgrpc.DivRequest\x1a\x16.cloudgrpc.DivResponse\x12\x34\n\x03Mod\x12\x15.cloudgrpc.ModRequest\x1a\x16.cloudgrpc.ModResponse2\xe3\x02\n\x0b\x41uthService\x12@\n\x07SendOtp\x12\x19.cloudgrpc.SendOtpRequest\x1a\x1a.cloudgrpc.SendOtpResponse\x12\x46\n\tVerifyOtp\x12\x1b.cloudgrpc.VerifyOtpRequest\x1a\x1c.cloudgrpc.VerifyOtpResponse\x12:\n\x05Login\x12\x17.cloudgrpc.LoginRequest\x1a\x18.cloudgrpc.LoginResponse\x12=\n\x06\x45nroll\x12\x18.cloudgrpc.EnrollRequest\x1a\x19.cloudgrpc.EnrollResponse\x12O\n\x0eGetStorageInfo\x12\x1d.cloudgrpc.StorageInfoRequest\x1a\x1e.cloudgrpc.StorageInfoResponse2\x8c\x02\n\x0c\x41\x64minService\x12R\n\x0fGetSystemStatus\x12\x1e.cloudgrpc.SystemStatusRequest\x1a\x1f.cloudgrpc.SystemStatusResponse\x12X\n\x13UpdateGlobalStorage\x12\x1f.cloudgrpc.UpdateStorageRequest\x1a .cloudgrpc.UpdateStorageResponse\x12N\n\x12StreamSystemEvents\x12\x1e.cloudgrpc.SystemEventsRequest\x1a\x16.cloudgrpc.SystemEvent0\x01\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x10\x63\x61lculator.proto\x12\tcloudgrpc\"(\n\nAddRequest\x12\t\n\x01\x61\x18\x02 \x01(\x03\x12\t\n\x01\x62\x18\x03 \x01(\x03J\x04\x08\x01\x10\x02\"?\n\x0b\x41\x64\x64Response\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x0e\n\x06result\x18\x03 \x01(\x03\"(\n\nSubRequest\x12\t\n\x01\x61\x18\x02 \x01(\x03\x12\t\n\x01\x62\x18\x03 \x01(\x03J\x04\x08\x01\x10\x02\"?\n\x0bSubResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x0e\n\x06result\x18\x03 \x01(\x03\"(\n\nMulRequest\x12\t\n\x01\x61\x18\x02 \x01(\x03\x12\t\n\x01\x62\x18\x03 \x01(\x03J\x04\x08\x01\x10\x02\"?\n\x0bMulResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x0e\n\x06result\x18\x03 \x01(\x03\"(\n\nDivRequest\x12\t\n\x01\x61\x18\x02 \x01(\x03\x12\t\n\x01\x62\x18\x03 \x01(\x03J\x04\x08\x01\x10\x02\"?\n\x0b\x44ivResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x0e\n\x06result\x18\x03 \x01(\x03\"(\n\nModRequest\x12\t\n\x01\x61\x18\x02 \x01(\x03\x12\t\n\x01\x62\x18\x03 \x01(\x03J\x04\x08\x01\x10\x02\"?\n\x0bModResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x0e\n\x06result\x18\x03 \x01(\x03\"K\n\x0b\x43\x61lcRequest\x12 \n\x02op\x18\x02 \x01(\x0e\x32\x14.cloudgrpc.Operation\x12\t\n\x01\x61\x18\x03 \x01(\x03\x12\t\n\x01\x62\x18\x04 \x01(\x03J\x04\x08\x01\x10\x02\"@\n\x0c\x43\x61lcResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x0e\n\x06result\x18\x03 \x01(\x03\"\x1f\n\x0eSendOtpRequest\x12\r\n\x05\x65mail\x18\x01 \x01(\t\"3\n\x0fSendOtpResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\".\n\x10VerifyOtpRequest\x12\r\n\x05\x65mail\x18\x01 \x01(\t\x12\x0b\n\x03otp\x18\x02 \x01(\t\"5\n\x11VerifyOtpResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\"\x1d\n\x0cLoginRequest\x12\r\n\x05\x65mail\x18\x01 \x01(\t\"H\n\rLoginResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x15\n\rsession_token\x18\x03 \x01(\t\"1\n\rEnrollRequest\x12\r\n\x05\x65mail\x18\x01 \x01(\t\x12\x11\n\tfull_name\x18\x02 \x01(\t\"I\n\x0e\x45nrollResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x15\n\rsession_token\x18\x03 \x01(\t\"t\n\nEnrollStep\x12\r\n\x05\x65mail\x18\x01 \x01(\t\x12\x11\n\tfull_name\x18\x02 \x01(\t\x12\x0b\n\x03otp\x18\x03 \x01(\t\x12\x0f\n\x07success\x18\x04 \x01(\x08\x12\x0f\n\x07message\x18\x05 \x01(\t\x12\x15\n\rsession_token\x18\x06 \x01(\t\"+\n\x12StorageInfoRequest\x12\x15\n\rsession_token\x18\x01 \x01(\t\"\x97\x01\n\x13StorageInfoResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x17\n\x0f\x61llocated_bytes\x18\x03 \x01(\x03\x12\x12\n\nused_bytes\x18\x04 \x01(\x03\x12\x17\n\x0f\x61vailable_bytes\x18\x05 \x01(\x03\x12\x18\n\x10usage_percentage\x18\x06 \x01(\x01\"(\n\x13SystemStatusRequest\x12\x11\n\tadmin_key\x18\x01 \x01(\t\"\x93\x02\n\x14SystemStatusResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x1d\n\x15global_capacity_bytes\x18\x03 \x01(\x03\x12\x1e\n\x16global_allocated_bytes\x18\x04 \x01(\x03\x12\x1e\n\x16global_available_bytes\x18\x05 \x01(\x03\x12\x19\n\x11global_used_bytes\x18\x06 \x01(\x03\x12\x13\n\x0btotal_users\x18\x07 \x01(\x05\x12\x11\n\tmax_users\x18\x08 \x01(\x05\x12\x1d\n\x15\x61llocation_percentage\x18\t \x01(\x01\x12\x18\n\x10usage_percentage\x18\n \x01(\x01\"B\n\x14UpdateStorageRequest\x12\x11\n\tadmin_key\x18\x01 \x01(\t\x12\x17\n\x0fnew_capacity_gb\x18\x02 \x01(\x03\"q\n\x15UpdateStorageResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x1a\n\x12old_capacity_bytes\x18\x03 \x01(\x03\x12\x1a\n\x12new_capacity_bytes\x18\x04 \x01(\x03\"(\n\x13SystemEventsRequest\x12\x11\n\tadmin_key\x18\x01 \x01(\t\"q\n\x0bSystemEvent\x12\x12\n\nevent_type\x18\x01 \x01(\t\x12\x11\n\ttimestamp\x18\x02 \x01(\t\x12\x0f\n\x07message\x18\x03 \x01(\t\x12\x12\n\nuser_email\x18\x04 \x01(\t\x12\x16\n\x0estorage_change\x18\x05 \x01(\x03*G\n\tOperation\x12\n\n\x06OP_ADD\x10\x00\x12\n\n\x06OP_SUB\x10\x01\x12\n\n\x06OP_MUL\x10\x02\x12\n\n\x06OP_DIV\x10\x03\x12\n\n\x06OP_MOD\x10\x04\x32\x98\x03\n\nCalculator\x12\x34\n\x03\x41\x64\x64\x12\x15.cloudgrpc.AddRequest\x1a\x16.cloudgrpc.AddResponse\x12\x34\n\x03Sub\x12\x15.cloudgrpc.SubRequest\x1a\x16.cloudgrpc.SubResponse\x12\x34\n\x03Mul\x12\x15.cloudgrpc.MulRequest\x1a\x16.cloudgrpc.MulResponse\x12\x34\n\x03\x44iv\x12\x15.cloudgrpc.DivRequest\x1a\x16.cloudgrpc.DivResponse\x12\x34\n\x03Mod\x12\x15.cloudgrpc.ModRequest\x1a\x16.cloudgrpc.ModResponse\x12<\n\x05\x42\x61tch\x12\x16.cloudgrpc.CalcRequest\x1a\x17.cloudgrpc.CalcResponse(\x01\x30\x01\x12>\n\x07Session\x12\x16.cloudgrpc.CalcRequest\x1a\x17.cloudgrpc.CalcResponse(\x01\x30\x01\x32\xa7\x03\n\x0b\x41uthService\x12@\n\x07SendOtp\x12\x19.cloudgrpc.SendOtpRequest\x1a\x1a.cloudgrpc.SendOtpResponse\x12\x46\n\tVerifyOtp\x12\x1b.cloudgrpc.VerifyOtpRequest\x1a\x1c.cloudgrpc.VerifyOtpResponse\x12:\n\x05Login\x12\x17.cloudgrpc.LoginRequest\x1a\x18.cloudgrpc.LoginResponse\x12=\n\x06\x45nroll\x12\x18.cloudgrpc.EnrollRequest\x1a\x19.cloudgrpc.EnrollResponse\x12\x42\n\x0e\x45nrollmentFlow\x12\x15.cloudgrpc.EnrollStep\x1a\x15.cloudgrpc.EnrollStep(\x01\x30\x01\x12O\n\x0eGetStorageInfo\x12\x1d.cloudgrpc.StorageInfoRequest\x1a\x1e.cloudgrpc.StorageInfoResponse2\x8c\x02\n\x0c\x41\x64minService\x12R\n\x0fGetSystemStatus\x12\x1e.cloudgrpc.SystemStatusRequest\x1a\x1f.cloudgrpc.SystemStatusResponse\x12X\n\x13UpdateGlobalStorage\x12\x1f.cloudgrpc.UpdateStorageRequest\x1a .cloudgrpc.UpdateStorageResponse\x12N\n\x12StreamSystemEvents\x12\x1e.cloudgrpc.SystemEventsRequest\x1a\x16.cloudgrpc.SystemEvent0\x01\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'calculator_pb2', _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
+  _globals['_OPERATION']._serialized_start=2106
+  _globals['_OPERATION']._serialized_end=2177
   _globals['_ADDREQUEST']._serialized_start=31
-  _globals['_ADDREQUEST']._serialized_end=88
-  _globals['_ADDRESPONSE']._serialized_start=90
-  _globals['_ADDRESPONSE']._serialized_end=153
-  _globals['_SUBREQUEST']._serialized_start=155
-  _globals['_SUBREQUEST']._serialized_end=212
-  _globals['_SUBRESPONSE']._serialized_start=214
-  _globals['_SUBRESPONSE']._serialized_end=277
-  _globals['_MULREQUEST']._serialized_start=279
-  _globals['_MULREQUEST']._serialized_end=336
-  _globals['_MULRESPONSE']._serialized_start=338
-  _globals['_MULRESPONSE']._serialized_end=401
-  _globals['_DIVREQUEST']._serialized_start=403
-  _globals['_DIVREQUEST']._serialized_end=460
-  _globals['_DIVRESPONSE']._serialized_start=462
-  _globals['_DIVRESPONSE']._serialized_end=525
-  _globals['_MODREQUEST']._serialized_start=527
-  _globals['_MODREQUEST']._serialized_end=584
-  _globals['_MODRESPONSE']._serialized_start=586
-  _globals['_MODRESPONSE']._serialized_end=649
-  _globals['_SENDOTPREQUEST']._serialized_start=651
-  _globals['_SENDOTPREQUEST']._serialized_end=682
-  _globals['_SENDOTPRESPONSE']._serialized_start=684
-  _globals['_SENDOTPRESPONSE']._serialized_end=735
-  _globals['_VERIFYOTPREQUEST']._serialized_start=737
-  _globals['_VERIFYOTPREQUEST']._serialized_end=783
-  _globals['_VERIFYOTPRESPONSE']._serialized_start=785
-  _globals['_VERIFYOTPRESPONSE']._serialized_end=838
-  _globals['_LOGINREQUEST']._serialized_start=840
-  _globals['_LOGINREQUEST']._serialized_end=869
-  _globals['_LOGINRESPONSE']._serialized_start=871
-  _globals['_LOGINRESPONSE']._serialized_end=943
-  _globals['_ENROLLREQUEST']._serialized_start=945
-  _globals['_ENROLLREQUEST']._serialized_end=994
-  _globals['_ENROLLRESPONSE']._serialized_start=996
-  _globals['_ENROLLRESPONSE']._serialized_end=1069
-  _globals['_STORAGEINFOREQUEST']._serialized_start=1071
-  _globals['_STORAGEINFOREQUEST']._serialized_end=1114
-  _globals['_STORAGEINFORESPONSE']._serialized_start=1117
-  _globals['_STORAGEINFORESPONSE']._serialized_end=1268
-  _globals['_SYSTEMSTATUSREQUEST']._serialized_start=1270
-  _globals['_SYSTEMSTATUSREQUEST']._serialized_end=1310
-  _globals['_SYSTEMSTATUSRESPONSE']._serialized_start=1313
-  _globals['_SYSTEMSTATUSRESPONSE']._serialized_end=1588
-  _globals['_UPDATESTORAGEREQUEST']._serialized_start=1590
-  _globals['_UPDATESTORAGEREQUEST']._serialized_end=1656
-  _globals['_UPDATESTORAGERESPONSE']._serialized_start=1658
-  _globals['_UPDATESTORAGERESPONSE']._serialized_end=1771
-  _globals['_SYSTEMEVENTSREQUEST']._serialized_start=1773
-  _globals['_SYSTEMEVENTSREQUEST']._serialized_end=1813
-  _globals['_SYSTEMEVENT']._serialized_start=1815
-  _globals['_SYSTEMEVENT']._serialized_end=1928
-  _globals['_CALCULATOR']._serialized_start=1931
-  _globals['_CALCULATOR']._serialized_end=2213
-  _globals['_AUTHSERVICE']._serialized_start=2216
-  _globals['_AUTHSERVICE']._serialized_end=2571
-  _globals['_ADMINSERVICE']._serialized_start=2574
-  _globals['_ADMINSERVICE']._serialized_end=2842
+  _globals['_ADDREQUEST']._serialized_end=71
+  _globals['_ADDRESPONSE']._serialized_start=73
+  _globals['_ADDRESPONSE']._serialized_end=136
+  _globals['_SUBREQUEST']._serialized_start=138
+  _globals['_SUBREQUEST']._serialized_end=178
+  _globals['_SUBRESPONSE']._serialized_start=180
+  _globals['_SUBRESPONSE']._serialized_end=243
+  _globals['_MULREQUEST']._serialized_start=245
+  _globals['_MULREQUEST']._serialized_end=285
+  _globals['_MULRESPONSE']._serialized_start=287
+  _globals['_MULRESPONSE']._serialized_end=350
+  _globals['_DIVREQUEST']._serialized_start=352
+  _globals['_DIVREQUEST']._serialized_end=392
+  _globals['_DIVRESPONSE']._serialized_start=394
+  _globals['_DIVRESPONSE']._serialized_end=457
+  _globals['_MODREQUEST']._serialized_start=459
+  _globals['_MODREQUEST']._serialized_end=499
+  _globals['_MODRESPONSE']._serialized_start=501
+  _globals['_MODRESPONSE']._serialized_end=564
+  _globals['_CALCREQUEST']._serialized_start=566
+  _globals['_CALCREQUEST']._serialized_end=641
+  _globals['_CALCRESPONSE']._serialized_start=643
+  _globals['_CALCRESPONSE']._serialized_end=707
+  _globals['_SENDOTPREQUEST']._serialized_start=709
+  _globals['_SENDOTPREQUEST']._serialized_end=740
+  _globals['_SENDOTPRESPONSE']._serialized_start=742
+  _globals['_SENDOTPRESPONSE']._serialized_end=793
+  _globals['_VERIFYOTPREQUEST']._serialized_start=795
+  _globals['_VERIFYOTPREQUEST']._serialized_end=841
+  _globals['_VERIFYOTPRESPONSE']._serialized_start=843
+  _globals['_VERIFYOTPRESPONSE']._serialized_end=896
+  _globals['_LOGINREQUEST']._serialized_start=898
+  _globals['_LOGINREQUEST']._serialized_end=927
+  _globals['_LOGINRESPONSE']._serialized_start=929
+  _globals['_LOGINRESPONSE']._serialized_end=1001
+  _globals['_ENROLLREQUEST']._serialized_start=1003
+  _globals['_ENROLLREQUEST']._serialized_end=1052
+  _globals['_ENROLLRESPONSE']._serialized_start=1054
+  _globals['_ENROLLRESPONSE']._serialized_end=1127
+  _globals['_ENROLLSTEP']._serialized_start=1129
+  _globals['_ENROLLSTEP']._serialized_end=1245
+  _globals['_STORAGEINFOREQUEST']._serialized_start=1247
+  _globals['_STORAGEINFOREQUEST']._serialized_end=1290
+  _globals['_STORAGEINFORESPONSE']._serialized_start=1293
+  _globals['_STORAGEINFORESPONSE']._serialized_end=1444
+  _globals['_SYSTEMSTATUSREQUEST']._serialized_start=1446
+  _globals['_SYSTEMSTATUSREQUEST']._serialized_end=1486
+  _globals['_SYSTEMSTATUSRESPONSE']._serialized_start=1489
+  _globals['_SYSTEMSTATUSRESPONSE']._serialized_end=1764
+  _globals['_UPDATESTORAGEREQUEST']._serialized_start=1766
+  _globals['_UPDATESTORAGEREQUEST']._serialized_end=1832
+  _globals['_UPDATESTORAGERESPONSE']._serialized_start=1834
+  _globals['_UPDATESTORAGERESPONSE']._serialized_end=1947
+  _globals['_SYSTEMEVENTSREQUEST']._serialized_start=1949
+  _globals['_SYSTEMEVENTSREQUEST']._serialized_end=1989
+  _globals['_SYSTEMEVENT']._serialized_start=1991
+  _globals['_SYSTEMEVENT']._serialized_end=2104
+  _globals['_CALCULATOR']._serialized_start=2180
+  _globals['_CALCULATOR']._serialized_end=2588
+  _globals['_AUTHSERVICE']._serialized_start=2591
+  _globals['_AUTHSERVICE']._serialized_end=3014
+  _globals['_ADMINSERVICE']._serialized_start=3017
+  _globals['_ADMINSERVICE']._serialized_end=3285
 # @@protoc_insertion_point(module_scope)
@@ -27,6 +27,7 @@ if _version_not_supported:
 
 class CalculatorStub(object):
     """Calculator Service
+    Every call carries the session token as 'authorization: Bearer <token>' metadata
     """
 
     def __init__(self, channel):
@@ -60,10 +61,21 @@ class CalculatorStub(object):
                 request_serializer=calculator__pb2.ModRequest.SerializeToString,
                 response_deserializer=calculator__pb2.ModResponse.FromString,
                 _registered_method=True)
+        self.Batch = channel.stream_stream(
+                '/cloudgrpc.Calculator/Batch',
+                request_serializer=calculator__pb2.CalcRequest.SerializeToString,
+                response_deserializer=calculator__pb2.CalcResponse.FromString,
+                _registered_method=True)
+        self.Session = channel.stream_stream(
+                '/cloudgrpc.Calculator/Session',
+                request_serializer=calculator__pb2.CalcRequest.SerializeToString,
+                response_deserializer=calculator__pb2.CalcResponse.FromString,
+                _registered_method=True)
 
 
 class CalculatorServicer(object):
     """Calculator Service
+    Every call carries the session token as 'authorization: Bearer <token>' metadata
     """
 
     def Add(self, request, context):
@@ -96,6 +108,19 @@ class CalculatorServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def Batch(self, request_iterator, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def Session(self, request_iterator, context):
+        """Long-lived stream for one client session
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_CalculatorServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -124,6 +149,16 @@ def add_CalculatorServicer_to_server(servicer, server):
                     request_deserializer=calculator__pb2.ModRequest.FromString,
                     response_serializer=calculator__pb2.ModResponse.SerializeToString,
             ),
+            'Batch': grpc.stream_stream_rpc_method_handler(
+                    servicer.Batch,
+                    request_deserializer=calculator__pb2.CalcRequest.FromString,
+                    response_serializer=calculator__pb2.CalcResponse.SerializeToString,
+            ),
+            'Session': grpc.stream_stream_rpc_method_handler(
+                    servicer.Session,
+                    request_deserializer=calculator__pb2.CalcRequest.FromString,
+                    response_serializer=calculator__pb2.CalcResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'cloudgrpc.Calculator', rpc_method_handlers)
@@ -134,6 +169,7 @@ def add_CalculatorServicer_to_server(servicer, server):
  # This class is part of an EXPERIMENTAL API.
 class Calculator(object):
     """Calculator Service
+    Every call carries the session token as 'authorization: Bearer <token>' metadata
     """
 
     @staticmethod
@@ -271,6 +307,60 @@ class Calculator(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def Batch(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(
+            request_iterator,
+            target,
+            '/cloudgrpc.Calculator/Batch',
+            calculator__pb2.CalcRequest.SerializeToString,
+            calculator__pb2.CalcResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def Session(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(
+            request_iterator,
+            target,
+            '/cloudgrpc.Calculator/Session',
+            calculator__pb2.CalcRequest.SerializeToString,
+            calculator__pb2.CalcResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
 
 class AuthServiceStub(object):
     """Authentication Service
@@ -302,6 +392,11 @@ class AuthServiceStub(object):
                 request_serializer=calculator__pb2.EnrollRequest.SerializeToString,
                 response_deserializer=calculator__pb2.EnrollResponse.FromString,
                 _registered_method=True)
+        self.EnrollmentFlow = channel.stream_stream(
+                '/cloudgrpc.AuthService/EnrollmentFlow',
+                request_serializer=calculator__pb2.EnrollStep.SerializeToString,
+                response_deserializer=calculator__pb2.EnrollStep.FromString,
+                _registered_method=True)
         self.GetStorageInfo = channel.unary_unary(
                 '/cloudgrpc.AuthService/GetStorageInfo',
                 request_serializer=calculator__pb2.StorageInfoRequest.SerializeToString,
@@ -337,6 +432,13 @@ class AuthServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def EnrollmentFlow(self, request_iterator, context):
+        """SendOtp, VerifyOtp and Enroll as the steps of one stream
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def GetStorageInfo(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -366,6 +468,11 @@ def add_AuthServiceServicer_to_server(servicer, server):
                     request_deserializer=calculator__pb2.EnrollRequest.FromString,
                     response_serializer=calculator__pb2.EnrollResponse.SerializeToString,
             ),
+            'EnrollmentFlow': grpc.stream_stream_rpc_method_handler(
+                    servicer.EnrollmentFlow,
+                    request_deserializer=calculator__pb2.EnrollStep.FromString,
+                    response_serializer=calculator__pb2.EnrollStep.SerializeToString,
+            ),
             'GetStorageInfo': grpc.unary_unary_rpc_method_handler(
                     servicer.GetStorageInfo,
                     request_deserializer=calculator__pb2.StorageInfoRequest.FromString,
@@ -491,6 +598,33 @@ class AuthService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def EnrollmentFlow(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(
+            request_iterator,
+            target,
+            '/cloudgrpc.AuthService/EnrollmentFlow',
+            calculator__pb2.EnrollStep.SerializeToString,
+            calculator__pb2.EnrollStep.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def GetStorageInfo(request,
             target,
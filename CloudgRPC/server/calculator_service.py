@@ -1,11 +1,17 @@
 import grpc
 from concurrent import futures
+import asyncio
+import queue
 import sys
 import os
 
 # Add parent directory to path to import generated modules
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+# Use the C (upb) protobuf runtime unless one was chosen explicitly;
+# it must be set before the first protobuf import
+os.environ.setdefault('PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION', 'upb')
+
 from generated import calculator_pb2
 from generated import calculator_pb2_grpc
 from auth.gmail_otp import OTPManager
@@ -87,28 +93,40 @@ class AuthServiceServicer(calculator_pb2_grpc.AuthServiceServicer):
     
     def Enroll(self, request, context):
         """Enroll a new user with storage allocation"""
-        email = request.email
-        full_name = request.full_name
+        code, message, token = self._enroll_user(request.email, request.full_name)
+        if code is not None:
+            context.abort(code, message)
         
+        return calculator_pb2.EnrollResponse(
+            success=True,
+            message=message,
+            session_token=token
+        )
+    
+    def _enroll_user(self, email, full_name):
+        """Enroll a user; returns (error status or None, message, session token)"""
         # Check if email is verified
         if not user_manager.is_email_verified(email):
-            context.abort(
+            return (
                 grpc.StatusCode.UNAUTHENTICATED,
-                "Email not verified. Please complete login and OTP verification first."
+                "Email not verified. Please complete login and OTP verification first.",
+                None
             )
         
         # Check if user already exists
         if user_manager.user_exists(email):
-            context.abort(
+            return (
                 grpc.StatusCode.ALREADY_EXISTS,
-                "User already enrolled. Please use Login option instead."
+                "User already enrolled. Please use Login option instead.",
+                None
             )
         
         # Check if storage is available
         if not user_manager.can_allocate_new_user():
-            context.abort(
+            return (
                 grpc.StatusCode.RESOURCE_EXHAUSTED,
-                "System storage exhausted. Cannot allocate storage for new users."
+                "System storage exhausted. Cannot allocate storage for new users.",
+                None
             )
         
         # Enroll user
@@ -116,15 +134,53 @@ class AuthServiceServicer(calculator_pb2_grpc.AuthServiceServicer):
         
         if not success:
             if "exhausted" in message.lower():
-                context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, message)
-            else:
-                context.abort(grpc.StatusCode.FAILED_PRECONDITION, message)
+                return grpc.StatusCode.RESOURCE_EXHAUSTED, message, None
+            return grpc.StatusCode.FAILED_PRECONDITION, message, None
         
-        return calculator_pb2.EnrollResponse(
-            success=True,
-            message=message,
-            session_token=token
-        )
+        return None, message, token
+    
+    async def EnrollmentFlow(self, request_iterator, context):
+        """Send the OTP, verify it and enroll, all on one stream
+        
+        Answers the OTP being sent, then verified, then the enrollment,
+        each as SendOtp, VerifyOtp and Enroll would. The stream ends at
+        the first step that fails. It is served on the event loop, so a
+        user reading their email holds no worker thread.
+        """
+        start = None
+        async for step in request_iterator:
+            if start is None:
+                start = step
+                # Sending the email blocks, so it runs off the event loop
+                sent = await asyncio.get_running_loop().run_in_executor(
+                    None,
+                    self.SendOtp,
+                    calculator_pb2.SendOtpRequest(email=start.email),
+                    context
+                )
+                yield calculator_pb2.EnrollStep(success=sent.success, message=sent.message)
+                if not sent.success:
+                    return
+                continue
+            
+            verified = self.VerifyOtp(
+                calculator_pb2.VerifyOtpRequest(email=start.email, otp=step.otp),
+                context
+            )
+            yield calculator_pb2.EnrollStep(success=verified.success, message=verified.message)
+            if not verified.success:
+                return
+            
+            # Answered right after verification, with no further client message
+            code, message, token = self._enroll_user(start.email, start.full_name)
+            if code is not None:
+                await context.abort(code, message)
+            yield calculator_pb2.EnrollStep(
+                success=True,
+                message=message,
+                session_token=token
+            )
+            return
     
     def GetStorageInfo(self, request, context):
         """Get storage information for the authenticated user"""
@@ -157,31 +213,50 @@ class AuthServiceServicer(calculator_pb2_grpc.AuthServiceServicer):
 class CalculatorServicer(calculator_pb2_grpc.CalculatorServicer):
     """Implementation of Calculator service"""
     
+    # Batch operations: (function, name used in messages)
+    BATCH_OPERATIONS = {
+        calculator_pb2.OP_ADD: (lambda a, b: a + b, "Addition"),
+        calculator_pb2.OP_SUB: (lambda a, b: a - b, "Subtraction"),
+        calculator_pb2.OP_MUL: (lambda a, b: a * b, "Multiplication"),
+        calculator_pb2.OP_DIV: (lambda a, b: a // b, "Division"),
+        calculator_pb2.OP_MOD: (lambda a, b: a % b, "Modulo"),
+    }
+    
+    def _metadata_token(self, context):
+        """Session token from the call's 'authorization: Bearer' metadata"""
+        for key, value in context.invocation_metadata():
+            if key == 'authorization' and value.startswith('Bearer '):
+                return value[len('Bearer '):]
+        return ''
+    
     def _validate_token(self, token, context):
         """Validate session token and return user"""
+        user, error = self._check_token(token)
+        if error:
+            context.abort(grpc.StatusCode.UNAUTHENTICATED, error)
+        
+        return user
+    
+    def _check_token(self, token):
+        """Return (user, None) for a valid session token, else (None, reason)"""
         if not token:
-            context.abort(
-                grpc.StatusCode.UNAUTHENTICATED,
-                "Session token is required."
-            )
+            return None, "Session token is required."
         
         user = user_manager.get_user_by_token(token)
         if not user:
-            context.abort(
-                grpc.StatusCode.UNAUTHENTICATED,
-                "Invalid session token."
-            )
+            return None, "Invalid session token."
         
-        return user
+        return user, None
     
     def Add(self, request, context):
         """Add two numbers"""
-        user = self._validate_token(request.session_token, context)
+        token = self._metadata_token(context)
+        user = self._validate_token(token, context)
         
         result = request.a + request.b
         
         # Simulate storage usage (each operation uses some bytes)
-        user_manager.update_user_storage_usage(request.session_token, 100)
+        user_manager.update_user_storage_usage(token, 100)
         
         return calculator_pb2.AddResponse(
             success=True,
@@ -191,12 +266,13 @@ class CalculatorServicer(calculator_pb2_grpc.CalculatorServicer):
     
     def Sub(self, request, context):
         """Subtract two numbers"""
-        user = self._validate_token(request.session_token, context)
+        token = self._metadata_token(context)
+        user = self._validate_token(token, context)
         
         result = request.a - request.b
         
         # Simulate storage usage
-        user_manager.update_user_storage_usage(request.session_token, 100)
+        user_manager.update_user_storage_usage(token, 100)
         
         return calculator_pb2.SubResponse(
             success=True,
@@ -206,12 +282,13 @@ class CalculatorServicer(calculator_pb2_grpc.CalculatorServicer):
     
     def Mul(self, request, context):
         """Multiply two numbers"""
-        user = self._validate_token(request.session_token, context)
+        token = self._metadata_token(context)
+        user = self._validate_token(token, context)
         
         result = request.a * request.b
         
         # Simulate storage usage
-        user_manager.update_user_storage_usage(request.session_token, 100)
+        user_manager.update_user_storage_usage(token, 100)
         
         return calculator_pb2.MulResponse(
             success=True,
@@ -221,7 +298,8 @@ class CalculatorServicer(calculator_pb2_grpc.CalculatorServicer):
     
     def Div(self, request, context):
         """Divide two numbers"""
-        user = self._validate_token(request.session_token, context)
+        token = self._metadata_token(context)
+        user = self._validate_token(token, context)
         
         if request.b == 0:
             context.abort(
@@ -232,7 +310,7 @@ class CalculatorServicer(calculator_pb2_grpc.CalculatorServicer):
         result = request.a // request.b
         
         # Simulate storage usage
-        user_manager.update_user_storage_usage(request.session_token, 100)
+        user_manager.update_user_storage_usage(token, 100)
         
         return calculator_pb2.DivResponse(
             success=True,
@@ -242,7 +320,8 @@ class CalculatorServicer(calculator_pb2_grpc.CalculatorServicer):
     
     def Mod(self, request, context):
         """Modulo operation"""
-        user = self._validate_token(request.session_token, context)
+        token = self._metadata_token(context)
+        user = self._validate_token(token, context)
         
         if request.b == 0:
             context.abort(
@@ -253,7 +332,7 @@ class CalculatorServicer(calculator_pb2_grpc.CalculatorServicer):
         result = request.a % request.b
         
         # Simulate storage usage
-        user_manager.update_user_storage_usage(request.session_token, 100)
+        user_manager.update_user_storage_usage(token, 100)
         
         return calculator_pb2.ModResponse(
             success=True,
@@ -262,6 +341,71 @@ class CalculatorServicer(calculator_pb2_grpc.CalculatorServicer):
         )
 
 
+    def Batch(self, request_iterator, context):
+        """Run a stream of operations, answering each in order
+        
+        A failed operation (such as division by zero) gets an unsuccessful
+        response instead of ending the stream; an invalid token aborts it.
+        """
+        token = self._metadata_token(context)
+        user = self._validate_token(token, context)
+        context.set_compression(grpc.Compression.Gzip)
+        for request in request_iterator:
+            yield self._calculate(request, token, user)
+    
+    async def Session(self, request_iterator, context):
+        """Answer every operation of one client session on a single stream
+        
+        The token is validated once, when the session opens; operations
+        then fail or succeed as in Batch. Sessions are served on the event
+        loop, so a logged-in user holds no worker thread.
+        """
+        token = self._metadata_token(context)
+        user, error = self._check_token(token)
+        if error:
+            await context.abort(grpc.StatusCode.UNAUTHENTICATED, error)
+        context.set_compression(grpc.Compression.Gzip)
+        async for request in request_iterator:
+            yield self._calculate(request, token, user)
+    
+    def _calculate(self, request, token, user):
+        """Run one streamed operation for an authenticated user
+        
+        Anything wrong with the operation itself is answered as an
+        unsuccessful response, so the stream carries on.
+        """
+        if request.op not in self.BATCH_OPERATIONS:
+            return calculator_pb2.CalcResponse(
+                success=False,
+                message=f"Unknown operation {request.op}."
+            )
+        
+        operation, name = self.BATCH_OPERATIONS[request.op]
+        if request.op in (calculator_pb2.OP_DIV, calculator_pb2.OP_MOD) and request.b == 0:
+            return calculator_pb2.CalcResponse(
+                success=False,
+                message=f"{name} by zero is not allowed."
+            )
+        
+        try:
+            response = calculator_pb2.CalcResponse(
+                success=True,
+                message=f"{name} performed successfully for user {user['name']}",
+                result=operation(request.a, request.b)
+            )
+        except ValueError:
+            # The result does not fit the int64 result field
+            return calculator_pb2.CalcResponse(
+                success=False,
+                message=f"{name} result is out of range."
+            )
+        
+        # Simulate storage usage
+        user_manager.update_user_storage_usage(token, 100)
+        
+        return response
+
+
 class AdminServiceServicer(calculator_pb2_grpc.AdminServiceServicer):
     """Implementation of AdminService for system monitoring and management"""
     
@@ -311,42 +455,68 @@ class AdminServiceServicer(calculator_pb2_grpc.AdminServiceServicer):
             new_capacity_bytes=new_cap
         )
     
-    def StreamSystemEvents(self, request, context):
-        """Stream real-time system events"""
+    async def StreamSystemEvents(self, request, context):
+        """Stream real-time system events
+        
+        Served on the event loop like Session: the blocking queue wait
+        runs on the default executor with a 1s timeout, and the stream
+        stays open through quiet periods until the client cancels it.
+        """
         if request.admin_key != ADMIN_KEY:
-            context.abort(
+            await context.abort(
                 grpc.StatusCode.PERMISSION_DENIED,
                 "Invalid admin key"
             )
         
         print("\n[Admin Monitor] Event streaming started...")
         
+        loop = asyncio.get_running_loop()
+        event_queue = user_manager.event_queue
         try:
             while True:
-                # Get event from queue (blocking with timeout)
+                # Shielded, so a cancel cannot drop an event the get already took
+                pending = loop.run_in_executor(None, event_queue.get, True, 1.0)
                 try:
-                    event = user_manager.event_queue.get(timeout=1.0)
-                    
-                    yield calculator_pb2.SystemEvent(
-                        event_type=event['event_type'],
-                        timestamp=event['timestamp'],
-                        message=event['message'],
-                        user_email=event['user_email'],
-                        storage_change=event['storage_change']
-                    )
-                except:
-                    # Timeout - check if client is still connected
-                    if context.is_active():
-                        continue
-                    else:
-                        break
+                    event = await asyncio.shield(pending)
+                except queue.Empty:
+                    continue
+                except asyncio.CancelledError:
+                    def requeue(done):
+                        if done.exception() is None:
+                            event_queue.put(done.result())
+                    pending.add_done_callback(requeue)
+                    raise
+                
+                yield calculator_pb2.SystemEvent(
+                    event_type=event['event_type'],
+                    timestamp=event['timestamp'],
+                    message=event['message'],
+                    user_email=event['user_email'],
+                    storage_change=event['storage_change']
+                )
+        except asyncio.CancelledError:
+            print("[Admin Monitor] Stream ended: client disconnected")
+            raise
         except Exception as e:
             print(f"[Admin Monitor] Stream ended: {e}")
 
 
-def serve():
-    """Start the gRPC server"""
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+async def serve():
+    """Start the gRPC server
+    
+    An asyncio server: the long-lived Session, EnrollmentFlow and
+    StreamSystemEvents streams run on its event loop, and every other
+    handler on the thread pool.
+    """
+    # Accept the client's 30s keepalive pings on idle connections
+    server = grpc.aio.server(
+        migration_thread_pool=futures.ThreadPoolExecutor(max_workers=10),
+        options=[
+            ('grpc.keepalive_permit_without_calls', 1),
+            ('grpc.http2.min_recv_ping_interval_without_data_ms', 20000),
+            ('grpc.http2.max_ping_strikes', 0),
+        ]
+    )
     
     # Add servicers
     calculator_pb2_grpc.add_AuthServiceServicer_to_server(
@@ -375,9 +545,9 @@ def serve():
     print("Monitoring for real-time events...")
     print("="*60)
     
-    server.start()
-    server.wait_for_termination()
+    await server.start()
+    await server.wait_for_termination()
 
 
 if __name__ == '__main__':
-    serve()
\ No newline at end of file
+    asyncio.run(serve())
\ No newline at end of file
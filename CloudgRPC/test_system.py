@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+System Test - Checks of the CloudGrpc server's streaming calls
+"""
+
+import os
+import sys
+import time
+import asyncio
+import threading
+from concurrent import futures
+
+import grpc
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from generated import calculator_pb2
+from generated import calculator_pb2_grpc
+from server import calculator_service
+
+# Longer than the server's 1s event queue poll, so the stream must outlive it
+IDLE_SECONDS = 2.5
+
+class SystemTester:
+    def __init__(self):
+        self.test_results = []
+        self.loop = None
+        self.server = None
+        self.channel = None
+    
+    def log_result(self, test_name, passed, message=""):
+        """Log test result"""
+        status = "[PASS]" if passed else "[FAIL]"
+        self.test_results.append({
+            'test': test_name,
+            'passed': passed,
+            'message': message,
+            'status': status
+        })
+        
+        print(f"{status} {test_name}")
+        if message:
+            print(f"   {message}")
+    
+    def start_server(self):
+        """Run the admin service on an asyncio server on a free port"""
+        self.loop = asyncio.new_event_loop()
+        started = threading.Event()
+        port = []
+        
+        async def run():
+            self.server = grpc.aio.server(
+                migration_thread_pool=futures.ThreadPoolExecutor(max_workers=2)
+            )
+            calculator_pb2_grpc.add_AdminServiceServicer_to_server(
+                calculator_service.AdminServiceServicer(), self.server
+            )
+            port.append(self.server.add_insecure_port('localhost:0'))
+            await self.server.start()
+            started.set()
+            await self.server.wait_for_termination()
+        
+        thread = threading.Thread(target=self.loop.run_until_complete, args=(run(),))
+        thread.daemon = True
+        thread.start()
+        started.wait(10)
+        
+        self.channel = grpc.insecure_channel(f'localhost:{port[0]}')
+        return calculator_pb2_grpc.AdminServiceStub(self.channel)
+    
+    def test_idle_event_stream(self, stub):
+        """Test that an event stream stays open through a quiet period"""
+        event_queue = calculator_service.user_manager.event_queue
+        stream = stub.StreamSystemEvents(
+            calculator_pb2.SystemEventsRequest(admin_key=calculator_service.ADMIN_KEY)
+        )
+        try:
+            time.sleep(IDLE_SECONDS)
+            event_queue.put({
+                'event_type': 'STORAGE_UPDATED',
+                'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
+                'message': 'idle stream test',
+                'user_email': '',
+                'storage_change': 0
+            })
+            event = next(stream)
+            
+            if event.message == 'idle stream test':
+                self.log_result("Idle Event Stream Test", True, f"Event delivered after {IDLE_SECONDS}s idle")
+                return True
+            else:
+                self.log_result("Idle Event Stream Test", False, f"Unexpected event: {event.message}")
+                return False
+        
+        except grpc.RpcError as e:
+            self.log_result("Idle Event Stream Test", False, f"Stream ended: [{e.code().name}] {e.details()}")
+            return False
+        except StopIteration:
+            self.log_result("Idle Event Stream Test", False, "Stream ended with status OK")
+            return False
+        finally:
+            stream.cancel()
+    
+    def test_event_stream_denied(self, stub):
+        """Test that a wrong admin key is refused"""
+        try:
+            next(stub.StreamSystemEvents(calculator_pb2.SystemEventsRequest(admin_key='wrong')))
+            self.log_result("Event Stream Auth Test", False, "Stream opened with a wrong key")
+            return False
+        except grpc.RpcError as e:
+            if e.code() == grpc.StatusCode.PERMISSION_DENIED:
+                self.log_result("Event Stream Auth Test", True, "Wrong admin key refused")
+                return True
+            self.log_result("Event Stream Auth Test", False, f"Unexpected status: {e.code().name}")
+            return False
+    
+    def run_all_tests(self):
+        """Run all system tests"""
+        print("[TEST] Running System Tests")
+        print("=" * 60)
+        print()
+        
+        stub = self.start_server()
+        tests = [
+            self.test_idle_event_stream,
+            self.test_event_stream_denied
+        ]
+        
+        for test in tests:
+            try:
+                test(stub)
+            except Exception as e:
+                self.log_result(test.__name__, False, f"Unexpected exception: {e}")
+        
+        self.channel.close()
+        try:
+            asyncio.run_coroutine_threadsafe(self.server.stop(None), self.loop).result(10)
+        except futures.TimeoutError:
+            print("[WARNING] Server did not stop within 10s")
+        
+        passed = sum(1 for result in self.test_results if result['passed'])
+        total = len(self.test_results)
+        
+        print()
+        print(f"[RESULT] Overall: {passed}/{total} tests passed")
+        return passed == total
+
+def main():
+    tester = SystemTester()
+    success = tester.run_all_tests()
+    sys.exit(0 if success else 1)
+
+if __name__ == "__main__":
+    main()
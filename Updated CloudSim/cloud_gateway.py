@@ -5,173 +5,379 @@ Handles node registration, file uploads, and chunk distribution
 """
 
 import socket
+import select
 import threading
-import json
 import os
+import sys
 import time
 import hashlib
-import pickle
+import heapq
+import queue
+import math
 from datetime import datetime, timedelta
 import struct
 import uuid
+from typing import Any, Dict, Final, Optional, Tuple
+
+import msgpack
+import orjson
+
+# Leading byte of every message payload, bumped on wire format changes
+PROTOCOL_VERSION: Final = 1
+
+# 4-byte big-endian frame length, compiled once instead of per call
+LENGTH_PREFIX: Final = struct.Struct('!I')
+
+# Bytes moved per splice/recv when relaying upload data (default pipe capacity)
+SPLICE_BLOCK_SIZE: Final = 64 * 1024
+
+# Per-connection receive buffer used to batch frame reads
+READ_BUFFER_SIZE: Final = 64 * 1024
+
+# Kernel send/receive buffer requested on data path sockets
+SOCKET_BUFFER_SIZE: Final = 4 << 20
+
+# Number of independently locked node registry shards
+NODE_SHARDS: Final = 64
+
+# Idle connections kept open per storage node for chunk transfers
+NODE_POOL_SIZE: Final = 4
+
+# Seconds without a heartbeat before a node is marked offline
+HEARTBEAT_TIMEOUT: Final = 60
+
+# Seconds after its last request that a parallel upload session stays
+# reserved for the client using it, so a probe cannot resume it meanwhile
+UPLOAD_CLAIM_TIMEOUT: Final = 30
+
+# Seconds an idle parallel upload session is kept for resuming
+UPLOAD_SESSION_TTL: Final = 3600
+
+# Largest heartbeat datagram accepted on the UDP heartbeat listener
+HEARTBEAT_DATAGRAM_SIZE: Final = 1024
+
+# ANSI cursor-home + erase-display, replaces shelling out to clear/cls
+CLEAR_SCREEN = '\x1b[H\x1b[2J' if os.name == 'posix' else ''
+
+class FrameReader:
+    """Buffered reader for length-prefixed frames on one connection
+    
+    Each recv_into pulls in as much as the kernel has ready, so the length
+    prefix and body of small messages (and several back-to-back frames)
+    are parsed out of a single syscall instead of two per frame.
+    
+    Annotated so mypyc can compile this per-message hot path (see setup.py).
+    """
+    
+    def __init__(self, sock: socket.socket, size: int = READ_BUFFER_SIZE) -> None:
+        self.sock = sock
+        self.buf = bytearray(size)
+        self.view = memoryview(self.buf)
+        self.start = 0
+        self.end = 0
+    
+    def _fill(self, needed: int) -> bool:
+        """Buffer at least needed unread bytes; returns False on EOF"""
+        while self.end - self.start < needed:
+            if self.start + needed > len(self.buf):
+                # Slide unread bytes to the front, growing for oversized frames
+                pending = self.end - self.start
+                if needed > len(self.buf):
+                    self.buf = bytearray(needed)
+                    self.buf[:pending] = self.view[self.start:self.end]
+                    self.view = memoryview(self.buf)
+                else:
+                    self.buf[:pending] = self.buf[self.start:self.end]
+                self.start, self.end = 0, pending
+            
+            n = self.sock.recv_into(self.view[self.end:])
+            if not n:
+                return False
+            self.end += n
+        return True
+    
+    def recv_message(self) -> Optional[bytes]:
+        """Receive a message with length prefix"""
+        try:
+            if not self._fill(LENGTH_PREFIX.size):
+                return None
+            msg_length: int = LENGTH_PREFIX.unpack_from(self.buf, self.start)[0]
+            
+            if not self._fill(LENGTH_PREFIX.size + msg_length):
+                return None
+            body_start = self.start + LENGTH_PREFIX.size
+            self.start = body_start + msg_length
+            return bytes(self.view[body_start:self.start])
+        except Exception:
+            return None
+    
+    def take_buffered(self, limit: int) -> memoryview:
+        """Consume up to limit already-buffered bytes (raw data after a header)
+        
+        Returns a zero-copy view that stays valid until the next read.
+        """
+        size = min(limit, self.end - self.start)
+        data = self.view[self.start:self.start + size]
+        self.start += size
+        return data
 
 class CloudGateway:
     def __init__(self, host='localhost', upload_port=8000, node_port=8001):
         self.host = host
         self.upload_port = upload_port
         self.node_port = node_port
-        self.nodes = {}  # node_id: node_info
         self.files = {}  # file_id: file_info
         self.chunks = {}  # chunk_id: chunk_info
         self.running = True
-        self.db_file = 'cloud_db.pkl'
-        self.load_database()
+        self.db_file = 'cloud_db.json'
+        
+        # Node registry split into shards of node_id: node_info. Writers
+        # take the shard's lock and publish a fresh dict; readers use the
+        # current dicts without locking. node_info dicts are never mutated.
+        self._node_locks = [threading.Lock() for _ in range(NODE_SHARDS)]
+        self._node_shards = [{} for _ in range(NODE_SHARDS)]
+        
+        # Min-heap of (deadline, node_id, last_heartbeat) driving monitor_nodes
+        self._expiry = []
+        self._expiry_lock = threading.Lock()
+        self._expiry_event = threading.Event()
+        
+        # Acknowledgments that never change, encoded once
+        self._registered_ack = self.encode_message({'type': 'registered', 'status': 'success'})
+        self._heartbeat_ack = self.encode_message({'type': 'heartbeat_ack', 'status': 'success'})
+        
+        # Idle keep-alive sockets per node_id (a queue.Queue each), reused across chunk sends
+        self._node_conns = {}
+        
+        # Cached aggregates over online nodes, kept in step with node status
+        self._counters_lock = threading.Lock()
+        self._online_node_count = 0
+        self._total_storage_online = 0
+        
+        # Parallel uploads in progress: file_id -> session
+        self.uploads = {}
+        self.uploads_lock = threading.Lock()
         
         # Thread-safe locks
-        self.nodes_lock = threading.Lock()
         self.files_lock = threading.Lock()
         self.chunks_lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        
+        self.load_database()
         
     def load_database(self):
         """Load persistent database from disk"""
         try:
             if os.path.exists(self.db_file):
                 with open(self.db_file, 'rb') as f:
-                    data = pickle.load(f)
-                    self.nodes = data.get('nodes', {})
+                    data = orjson.loads(f.read())
                     self.files = data.get('files', {})
                     self.chunks = data.get('chunks', {})
+                
+                for node_id, node_info in data.get('nodes', {}).items():
+                    self._update_node(node_id, node_info, replace=True)
         except Exception as e:
             print(f"Database load error: {e}")
     
     def save_database(self):
-        """Save database to disk"""
+        """Save database to disk
+        
+        The tables are copied under their locks and written outside them, so
+        uploads are never blocked behind disk I/O. The copy is taken inside
+        _save_lock, so the last writer of the file always holds the newest
+        tables. The file is written beside the database and renamed over
+        it, so a crash never leaves it torn.
+        """
         try:
-            with open(self.db_file, 'wb') as f:
+            with self._save_lock:
+                with self.files_lock:
+                    files = dict(self.files)
+                with self.chunks_lock:
+                    chunks = dict(self.chunks)
                 data = {
                     'nodes': self.nodes,
-                    'files': self.files,
-                    'chunks': self.chunks
+                    'files': files,
+                    'chunks': chunks
                 }
-                pickle.dump(data, f)
+                payload = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+                tmp_file = self.db_file + '.tmp'
+                with open(tmp_file, 'wb') as f:
+                    f.write(payload)
+                os.replace(tmp_file, self.db_file)
         except Exception as e:
             print(f"Database save error: {e}")
     
+    @property
+    def nodes(self) -> Dict[str, Dict[str, Any]]:
+        """Snapshot of all nodes as node_id: node_info"""
+        return dict(self.iter_nodes())
+    
+    def iter_nodes(self):
+        """Iterate (node_id, node_info) pairs without taking any lock"""
+        for shard in self._node_shards:
+            yield from shard.items()
+    
+    def get_node(self, node_id):
+        """Lock-free lookup of a node's info"""
+        return self._node_shards[hash(node_id) % NODE_SHARDS].get(node_id)
+    
+    def _update_node(self, node_id, changes, replace=False, only_if=None):
+        """Copy-on-write update of one node entry under its shard lock
+        
+        With replace=True, changes becomes the whole node_info; otherwise it
+        is merged into the existing entry, which must exist. only_if is an
+        optional predicate on the current entry. Online counters follow the
+        status transition. Returns the published node_info, or None when
+        nothing was changed.
+        """
+        index = hash(node_id) % NODE_SHARDS
+        with self._node_locks[index]:
+            shard = self._node_shards[index]
+            previous = shard.get(node_id)
+            if previous is None and not replace:
+                return None
+            if only_if is not None and not only_if(previous):
+                return None
+            
+            node_info = dict(changes) if replace else {**previous, **changes}
+            if previous and previous.get('status') == 'online':
+                self._adjust_online_counters(previous, -1)
+            if node_info.get('status') == 'online':
+                self._adjust_online_counters(node_info, 1)
+            
+            shard = dict(shard)
+            shard[node_id] = node_info
+            self._node_shards[index] = shard
+        
+        last_heartbeat = node_info.get('last_heartbeat')
+        if node_info.get('status') == 'online' and (previous is None or previous.get('last_heartbeat') != last_heartbeat):
+            self._schedule_expiry(node_id, last_heartbeat or 0)
+        return node_info
+    
+    def _adjust_online_counters(self, node_info, delta):
+        """Add (delta=1) or remove (delta=-1) a node from the online aggregates"""
+        with self._counters_lock:
+            self._online_node_count += delta
+            self._total_storage_online += delta * node_info.get('storage_capacity', 0)
+    
     def get_total_storage(self):
         """Get total available storage across all online nodes"""
-        total = 0
-        with self.nodes_lock:
-            for node_id, node_info in self.nodes.items():
-                if node_info.get('status') == 'online':
-                    total += node_info.get('storage_capacity', 0)
-        return total
+        with self._counters_lock:
+            return self._total_storage_online
     
     def get_online_nodes(self):
         """Get count of online nodes"""
-        count = 0
-        with self.nodes_lock:
-            for node_info in self.nodes.values():
-                if node_info.get('status') == 'online':
-                    count += 1
-        return count
+        with self._counters_lock:
+            return self._online_node_count
     
     def display_status(self):
         """Display current system status"""
         while self.running:
-            os.system('clear' if os.name == 'posix' else 'cls')
-            print("=" * 60)
-            print("        DISTRIBUTED CLOUD STORAGE - CLOUD GATEWAY")
-            print("=" * 60)
-            print(f"Gateway Address: {self.host}:{self.upload_port} (uploads) | {self.host}:{self.node_port} (nodes)")
-            print(f"Status: {'RUNNING' if self.running else 'STOPPED'}")
-            print(f"Start Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-            print()
+            parts = []
+            parts.append("=" * 60)
+            parts.append("        DISTRIBUTED CLOUD STORAGE - CLOUD GATEWAY")
+            parts.append("=" * 60)
+            parts.append(f"Gateway Address: {self.host}:{self.upload_port} (uploads) | {self.host}:{self.node_port} (nodes)")
+            parts.append(f"Status: {'RUNNING' if self.running else 'STOPPED'}")
+            parts.append(f"Start Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+            parts.append("")
             
-            print("STORAGE OVERVIEW:")
+            parts.append("STORAGE OVERVIEW:")
             total_storage = self.get_total_storage()
             online_nodes = self.get_online_nodes()
-            print(f"  Total Storage: {total_storage / (1024**3):.2f} GB")
-            print(f"  Online Nodes: {online_nodes}")
-            print(f"  Files Stored: {len(self.files)}")
-            print(f"  Total Chunks: {len(self.chunks)}")
-            print()
+            with self.files_lock:
+                files_stored = len(self.files)
+            with self.chunks_lock:
+                total_chunks = len(self.chunks)
+            parts.append(f"  Total Storage: {total_storage / (1024**3):.2f} GB")
+            parts.append(f"  Online Nodes: {online_nodes}")
+            parts.append(f"  Files Stored: {files_stored}")
+            parts.append(f"  Total Chunks: {total_chunks}")
+            parts.append("")
             
-            print("CONNECTED NODES:")
-            with self.nodes_lock:
-                for node_id, node_info in self.nodes.items():
-                    status = node_info.get('status', 'unknown')
-                    host = node_info.get('host', 'unknown')
-                    port = node_info.get('port', 'unknown')
-                    storage = node_info.get('storage_capacity', 0)
-                    last_heartbeat = node_info.get('last_heartbeat', 0)
-                    
-                    # Check if node is alive (heartbeat within last 60 seconds)
-                    is_alive = (time.time() - last_heartbeat) < 60 if last_heartbeat else False
-                    status_indicator = "[ONLINE]" if status == 'online' and is_alive else "[OFFLINE]"
-                    
-                    print(f"  {status_indicator} {node_id}")
-                    print(f"    Address: {host}:{port}")
-                    print(f"    Storage: {storage / (1024**3):.2f} GB")
-                    print(f"    Status: {status}")
-                    if last_heartbeat:
-                        print(f"    Last Heartbeat: {int(time.time() - last_heartbeat)}s ago")
-                    print()
+            parts.append("CONNECTED NODES:")
+            now = time.time()
+            for node_id, node_info in self.iter_nodes():
+                status = node_info.get('status', 'unknown')
+                storage = node_info.get('storage_capacity', 0)
+                last_heartbeat = node_info.get('last_heartbeat', 0)
+                
+                # Check if node is alive (heartbeat within the timeout)
+                is_alive = (now - last_heartbeat) < HEARTBEAT_TIMEOUT if last_heartbeat else False
+                status_indicator = "[ONLINE]" if status == 'online' and is_alive else "[OFFLINE]"
+                heartbeat_line = f"    Last Heartbeat: {int(now - last_heartbeat)}s ago\n" if last_heartbeat else ""
+                
+                parts.append(
+                    f"  {status_indicator} {node_id}\n"
+                    f"    Address: {node_info.get('host', 'unknown')}:{node_info.get('port', 'unknown')}\n"
+                    f"    Storage: {storage / (1024**3):.2f} GB\n"
+                    f"    Status: {status}\n"
+                    f"{heartbeat_line}"
+                )
+            
+            parts.append("RECENT ACTIVITY:")
+            parts.append("  Listening for new nodes and upload requests...")
+            parts.append("")
             
-            print("RECENT ACTIVITY:")
-            print("  Listening for new nodes and upload requests...")
-            print()
+            parts.append("Commands: Ctrl+C to stop")
+            parts.append("=" * 60)
             
-            print("Commands: Ctrl+C to stop")
-            print("=" * 60)
+            # One write per refresh instead of a shell fork plus a print per line
+            sys.stdout.write(CLEAR_SCREEN + '\n'.join(parts) + '\n')
+            sys.stdout.flush()
             
             time.sleep(5)  # Update every 5 seconds
     
-    def handle_node_registration(self, conn, addr):
-        """Handle node registration and heartbeat messages"""
+    def handle_node_registration(self, conn: socket.socket, addr: Tuple[str, int]) -> None:
+        """Handle node registration and heartbeat messages
+        
+        Nodes keep one connection open for control messages, so messages
+        are served until the node closes it. Heartbeats normally arrive on
+        the UDP listener but are still accepted here.
+        """
         try:
-            data = self.recv_message(conn)
-            if not data:
-                return
-            
-            message = json.loads(data.decode('utf-8'))
-            msg_type = message.get('type')
-            
-            if msg_type == 'register':
-                # New node registration
-                node_id = message.get('node_id')
-                node_info = {
-                    'node_id': node_id,
-                    'host': message.get('host'),
-                    'port': message.get('port'),
-                    'storage_capacity': message.get('storage_capacity', 0),
-                    'cpu_cores': message.get('cpu_cores', 1),
-                    'bandwidth': message.get('bandwidth', '1Gbps'),
-                    'status': 'online',
-                    'first_seen': datetime.now().isoformat(),
-                    'last_heartbeat': time.time()
-                }
-                
-                with self.nodes_lock:
-                    self.nodes[node_id] = node_info
-                    self.save_database()
-                
-                print(f"[NEW] New node registered: {node_id} ({message.get('host')}:{message.get('port')})")
+            reader = FrameReader(conn)
+            while self.running:
+                data = reader.recv_message()
+                if not data:
+                    return
                 
-                # Send acknowledgment
-                response = {'type': 'registered', 'status': 'success'}
-                self.send_message(conn, json.dumps(response).encode('utf-8'))
+                message = self.decode_message(data)
+                msg_type = message.get('type')
                 
-            elif msg_type == 'heartbeat':
-                # Node heartbeat
-                node_id = message.get('node_id')
-                with self.nodes_lock:
-                    if node_id in self.nodes:
-                        self.nodes[node_id]['last_heartbeat'] = time.time()
-                        self.nodes[node_id]['status'] = 'online'
+                if msg_type == 'register':
+                    # New node registration
+                    node_id = message.get('node_id')
+                    node_info = {
+                        'node_id': node_id,
+                        'host': message.get('host'),
+                        'port': message.get('port'),
+                        'storage_capacity': message.get('storage_capacity', 0),
+                        'cpu_cores': message.get('cpu_cores', 1),
+                        'bandwidth': message.get('bandwidth', '1Gbps'),
+                        'status': 'online',
+                        'first_seen': datetime.now().isoformat(),
+                        'last_heartbeat': time.time()
+                    }
+                    
+                    self._update_node(node_id, node_info, replace=True)
+                    self.save_database()
+                    
+                    print(f"[NEW] New node registered: {node_id} ({message.get('host')}:{message.get('port')})")
+                    
+                    # Send acknowledgment
+                    self.send_message(conn, self._registered_ack)
+                    
+                elif msg_type == 'heartbeat':
+                    # Node heartbeat
+                    node_id = message.get('node_id')
+                    self._update_node(node_id, {'last_heartbeat': time.time(), 'status': 'online'})
+                    
+                    # Send heartbeat acknowledgment
+                    self.send_message(conn, self._heartbeat_ack)
                 
-                # Send heartbeat acknowledgment
-                response = {'type': 'heartbeat_ack', 'status': 'success'}
-                self.send_message(conn, json.dumps(response).encode('utf-8'))
+                else:
+                    return
                 
         except Exception as e:
             print(f"Node registration error: {e}")
@@ -179,198 +385,661 @@ class CloudGateway:
             conn.close()
     
     def handle_file_upload(self, conn, addr):
-        """Handle file upload requests with chunk distribution"""
+        """Handle file upload requests with chunk distribution
+        
+        A whole file arrives as one 'upload' request. Parallel uploads
+        instead open a session with 'upload_init', send each chunk on its own
+        connection as 'upload_chunk', and finish with 'upload_commit'.
+        Clients may keep the connection open and send further requests,
+        including 'download', which streams a stored file back.
+        """
         try:
-            # Receive upload request
-            data = self.recv_message(conn)
-            if not data:
-                return
-            
-            request = json.loads(data.decode('utf-8'))
-            if request.get('type') != 'upload':
-                return
-            
-            filename = request.get('filename')
-            file_size = request.get('file_size')
-            file_data = request.get('file_data')
-            
-            print(f"[UPLOAD] Upload request: {filename} ({file_size} bytes)")
-            
-            # Generate file ID and chunk the file
-            file_id = str(uuid.uuid4())
-            chunks = self.split_file_into_chunks(file_data, filename)
-            
-            # Select nodes for chunk storage
-            available_nodes = []
-            with self.nodes_lock:
-                for node_id, node_info in self.nodes.items():
-                    if node_info.get('status') == 'online':
-                        available_nodes.append(node_id)
-            
-            if not available_nodes:
-                response = {'type': 'upload_error', 'message': 'No available nodes'}
-                self.send_message(conn, json.dumps(response).encode('utf-8'))
-                return
-            
-            # Store chunks across nodes
-            chunk_mapping = {}
-            successful_chunks = 0
-            
-            for i, chunk_data in enumerate(chunks):
-                chunk_id = f"{file_id}_chunk_{i}"
-                selected_node = available_nodes[i % len(available_nodes)]
+            reader = FrameReader(conn)
+            while self.running:
+                # Receive upload header; any body follows as raw bytes
+                data = reader.recv_message()
+                if not data:
+                    break
                 
-                # Send chunk to node
-                if self.send_chunk_to_node(selected_node, chunk_id, chunk_data):
-                    chunk_mapping[chunk_id] = selected_node
-                    successful_chunks += 1
-                    
-                    # Store chunk metadata
-                    with self.chunks_lock:
-                        self.chunks[chunk_id] = {
-                            'chunk_id': chunk_id,
-                            'file_id': file_id,
-                            'node_id': selected_node,
-                            'size': len(chunk_data),
-                            'created_at': datetime.now().isoformat()
-                        }
+                request = self.decode_message(data)
+                msg_type = request.get('type')
+                
+                if msg_type == 'upload':
+                    response = self.handle_stream_upload(reader, request)
+                elif msg_type == 'upload_init':
+                    response = self.handle_upload_init(request)
+                elif msg_type == 'upload_probe':
+                    response = self.handle_upload_probe(request)
+                elif msg_type == 'upload_chunk':
+                    response = self.handle_upload_chunk(reader, request)
+                elif msg_type == 'upload_commit':
+                    response = self.handle_upload_commit(request)
+                elif msg_type == 'download':
+                    # Sends its own reply; False means the stream was cut short
+                    if self.handle_download(conn, request):
+                        continue
+                    break
                 else:
-                    print(f"[ERROR] Failed to store chunk {chunk_id} on node {selected_node}")
-            
-            # Store file metadata
-            if successful_chunks == len(chunks):
-                with self.files_lock:
-                    self.files[file_id] = {
-                        'file_id': file_id,
-                        'filename': filename,
-                        'size': file_size,
-                        'chunks': chunk_mapping,
-                        'uploaded_at': datetime.now().isoformat(),
-                        'status': 'complete'
-                    }
-                    self.save_database()
+                    break
                 
-                response = {
-                    'type': 'upload_complete',
-                    'file_id': file_id,
-                    'chunks_stored': successful_chunks,
-                    'total_chunks': len(chunks)
-                }
-                print(f"[SUCCESS] File upload complete: {filename} ({successful_chunks}/{len(chunks)} chunks)")
-            else:
-                response = {
-                    'type': 'upload_error',
-                    'message': f'Only {successful_chunks}/{len(chunks)} chunks stored'
-                }
-            
-            self.send_message(conn, json.dumps(response).encode('utf-8'))
+                if not self.send_message(conn, self.encode_message(response)):
+                    break
             
         except Exception as e:
             print(f"File upload error: {e}")
             response = {'type': 'upload_error', 'message': str(e)}
-            self.send_message(conn, json.dumps(response).encode('utf-8'))
+            self.send_message(conn, self.encode_message(response))
         finally:
             conn.close()
     
-    def split_file_into_chunks(self, file_data, filename):
-        """Split file data into chunks for distribution"""
-        chunk_size = len(file_data) // 3  # Split into 3 chunks
-        if chunk_size == 0:
-            chunk_size = len(file_data)
+    def handle_stream_upload(self, reader, request):
+        """Store a whole file streamed after its 'upload' header"""
+        filename = request.get('filename')
+        file_size = request.get('file_size')
+        # Compressed uploads name their encoding; chunks keep the encoded bytes
+        encoding = request.get('encoding')
+        original_size = request.get('original_size', file_size)
+        
+        print(f"[UPLOAD] Upload request: {filename} ({file_size} bytes)")
+        
+        # Generate file ID and plan the chunk layout
+        file_id = str(uuid.uuid4())
+        chunk_sizes = self.split_file_into_chunks(file_size)
+        
+        available_nodes = self.get_placement_candidates()
+        if not available_nodes:
+            # Consume the body so the client can read the error
+            self.forward_stream(reader, None, file_size)
+            return {'type': 'upload_error', 'message': 'No available nodes'}
         
-        chunks = []
-        for i in range(0, len(file_data), chunk_size):
-            chunk = file_data[i:i + chunk_size]
-            chunks.append(chunk)
+        # Stream chunks across nodes
+        chunk_mapping = {}
+        for i, chunk_size in enumerate(chunk_sizes):
+            chunk_id = f"{file_id}_chunk_{i}"
+            
+            # Forward the next chunk_size bytes of the upload to a node
+            selected_node = self.store_chunk(file_id, chunk_id, reader, chunk_size, available_nodes)
+            if selected_node:
+                chunk_mapping[chunk_id] = selected_node
+        
+        # Store file metadata
+        if len(chunk_mapping) == len(chunk_sizes):
+            self.record_file(file_id, filename, file_size, chunk_mapping, encoding, original_size, request.get('sha256'))
+            print(f"[SUCCESS] File upload complete: {filename} ({len(chunk_mapping)}/{len(chunk_sizes)} chunks)")
+            return {
+                'type': 'upload_complete',
+                'file_id': file_id,
+                'chunks_stored': len(chunk_mapping),
+                'total_chunks': len(chunk_sizes)
+            }
         
-        return chunks
+        return {
+            'type': 'upload_error',
+            'message': f'Only {len(chunk_mapping)}/{len(chunk_sizes)} chunks stored'
+        }
     
-    def send_chunk_to_node(self, node_id, chunk_id, chunk_data):
-        """Send chunk to specific node with ACK mechanism"""
+    def handle_upload_init(self, request):
+        """Open a parallel upload session with a client-chosen chunk size"""
+        filename = request.get('filename')
+        file_size = request.get('file_size')
+        chunk_size = request.get('chunk_size')
+        if not isinstance(file_size, int) or file_size < 0 or not isinstance(chunk_size, int) or chunk_size <= 0:
+            return {'type': 'upload_error', 'message': 'Invalid file or chunk size'}
+        
+        file_id = str(uuid.uuid4())
+        total_chunks = -(-file_size // chunk_size)
+        with self.uploads_lock:
+            self._expire_uploads(time.time())
+            self.uploads[file_id] = {
+                'filename': filename,
+                'size': file_size,
+                'chunk_size': chunk_size,
+                'total_chunks': total_chunks,
+                'sha256': request.get('sha256'),
+                'chunks': {},
+                # Claimed by the client that opened it; see _upload_in_use
+                'last_active': time.time(),
+                'inflight': 0
+            }
+        
+        print(f"[UPLOAD] Parallel upload request: {filename} ({file_size} bytes, {total_chunks} chunks)")
+        return {'type': 'upload_ready', 'file_id': file_id, 'total_chunks': total_chunks}
+    
+    def handle_upload_probe(self, request):
+        """Resume the unfinished session for the same file, or open a new one
+        
+        Sessions match on the filename, the file's sha256, size and chunk
+        size; the reply lists the chunk indices still missing, so a retried
+        upload only sends those. A session another upload is still using
+        is never handed out, so identical uploads running side by side each
+        get their own.
+        """
+        sha256 = request.get('sha256')
+        now = time.time()
+        with self.uploads_lock:
+            self._expire_uploads(now)
+            for file_id, session in self.uploads.items():
+                if (sha256 and session['sha256'] == sha256 and session['filename'] == request.get('filename')
+                        and session['size'] == request.get('file_size')
+                        and session['chunk_size'] == request.get('chunk_size')
+                        and not self._upload_in_use(session, now)):
+                    session['last_active'] = now
+                    missing = [i for i in range(session['total_chunks'])
+                               if f"{file_id}_chunk_{i}" not in session['chunks']]
+                    print(f"[UPLOAD] Resuming upload: {session['filename']} ({len(missing)}/{session['total_chunks']} chunks missing)")
+                    return {
+                        'type': 'upload_ready',
+                        'file_id': file_id,
+                        'total_chunks': session['total_chunks'],
+                        'missing_chunks': missing
+                    }
+        
+        response = self.handle_upload_init(request)
+        if response['type'] == 'upload_ready':
+            response['missing_chunks'] = list(range(response['total_chunks']))
+        return response
+    
+    def handle_upload_chunk(self, reader, request):
+        """Store one chunk of a parallel upload session"""
+        file_id = request.get('file_id')
+        index = request.get('index')
+        size = request.get('size', 0)
+        
+        # A chunk in flight keeps the session claimed however long it takes
+        with self.uploads_lock:
+            session = self.uploads.get(file_id)
+            if session:
+                session['inflight'] += 1
+        
         try:
-            with self.nodes_lock:
-                if node_id not in self.nodes:
-                    return False
-                node_info = self.nodes[node_id]
+            # The chunk must land exactly where the session's layout puts it
+            expected = None
+            if session and isinstance(index, int) and 0 <= index < session['total_chunks']:
+                expected = min(session['chunk_size'], session['size'] - index * session['chunk_size'])
             
-            # Connect to node
-            node_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            node_socket.settimeout(10)  # 10 second timeout
-            node_socket.connect((node_info['host'], node_info['port']))
+            available_nodes = self.get_placement_candidates()
+            if expected != size or not available_nodes:
+                # Consume the body so the client can read the error
+                self.forward_stream(reader, None, size)
+                message = 'No available nodes' if expected == size else 'Unknown upload or chunk'
+                return {'type': 'upload_error', 'message': message}
             
-            # Send chunk storage request
-            request = {
-                'type': 'store_chunk',
+            chunk_id = f"{file_id}_chunk_{index}"
+            selected_node = self.store_chunk(file_id, chunk_id, reader, size, available_nodes, request.get('sha256'))
+            if not selected_node:
+                return {'type': 'upload_error', 'message': f'Failed to store chunk {index}'}
+            
+            with self.uploads_lock:
+                session['chunks'][chunk_id] = selected_node
+            return {'type': 'chunk_stored', 'file_id': file_id, 'index': index}
+        finally:
+            if session:
+                with self.uploads_lock:
+                    session['inflight'] -= 1
+                    session['last_active'] = time.time()
+    
+    def _upload_in_use(self, session, now):
+        """Whether a parallel upload session still belongs to a running upload
+        
+        It does while a chunk is in flight and for UPLOAD_CLAIM_TIMEOUT
+        after its last request. Called with uploads_lock held.
+        """
+        return session['inflight'] > 0 or now - session['last_active'] < UPLOAD_CLAIM_TIMEOUT
+    
+    def _expire_uploads(self, now):
+        """Drop parallel upload sessions idle for longer than UPLOAD_SESSION_TTL
+        
+        Called with uploads_lock held. Chunks an expired session already
+        stored stay on their nodes, unreferenced.
+        """
+        expired = [file_id for file_id, session in self.uploads.items()
+                   if session['inflight'] == 0 and now - session['last_active'] > UPLOAD_SESSION_TTL]
+        for file_id in expired:
+            print(f"[UPLOAD] Expired abandoned upload: {self.uploads.pop(file_id)['filename']}")
+    
+    def handle_upload_commit(self, request):
+        """Close a parallel upload session once every chunk is stored"""
+        file_id = request.get('file_id')
+        with self.uploads_lock:
+            session = self.uploads.get(file_id)
+            if session and len(session['chunks']) == session['total_chunks']:
+                del self.uploads[file_id]
+            else:
+                session = None
+        
+        if not session:
+            return {'type': 'upload_error', 'message': 'Upload incomplete or unknown'}
+        
+        self.record_file(file_id, session['filename'], session['size'], session['chunks'], sha256=session['sha256'])
+        print(f"[SUCCESS] File upload complete: {session['filename']} ({session['total_chunks']}/{session['total_chunks']} chunks)")
+        return {
+            'type': 'upload_complete',
+            'file_id': file_id,
+            'chunks_stored': session['total_chunks'],
+            'total_chunks': session['total_chunks']
+        }
+    
+    def handle_download(self, conn, request):
+        """Stream a stored file to the client
+        
+        A download_ready header gives the stored size, encoding and sha256;
+        the chunk bytes follow it unframed, relayed from each node in order.
+        Returns False if the body could not be completed, leaving the
+        connection unusable.
+        """
+        file_id = request.get('file_id')
+        with self.files_lock:
+            file_info = self.files.get(file_id)
+        
+        error = None
+        if not file_info:
+            error = 'File not found'
+        else:
+            chunks = sorted(file_info['chunks'].items(), key=lambda item: int(item[0].rsplit('_', 1)[1]))
+            with self.chunks_lock:
+                chunk_sizes = [self.chunks.get(chunk_id, {}).get('size') for chunk_id, _ in chunks]
+            
+            # Refuse up front rather than cut the stream when a node is gone
+            for chunk_id, node_id in chunks:
+                node_info = self.get_node(node_id)
+                if not node_info or node_info.get('status') != 'online':
+                    error = f'Chunk {chunk_id} unavailable: node {node_id} offline'
+                    break
+            if None in chunk_sizes:
+                error = 'Chunk metadata missing'
+        
+        if error:
+            response = {'type': 'download_error', 'message': error}
+            return self.send_message(conn, self.encode_message(response))
+        
+        print(f"[DOWNLOAD] Download request: {file_info['filename']} ({len(chunks)} chunks)")
+        response = {
+            'type': 'download_ready',
+            'file_id': file_id,
+            'filename': file_info['filename'],
+            'size': file_info.get('stored_size', file_info['size']),
+            'original_size': file_info['size'],
+            'encoding': file_info.get('encoding'),
+            'sha256': file_info.get('sha256')
+        }
+        if not self.send_message(conn, self.encode_message(response)):
+            return False
+        
+        for (chunk_id, node_id), chunk_size in zip(chunks, chunk_sizes):
+            if not self.fetch_chunk_from_node(node_id, chunk_id, conn, chunk_size):
+                print(f"[ERROR] Download of {file_info['filename']} failed at chunk {chunk_id}")
+                return False
+        return True
+    
+    def get_placement_candidates(self):
+        """Snapshot online nodes and their capacity weights for chunk placement"""
+        available_nodes = []
+        for node_id, node_info in self.iter_nodes():
+            if node_info.get('status') == 'online':
+                available_nodes.append((node_id, node_info.get('storage_capacity', 0)))
+        return available_nodes
+    
+    def store_chunk(self, file_id, chunk_id, reader, chunk_size, available_nodes, sha256=None):
+        """Place a chunk, forward its bytes from reader and record its metadata
+        
+        Returns the node that stored it, or None.
+        """
+        selected_node = self.select_node(available_nodes, chunk_id)
+        ack = self.send_chunk_to_node(selected_node, chunk_id, reader, chunk_size, sha256)
+        if not ack:
+            print(f"[ERROR] Failed to store chunk {chunk_id} on node {selected_node}")
+            return None
+        
+        # Store chunk metadata
+        with self.chunks_lock:
+            self.chunks[chunk_id] = {
                 'chunk_id': chunk_id,
-                'chunk_data': chunk_data.decode('latin1')  # Encode binary data as string
+                'file_id': file_id,
+                'node_id': selected_node,
+                'size': chunk_size,
+                'sha256': ack.get('sha256'),
+                'created_at': datetime.now().isoformat()
             }
+        return selected_node
+    
+    def record_file(self, file_id, filename, file_size, chunk_mapping, encoding=None, original_size=None, sha256=None):
+        """Record a completely stored file and persist the database
+        
+        file_size is the number of bytes stored in the chunks. For an
+        encoded (e.g. zstd-compressed) upload, size is the original size
+        and stored_size what the chunks hold. sha256, when the client sent
+        one, is the digest of the original content, for downloads to check.
+        """
+        file_info = {
+            'file_id': file_id,
+            'filename': filename,
+            'size': file_size,
+            'chunks': chunk_mapping,
+            'uploaded_at': datetime.now().isoformat(),
+            'status': 'complete'
+        }
+        if sha256:
+            file_info['sha256'] = sha256
+        if encoding:
+            file_info['encoding'] = encoding
+            file_info['size'] = original_size
+            file_info['stored_size'] = file_size
+        
+        with self.files_lock:
+            self.files[file_id] = file_info
+        self.save_database()
+    
+    def split_file_into_chunks(self, file_size):
+        """Plan the chunk sizes used to distribute a file of file_size bytes"""
+        chunk_size = file_size // 3  # Split into 3 chunks
+        if chunk_size == 0:
+            chunk_size = file_size
+        
+        chunk_sizes = []
+        for i in range(0, file_size, chunk_size or 1):
+            chunk_sizes.append(min(chunk_size, file_size - i))
+        
+        return chunk_sizes
+    
+    def select_node(self, candidates, chunk_id):
+        """Pick a node for a chunk by weighted rendezvous (HRW) hashing
+        
+        candidates is a list of (node_id, storage_capacity). Each node scores
+        -capacity / ln(h) with h a uniform hash of node and chunk, so chunks
+        land in proportion to capacity and adding or removing a node only
+        moves the chunks that node wins or loses.
+        """
+        def score(candidate):
+            node_id, capacity = candidate
+            digest = hashlib.blake2b(f"{node_id}|{chunk_id}".encode('utf-8'), digest_size=8).digest()
+            h = (int.from_bytes(digest, 'big') + 0.5) / 2**64
+            return max(capacity, 1) / -math.log(h)
+        
+        return max(candidates, key=score)[0]
+    
+    def send_chunk_to_node(self, node_id, chunk_id, src, chunk_size, sha256=None):
+        """Stream chunk_size bytes from the src FrameReader to a specific node with ACK mechanism
+        
+        The chunk bytes are always consumed from src, even when the node
+        cannot be reached, so the upload stream stays aligned for the
+        chunks that follow. A sha256 from the client is passed on for the
+        node to verify. Returns the node's store_ack (which carries the
+        chunk's sha256) on success, otherwise None.
+        """
+        node_socket = None
+        try:
+            node_info = self.get_node(node_id)
+            if node_info:
+                node_socket = self._get_node_sock(node_id, node_info)
+                
+                # Send chunk storage header; the raw chunk bytes follow it
+                request = {
+                    'type': 'store_chunk',
+                    'chunk_id': chunk_id,
+                    'size': chunk_size
+                }
+                if sha256:
+                    request['sha256'] = sha256
+                
+                if not self.send_message(node_socket, self.encode_message(request)):
+                    node_socket.close()
+                    node_socket = None
+        except Exception as e:
+            print(f"Error sending chunk to node {node_id}: {e}")
+            if node_socket:
+                node_socket.close()
+            node_socket = None
+        
+        try:
+            # Errors on src propagate: the upload itself is broken at that point
+            if not self.forward_stream(src, node_socket, chunk_size):
+                return None
             
-            self.send_message(node_socket, json.dumps(request).encode('utf-8'))
+            try:
+                # Wait for ACK
+                response_data = FrameReader(node_socket).recv_message()
+                if response_data:
+                    response = self.decode_message(response_data)
+                    if response.get('type') == 'store_ack':
+                        # The exchange completed, so the connection can be reused
+                        self._release_node_sock(node_id, node_socket)
+                        node_socket = None
+                        if response.get('status') == 'success':
+                            return response
+                return None
+                
+            except Exception as e:
+                print(f"Error sending chunk to node {node_id}: {e}")
+                return None
+        finally:
+            # Any socket not handed back to the pool is closed, including
+            # when forward_stream raises on a broken src
+            if node_socket:
+                node_socket.close()
+    
+    def fetch_chunk_from_node(self, node_id, chunk_id, dst, chunk_size):
+        """Relay a chunk's bytes from its node to socket dst
+        
+        The counterpart of send_chunk_to_node: retrieve_chunk goes out on a
+        pooled connection and the node's raw reply is forwarded (spliced on
+        Linux) without entering Python. Returns True once dst has it all.
+        """
+        node_socket = None
+        try:
+            node_info = self.get_node(node_id)
+            if not node_info:
+                return False
+            node_socket = self._get_node_sock(node_id, node_info)
             
-            # Wait for ACK
-            response_data = self.recv_message(node_socket)
-            if response_data:
-                response = json.loads(response_data.decode('utf-8'))
-                if response.get('type') == 'store_ack' and response.get('status') == 'success':
-                    node_socket.close()
-                    return True
+            request = {'type': 'retrieve_chunk', 'chunk_id': chunk_id}
+            if not self.send_message(node_socket, self.encode_message(request)):
+                return False
             
-            node_socket.close()
-            return False
+            reader = FrameReader(node_socket)
+            response_data = reader.recv_message()
+            if not response_data:
+                return False
+            response = self.decode_message(response_data)
+            if response.get('status') != 'success' or response.get('size') != chunk_size:
+                print(f"Error retrieving chunk {chunk_id} from node {node_id}: {response.get('message', 'size mismatch')}")
+                if response.get('status') != 'success':
+                    # An error reply has no body, so the connection is still in step
+                    self._release_node_sock(node_id, node_socket)
+                    node_socket = None
+                return False
+            
+            delivered = self.forward_stream(reader, dst, chunk_size)
+            
+            # The node's bytes were drained either way, so its connection is reusable
+            self._release_node_sock(node_id, node_socket)
+            node_socket = None
+            return delivered
             
         except Exception as e:
-            print(f"Error sending chunk to node {node_id}: {e}")
+            print(f"Error retrieving chunk {chunk_id} from node {node_id}: {e}")
             return False
+        finally:
+            if node_socket:
+                node_socket.close()
+    
+    def _get_node_sock(self, node_id, node_info):
+        """Take an idle connection to a node from its pool, or open one"""
+        pool = self._node_conns.setdefault(node_id, queue.Queue(maxsize=NODE_POOL_SIZE))
+        while True:
+            try:
+                sock = pool.get_nowait()
+            except queue.Empty:
+                break
+            # An idle connection is only readable once the node has closed it
+            readable, _, _ = select.select([sock], [], [], 0)
+            if not readable:
+                return sock
+            sock.close()
+        
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            self.tune_socket(sock)
+            sock.settimeout(10)  # 10 second timeout
+            sock.connect((node_info['host'], node_info['port']))
+        except Exception:
+            sock.close()
+            raise
+        return sock
+    
+    def _release_node_sock(self, node_id, sock):
+        """Return a connection to its node's pool, closing it if the pool is full"""
+        try:
+            self._node_conns[node_id].put_nowait(sock)
+        except (KeyError, queue.Full):
+            sock.close()
+    
+    def forward_stream(self, reader, dst, count):
+        """Forward exactly count bytes from a FrameReader's socket to socket dst
+        
+        Bytes the reader already buffered go first; the rest uses splice(2)
+        through a pipe where available so the payload never enters Python.
+        A dst of None (or one that fails mid-transfer) still drains count
+        bytes from the reader. Returns True when dst received them all.
+        """
+        buffered = reader.take_buffered(count)
+        if buffered and dst is not None:
+            try:
+                dst.sendall(buffered)
+            except OSError:
+                dst = None
+        
+        src = reader.sock
+        remaining = count - len(buffered)
+        if hasattr(os, 'splice'):
+            return self._splice_stream(src, dst, remaining)
+        
+        # Relay through one reusable buffer; slices of the view are not copies
+        block = memoryview(bytearray(min(remaining, SPLICE_BLOCK_SIZE)))
+        while remaining > 0:
+            n = src.recv_into(block, min(remaining, len(block)))
+            if not n:
+                raise ConnectionError("Upload stream closed early")
+            remaining -= n
+            if dst is not None:
+                try:
+                    dst.sendall(block[:n])
+                except OSError:
+                    dst = None
+        return dst is not None
+    
+    def _splice_stream(self, src, dst, count):
+        """splice(2) implementation of forward_stream"""
+        read_fd, write_fd = os.pipe()
+        try:
+            remaining = count
+            while remaining > 0:
+                moved = self._splice_io(src, src.fileno(), write_fd, min(remaining, SPLICE_BLOCK_SIZE), select_read=True)
+                if moved == 0:
+                    raise ConnectionError("Upload stream closed early")
+                remaining -= moved
+                
+                # Empty the pipe into dst, or discard once dst has failed
+                while moved > 0:
+                    if dst is not None:
+                        try:
+                            moved -= self._splice_io(dst, read_fd, dst.fileno(), moved, select_read=False)
+                            continue
+                        except OSError:
+                            dst = None
+                    moved -= len(os.read(read_fd, moved))
+            return dst is not None
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+    
+    def _splice_io(self, sock, fd_in, fd_out, count, select_read):
+        """Run one splice, waiting on sock when it is in non-blocking/timeout mode"""
+        while True:
+            try:
+                return os.splice(fd_in, fd_out, count)
+            except BlockingIOError:
+                watch = [sock]
+                readable, writable, _ = select.select(watch if select_read else [], [] if select_read else watch, [], sock.gettimeout())
+                if not readable and not writable:
+                    raise socket.timeout("splice timed out")
+    
+    def _schedule_expiry(self, node_id, last_heartbeat):
+        """Queue the moment node_id times out unless another heartbeat arrives"""
+        with self._expiry_lock:
+            was_idle = not self._expiry
+            heapq.heappush(self._expiry, (last_heartbeat + HEARTBEAT_TIMEOUT, node_id, last_heartbeat))
+        if was_idle:
+            self._expiry_event.set()
     
     def monitor_nodes(self):
-        """Monitor node health and detect offline nodes"""
+        """Monitor node health and detect offline nodes
+        
+        Sleeps until the earliest heartbeat deadline rather than scanning
+        every node on a fixed tick. Entries are tagged with the heartbeat
+        that scheduled them; one superseded by a newer heartbeat is dropped
+        when popped.
+        """
         while self.running:
             try:
-                current_time = time.time()
-                with self.nodes_lock:
-                    for node_id, node_info in list(self.nodes.items()):
-                        last_heartbeat = node_info.get('last_heartbeat', 0)
-                        if (current_time - last_heartbeat) > 60 and node_info.get('status') == 'online':
-                            print(f"[OFFLINE] Node {node_id} marked offline (heartbeat timeout)")
-                            self.nodes[node_id]['status'] = 'offline'
-                            self.save_database()
+                self._expiry_event.clear()
+                with self._expiry_lock:
+                    current_time = time.time()
+                    expired = []
+                    while self._expiry and self._expiry[0][0] <= current_time:
+                        expired.append(heapq.heappop(self._expiry))
+                    timeout = self._expiry[0][0] - current_time if self._expiry else None
+                
+                went_offline = False
+                for _, node_id, heartbeat in expired:
+                    def is_stale(node_info, heartbeat=heartbeat):
+                        return node_info.get('last_heartbeat') == heartbeat and node_info.get('status') == 'online'
+                    
+                    if self._update_node(node_id, {'status': 'offline'}, only_if=is_stale):
+                        print(f"[OFFLINE] Node {node_id} marked offline (heartbeat timeout)")
+                        went_offline = True
                 
-                time.sleep(30)  # Check every 30 seconds
+                # One save per sweep, however many nodes expired together
+                if went_offline:
+                    self.save_database()
+                
+                # Woken early when a heartbeat lands on an empty schedule
+                self._expiry_event.wait(timeout)
                 
             except Exception as e:
                 print(f"Node monitoring error: {e}")
     
-    def recv_message(self, sock):
-        """Receive a message with length prefix"""
-        try:
-            # First receive the message length
-            length_data = sock.recv(4)
-            if not length_data:
-                return None
-            
-            msg_length = struct.unpack('!I', length_data)[0]
-            
-            # Then receive the message data
-            data = b''
-            while len(data) < msg_length:
-                chunk = sock.recv(min(msg_length - len(data), 4096))
-                if not chunk:
-                    return None
-                data += chunk
-            
-            return data
-        except Exception:
-            return None
+    def tune_socket(self, sock):
+        """Disable Nagle and enlarge kernel buffers on a data path socket"""
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
+    
+    def encode_message(self, message: Dict[str, Any]) -> bytes:
+        """Serialize a protocol message to a versioned MessagePack frame"""
+        return bytes((PROTOCOL_VERSION,)) + msgpack.packb(message, use_bin_type=True)
     
-    def send_message(self, sock, data):
+    def decode_message(self, data: bytes) -> Dict[str, Any]:
+        """Deserialize a versioned MessagePack frame"""
+        if data[0] != PROTOCOL_VERSION:
+            raise ValueError(f"Unsupported protocol version: {data[0]}")
+        return msgpack.unpackb(memoryview(data)[1:], raw=False)
+    
+    def send_message(self, sock: socket.socket, data: bytes) -> bool:
         """Send a message with length prefix"""
         try:
-            # Send message length first
-            msg_length = len(data)
-            sock.sendall(struct.pack('!I', msg_length))
+            header = LENGTH_PREFIX.pack(len(data))
+            if not hasattr(sock, 'sendmsg'):
+                sock.sendall(header + data)
+                return True
             
-            # Then send the message data
-            sock.sendall(data)
+            # Length and payload leave in one gathered sendmsg(2); only a
+            # short write falls back to sending the remainder
+            sent = sock.sendmsg([header, data])
+            if sent < len(header):
+                sock.sendall(header[sent:])
+                sock.sendall(data)
+            elif sent < len(header) + len(data):
+                sock.sendall(memoryview(data)[sent - len(header):])
             return True
         except Exception:
             return False
@@ -380,6 +1049,7 @@ class CloudGateway:
         try:
             server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            self.tune_socket(server)  # Buffer sizes must be set before listen() to scale the window
             server.bind((self.host, self.node_port))
             server.listen(10)
             
@@ -388,7 +1058,8 @@ class CloudGateway:
             while self.running:
                 try:
                     conn, addr = server.accept()
-                    threading.Thread(target=self.handle_node_registration, args=(conn, addr)).start()
+                    self.tune_socket(conn)
+                    threading.Thread(target=self.handle_node_registration, args=(conn, addr), daemon=True).start()
                 except Exception as e:
                     if self.running:
                         print(f"Node listener error: {e}")
@@ -396,33 +1067,99 @@ class CloudGateway:
         except Exception as e:
             print(f"Failed to start node listener: {e}")
     
-    def start_upload_listener(self):
-        """Start listener for file uploads"""
+    def start_heartbeat_listener(self):
+        """Start the UDP listener for node heartbeats
+        
+        A heartbeat is one datagram holding an encoded message and is
+        acknowledged with one datagram, so no connection is set up per beat.
+        Shares the node port number with the TCP registration listener.
+        """
         try:
-            server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            server = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
             server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            server.bind((self.host, self.upload_port))
-            server.listen(10)
+            server.bind((self.host, self.node_port))
             
-            print(f"[LISTEN] Upload listener started on {self.host}:{self.upload_port}")
+            print(f"[LISTEN] Heartbeat listener started on {self.host}:{self.node_port} (udp)")
             
             while self.running:
                 try:
-                    conn, addr = server.accept()
-                    threading.Thread(target=self.handle_file_upload, args=(conn, addr)).start()
+                    data, addr = server.recvfrom(HEARTBEAT_DATAGRAM_SIZE)
+                    message = self.decode_message(data)
+                    if message.get('type') != 'heartbeat':
+                        continue
+                    
+                    self._update_node(message.get('node_id'), {'last_heartbeat': time.time(), 'status': 'online'})
+                    server.sendto(self._heartbeat_ack, addr)
                 except Exception as e:
                     if self.running:
-                        print(f"Upload listener error: {e}")
+                        print(f"Heartbeat listener error: {e}")
+                        
+        except Exception as e:
+            print(f"Failed to start heartbeat listener: {e}")
+    
+    def start_upload_listener(self):
+        """Start listener for file uploads
+        
+        Where SO_REUSEPORT exists, several sockets bind the upload port and
+        each gets its own accept thread, so a burst of parallel chunk
+        connections is spread across separate accept queues.
+        """
+        try:
+            reuse_port = hasattr(socket, 'SO_REUSEPORT')
+            if reuse_port:
+                self.claim_port(self.upload_port)
+            servers = []
+            for _ in range(max(2, os.cpu_count() or 1) if reuse_port else 1):
+                server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                if reuse_port:
+                    server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+                self.tune_socket(server)  # Buffer sizes must be set before listen() to scale the window
+                server.bind((self.host, self.upload_port))
+                server.listen(10)
+                servers.append(server)
+            
+            print(f"[LISTEN] Upload listener started on {self.host}:{self.upload_port} ({len(servers)} accept queue(s))")
+            
+            for server in servers[1:]:
+                threading.Thread(target=self.upload_accept_loop, args=(server,), daemon=True).start()
+            self.upload_accept_loop(servers[0])
                         
         except Exception as e:
             print(f"Failed to start upload listener: {e}")
     
+    def claim_port(self, port):
+        """Raise EADDRINUSE if another process already holds port
+        
+        Any socket with SO_REUSEPORT may join the port, so a second
+        gateway would bind silently and take half the uploads; a plain
+        bind fails as it did before the port was shared.
+        """
+        probe = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            probe.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            probe.bind((self.host, port))
+        finally:
+            probe.close()
+    
+    def upload_accept_loop(self, server):
+        """Accept upload connections on one listening socket"""
+        while self.running:
+            try:
+                conn, addr = server.accept()
+                self.tune_socket(conn)
+                threading.Thread(target=self.handle_file_upload, args=(conn, addr), daemon=True).start()
+            except Exception as e:
+                if self.running:
+                    print(f"Upload listener error: {e}")
+    
     def start(self):
         """Start the cloud gateway"""
         print("[START] Starting Cloud Gateway...")
         
         # Start all components in separate threads
         threading.Thread(target=self.start_node_listener, daemon=True).start()
+        threading.Thread(target=self.start_heartbeat_listener, daemon=True).start()
         threading.Thread(target=self.start_upload_listener, daemon=True).start()
         threading.Thread(target=self.monitor_nodes, daemon=True).start()
         
@@ -435,5 +1172,7 @@ class CloudGateway:
             self.save_database()
 
 if __name__ == "__main__":
-    gateway = CloudGateway()
+    # Importing by name picks up the mypyc build (setup.py --compile) when present
+    import importlib
+    gateway = importlib.import_module('cloud_gateway').CloudGateway()
     gateway.start()
\ No newline at end of file
@@ -5,9 +5,10 @@ Create Node Utility - Create and configure a new storage node
 
 import os
 import sys
-import json
 import shutil
 
+import orjson
+
 class NodeCreator:
     def __init__(self):
         self.nodes_config_file = 'nodes_config.json'
@@ -16,15 +17,15 @@ class NodeCreator:
     def load_existing_nodes(self):
         """Load existing node configurations"""
         if os.path.exists(self.nodes_config_file):
-            with open(self.nodes_config_file, 'r') as f:
-                self.existing_nodes = json.load(f)
+            with open(self.nodes_config_file, 'rb') as f:
+                self.existing_nodes = orjson.loads(f.read())
         else:
             self.existing_nodes = {}
     
     def save_nodes_config(self):
         """Save node configurations"""
-        with open(self.nodes_config_file, 'w') as f:
-            json.dump(self.existing_nodes, f, indent=2)
+        with open(self.nodes_config_file, 'wb') as f:
+            f.write(orjson.dumps(self.existing_nodes, option=orjson.OPT_INDENT_2))
     
     def create_node(self, node_id, host='localhost', port=None, storage_gb=1, cpu_cores=1, bandwidth='1Gbps'):
         """Create a new storage node configuration"""
@@ -119,7 +119,7 @@ def main():
     print(f"   - Test file: {test_file}")
     print("   - Node storage: storage_demo_node1/, storage_demo_node2/")
     print("   - Configuration: nodes_config.json")
-    print("   - Database: cloud_db.pkl")
+    print("   - Database: cloud_db.json")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -5,46 +5,179 @@ File Download Client - Download files from the distributed cloud storage system
 """
 
 import socket
-import json
 import os
-import struct
 import sys
+import hashlib
 from datetime import datetime
 
+import msgpack
+
+try:
+    import zstandard
+except ImportError:
+    # Optional: only needed for files uploaded zstd-compressed
+    zstandard = None  # type: ignore[assignment]
+
+# Leading byte of every message payload, bumped on wire format changes
+PROTOCOL_VERSION = 1
+
+# Largest single recv_into() when receiving the file body
+RECV_BLOCK_SIZE = 1 << 20
+
+# Kernel receive buffer requested on the gateway socket
+SOCKET_BUFFER_SIZE = 4 << 20
+
 class DownloadClient:
     def __init__(self, cloud_host='localhost', cloud_port=8000):
         self.cloud_host = cloud_host
         self.cloud_port = cloud_port
     
     def download_file(self, file_id, output_path=None):
-        """Download a file from the cloud storage"""
+        """Download a file from the cloud storage
+        
+        The gateway answers with a download_ready header, then streams the
+        file's chunks back to back. The body is written to a .part file
+        and only renamed into place once its size and sha256 check out.
+        """
         try:
-            # First get file metadata from cloud gateway
             print(f"[LOOKUP] Looking up file: {file_id}")
             
-            # For this demo, we'll simulate getting file metadata
-            # In a full implementation, you'd query the cloud gateway
-            
-            # For now, let's create a simple test file download
-            # This would be replaced with actual chunk retrieval logic
-            
-            print(f"[DOWNLOAD] Downloading file: {file_id}")
-            
-            if not output_path:
-                output_path = f"downloaded_{file_id}"
-            
-            # Create a test file (in real implementation, retrieve chunks)
-            test_content = f"This is a test file {file_id}\nDownloaded at {datetime.now()}"
-            
-            with open(output_path, 'w') as f:
-                f.write(test_content)
+            sock = self.connect()
+            try:
+                self.send_message(sock, self.encode_message({'type': 'download', 'file_id': file_id}))
+                
+                response_data = self.recv_message(sock)
+                if not response_data:
+                    print(f"[ERROR] No response from Cloud Gateway")
+                    return False
+                
+                response = self.decode_message(response_data)
+                if response.get('type') != 'download_ready':
+                    print(f"[ERROR] Download failed: {response.get('message', 'Unknown error')}")
+                    return False
+                
+                filename = response.get('filename')
+                size = response.get('size')
+                encoding = response.get('encoding')
+                if encoding and (encoding != 'zstd' or zstandard is None):
+                    print(f"[ERROR] Cannot decode '{encoding}' content (pip install zstandard)")
+                    return False
+                
+                if not output_path:
+                    output_path = f"downloaded_{filename}"
+                
+                print(f"[DOWNLOAD] Downloading file: {filename} ({size} bytes)")
+                
+                part_path = f"{output_path}.part"
+                digest = hashlib.sha256()
+                try:
+                    with open(part_path, 'wb') as out:
+                        written = self.receive_body(sock, out, size, encoding, digest)
+                    
+                    expected = response.get('sha256')
+                    if written != response.get('original_size', size) or (expected and digest.hexdigest() != expected):
+                        raise ValueError("Downloaded content does not match the uploaded file")
+                    os.replace(part_path, output_path)
+                except Exception:
+                    if os.path.exists(part_path):
+                        os.remove(part_path)
+                    raise
+            finally:
+                sock.close()
             
             print(f"[SUCCESS] File downloaded to: {output_path}")
+            print(f"[TIME] Download time: {datetime.now().strftime('%H:%M:%S')}")
             return True
-            
+        
         except Exception as e:
             print(f"[ERROR] Download error: {e}")
             return False
+    
+    def receive_body(self, sock, out, size, encoding, digest):
+        """Receive size raw bytes into out, decoding and hashing on the way
+        
+        One reusable buffer is filled with recv_into, so memory stays
+        bounded however large the file. Returns the bytes written.
+        """
+        decompressor = zstandard.ZstdDecompressor().decompressobj() if encoding == 'zstd' else None
+        view = memoryview(bytearray(max(1, min(size, RECV_BLOCK_SIZE))))
+        written = 0
+        remaining = size
+        while remaining:
+            n = sock.recv_into(view, min(remaining, len(view)))
+            if not n:
+                raise ConnectionError(f"Download stream closed {remaining} bytes early")
+            remaining -= n
+            
+            data = view[:n] if decompressor is None else decompressor.decompress(view[:n])
+            digest.update(data)
+            out.write(data)
+            written += len(data)
+        
+        # Written once and not read back: keep it from crowding the page cache
+        if hasattr(os, 'posix_fadvise'):
+            out.flush()
+            os.posix_fadvise(out.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+        return written
+    
+    def connect(self):
+        """Open a socket to the gateway"""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            # Set before connect() so the window scale covers the larger buffer
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
+            sock.connect((self.cloud_host, self.cloud_port))
+        except Exception:
+            sock.close()
+            raise
+        return sock
+    
+    def encode_message(self, message):
+        """Serialize a protocol message to a versioned MessagePack frame"""
+        return bytes((PROTOCOL_VERSION,)) + msgpack.packb(message, use_bin_type=True)
+    
+    def decode_message(self, data):
+        """Deserialize a versioned MessagePack frame"""
+        if data[0] != PROTOCOL_VERSION:
+            raise ValueError(f"Unsupported protocol version: {data[0]}")
+        return msgpack.unpackb(memoryview(data)[1:], raw=False)
+    
+    def send_message(self, sock, data):
+        """Send a message with length prefix"""
+        try:
+            sock.sendall(len(data).to_bytes(4, 'big') + data)
+            return True
+        except Exception as e:
+            print(f"Send error: {e}")
+            return False
+    
+    def recv_message(self, sock):
+        """Receive a message with length prefix
+        
+        Reads exactly the frame and nothing more, so the raw file body
+        after the header is left on the socket.
+        """
+        try:
+            length_data = self.recv_exact(sock, 4)
+            if length_data is None:
+                return None
+            return self.recv_exact(sock, int.from_bytes(length_data, 'big'))
+        except Exception as e:
+            print(f"Receive error: {e}")
+            return None
+    
+    def recv_exact(self, sock, size):
+        """Receive exactly size bytes, or None if the connection closes first"""
+        buf = bytearray(size)
+        view = memoryview(buf)
+        received = 0
+        while received < size:
+            n = sock.recv_into(view[received:], size - received)
+            if not n:
+                return None
+            received += n
+        return buf
 
 def main():
     if len(sys.argv) < 2:
@@ -72,4 +205,4 @@ def main():
         sys.exit(1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
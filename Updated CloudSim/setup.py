@@ -6,7 +6,13 @@ Setup Script - Make all Python files executable and prepare the system
 
 import os
 import sys
+import glob
 import stat
+import subprocess
+
+# Modules built with mypyc by --compile: the gateway's message path and the
+# upload client's framing path
+COMPILED_MODULES = ['cloud_gateway.py', 'upload_client.py']
 
 def make_executable(filepath):
     """Make a file executable"""
@@ -17,6 +23,18 @@ def make_executable(filepath):
     except Exception as e:
         print(f"[ERROR] Failed to make executable: {filepath} - {e}")
 
+def compile_module(filename):
+    """Compile a module into a C extension with mypyc (optional speedup)"""
+    print(f"[COMPILE] Compiling {filename} with mypyc...")
+    try:
+        result = subprocess.run([sys.executable, '-m', 'mypyc', '--ignore-missing-imports', filename])
+        if result.returncode == 0:
+            print(f"[SUCCESS] Compiled module will be used by: python {filename}")
+        else:
+            print(f"[ERROR] mypyc compilation failed, the pure Python {filename} will be used")
+    except Exception as e:
+        print(f"[ERROR] mypyc not available ({e}). Install it with: pip install mypy")
+
 def main():
     print("[SETUP] Setting up Distributed Cloud Storage System")
     print("=" * 50)
@@ -53,7 +71,7 @@ def main():
                 print(f"[ERROR] Failed to remove {item}: {e}")
     
     # Clean up database files
-    db_files = ['cloud_db.pkl', 'nodes_config.json']
+    db_files = ['cloud_db.json', 'nodes_config.json']
     for db_file in db_files:
         if os.path.exists(db_file):
             try:
@@ -62,6 +80,21 @@ def main():
             except Exception as e:
                 print(f"[ERROR] Failed to remove {db_file}: {e}")
     
+    # Remove compiled modules so edits to their sources are not shadowed
+    for module in COMPILED_MODULES:
+        name = os.path.splitext(module)[0]
+        for artifact in glob.glob(f'{name}.*.so') + glob.glob(f'{name}.*.pyd'):
+            try:
+                os.remove(artifact)
+                print(f"[REMOVED] Removed: {artifact}")
+            except Exception as e:
+                print(f"[ERROR] Failed to remove {artifact}: {e}")
+    
+    if '--compile' in sys.argv:
+        print()
+        for module in COMPILED_MODULES:
+            compile_module(module)
+    
     print()
     print("[SUCCESS] Setup complete!")
     print()
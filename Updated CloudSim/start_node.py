@@ -7,7 +7,8 @@ Start Node Utility - Start a storage node
 import os
 import sys
 import subprocess
-import json
+
+import orjson
 
 def main():
     if len(sys.argv) < 2:
@@ -23,8 +24,8 @@ def main():
         print(f"[ERROR] No node configurations found. Create a node first with create_node.py")
         sys.exit(1)
     
-    with open(config_file, 'r') as f:
-        nodes_config = json.load(f)
+    with open(config_file, 'rb') as f:
+        nodes_config = orjson.loads(f.read())
     
     if node_id not in nodes_config:
         print(f"[ERROR] Node {node_id} not found!")
@@ -6,15 +6,44 @@ Handles chunk storage, heartbeat communication, and autonomous operation
 
 import socket
 import threading
-import json
 import os
+import sys
 import time
 import hashlib
 import struct
 import uuid
 import shutil
+import mmap
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+import msgpack
+
+# Leading byte of every message payload, bumped on wire format changes
+PROTOCOL_VERSION = 1
+
+# 4-byte big-endian frame length, compiled once instead of per call
+LENGTH_PREFIX = struct.Struct('!I')
+
+# Largest framed message accepted; chunk bytes travel unframed after their
+# header, so anything bigger means the stream is out of step
+MAX_MESSAGE_SIZE = 1 << 20
+
+# Kernel send/receive buffer requested on the gateway connection
+SOCKET_BUFFER_SIZE = 1 << 20
+
+# ANSI cursor-home + erase-display, replaces shelling out to clear/cls
+CLEAR_SCREEN = '\x1b[H\x1b[2J' if os.name == 'posix' else ''
+
+# Seconds a chunk connection may sit idle or stalled before it is closed
+CONNECTION_TIMEOUT = 30
+
+# Request counters reported in the node statistics
+STAT_COUNTERS = ('chunks_stored', 'total_storage_used', 'total_requests', 'successful_requests')
+
+# Chunks at least this large are written without lingering in the page cache
+LARGE_CHUNK_SIZE = 64 * 1024
+
 class StorageNode:
     def __init__(self, node_id, host='localhost', port=9001, storage_capacity=1024*1024*1024, cpu_cores=1, bandwidth='1Gbps'):
         self.node_id = node_id
@@ -30,18 +59,34 @@ class StorageNode:
         self.registered = False
         self.last_heartbeat = 0
         
-        # Node statistics
+        # Persistent connection to the Cloud Gateway for registrations
+        self.cloud_sock = None
+        self.cloud_sock_lock = threading.Lock()
+        
+        # Heartbeats go over UDP; the heartbeat never changes, so it is encoded once
+        self.udp_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.udp_sock.settimeout(5)
+        self._heartbeat_data = self.encode_message({
+            'type': 'heartbeat',
+            'node_id': self.node_id
+        })
+        
+        # Node statistics. Request counters are kept per thread (see
+        # thread_stats) and summed by get_stats.
         self.stats = {
-            'chunks_stored': 0,
-            'total_storage_used': 0,
-            'uptime_start': datetime.now(),
-            'total_requests': 0,
-            'successful_requests': 0
+            'uptime_start': datetime.now()
         }
+        self.stats_shards = []
+        self.local_stats = threading.local()
         
         # Thread-safe locks
         self.stats_lock = threading.Lock()
-        self.storage_lock = threading.Lock()
+        
+        # Fixed set of workers serving chunk connections; open connections
+        # are tracked so stop() can unblock the workers reading them
+        self.pool = ThreadPoolExecutor(max_workers=max(8, 2 * cpu_cores), thread_name_prefix=f"node-{node_id}")
+        self.connections = set()
+        self.connections_lock = threading.Lock()
         
     def boot_sequence(self):
         """Simulate node boot sequence"""
@@ -50,20 +95,22 @@ class StorageNode:
         # Create storage directory and allocate disk space
         self.allocate_storage()
         
-        # Check cloud gateway availability
-        if self.check_cloud_availability():
-            print(f"[SUCCESS] Cloud Gateway found at {self.cloud_host}:{self.cloud_port}")
-            if self.register_with_cloud():
-                print(f"[SUCCESS] Node {self.node_id} registered successfully")
-                self.registered = True
-            else:
-                print(f"[ERROR] Registration failed")
-                return False
-        else:
+        # Registering doubles as the availability check: no separate probe connection
+        try:
+            registered = self.register_with_cloud()
+        except OSError:
             print(f"[ERROR] Cloud Gateway not available at {self.cloud_host}:{self.cloud_port}")
             print("[RETRY] Will retry registration periodically...")
             return False
         
+        if registered:
+            print(f"[SUCCESS] Cloud Gateway found at {self.cloud_host}:{self.cloud_port}")
+            print(f"[SUCCESS] Node {self.node_id} registered successfully")
+            self.registered = True
+        else:
+            print(f"[ERROR] Registration failed")
+            return False
+        
         return True
     
     def allocate_storage(self):
@@ -76,17 +123,22 @@ class StorageNode:
             # Create storage directory
             os.makedirs(self.storage_dir, exist_ok=True)
             
-            # Create a large file to reserve disk space
+            # Reserve disk space for a large file without writing zeros
             storage_file = os.path.join(self.storage_dir, 'storage_reserve.dat')
-            with open(storage_file, 'wb') as f:
-                # Write in chunks to avoid memory issues
-                chunk_size = 1024 * 1024  # 1MB chunks
-                remaining = self.storage_capacity
+            fd = os.open(storage_file, os.O_CREAT | os.O_WRONLY, 0o644)
+            try:
+                try:
+                    # Blocks are allocated in filesystem metadata only
+                    os.posix_fallocate(fd, 0, self.storage_capacity)
+                except (AttributeError, OSError):
+                    # Platform or filesystem without fallocate: sparse file
+                    os.ftruncate(fd, self.storage_capacity)
                 
-                while remaining > 0:
-                    write_size = min(chunk_size, remaining)
-                    f.write(b'\x00' * write_size)
-                    remaining -= write_size
+                # Nothing will read the reservation back, keep it out of the page cache
+                if hasattr(os, 'posix_fadvise'):
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+            finally:
+                os.close(fd)
             
             print(f"[STORAGE] Storage allocated: {self.storage_capacity / (1024**3):.2f} GB at {self.storage_dir}")
             
@@ -94,23 +146,13 @@ class StorageNode:
             print(f"[ERROR] Storage allocation error: {e}")
             raise
     
-    def check_cloud_availability(self):
-        """Check if Cloud Gateway is reachable"""
-        try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(5)  # 5 second timeout
-            result = sock.connect_ex((self.cloud_host, self.cloud_port))
-            sock.close()
-            return result == 0
-        except Exception:
-            return False
-    
     def register_with_cloud(self):
-        """Register this node with the Cloud Gateway"""
+        """Register this node with the Cloud Gateway
+        
+        Raises OSError when the gateway cannot be reached, so callers can
+        tell an unavailable cloud from a rejected registration.
+        """
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.connect((self.cloud_host, self.cloud_port))
-            
             registration_msg = {
                 'type': 'register',
                 'node_id': self.node_id,
@@ -121,95 +163,146 @@ class StorageNode:
                 'bandwidth': self.bandwidth
             }
             
-            self.send_message(sock, json.dumps(registration_msg).encode('utf-8'))
-            
-            # Wait for response
-            response_data = self.recv_message(sock)
-            if response_data:
-                response = json.loads(response_data.decode('utf-8'))
-                if response.get('type') == 'registered' and response.get('status') == 'success':
-                    sock.close()
-                    return True
-            
-            sock.close()
-            return False
+            response = self.cloud_request(self.encode_message(registration_msg))
+            return bool(response) and response.get('type') == 'registered' and response.get('status') == 'success'
             
+        except OSError:
+            raise
         except Exception as e:
             print(f"[ERROR] Registration error: {e}")
             return False
     
     def send_heartbeat(self):
-        """Send heartbeat to Cloud Gateway"""
+        """Send heartbeat to Cloud Gateway
+        
+        One UDP datagram each way; a lost datagram is resent once before
+        the beat counts as failed.
+        """
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(5)
-            sock.connect((self.cloud_host, self.cloud_port))
-            
-            heartbeat_msg = {
-                'type': 'heartbeat',
-                'node_id': self.node_id
-            }
-            
-            self.send_message(sock, json.dumps(heartbeat_msg).encode('utf-8'))
-            
-            # Wait for ACK
-            response_data = self.recv_message(sock)
-            if response_data:
-                response = json.loads(response_data.decode('utf-8'))
+            for attempt in range(2):
+                self.udp_sock.sendto(self._heartbeat_data, (self.cloud_host, self.cloud_port))
+                
+                # Wait for ACK
+                try:
+                    response_data, _ = self.udp_sock.recvfrom(1024)
+                except socket.timeout:
+                    if attempt:
+                        raise
+                    continue
+                
+                response = self.decode_message(response_data)
                 if response.get('type') == 'heartbeat_ack':
                     self.last_heartbeat = time.time()
-                    sock.close()
                     return True
-            
-            sock.close()
             return False
             
         except Exception as e:
             print(f"[ERROR] Heartbeat error: {e}")
             return False
     
-    def handle_chunk_storage(self, conn, addr):
-        """Handle chunk storage requests"""
+    def cloud_request(self, data):
+        """Send an encoded message to the Cloud Gateway and return its decoded reply
+        
+        Uses the persistent gateway connection, opening it on first use. A
+        connection the gateway has dropped is replaced and the request is
+        retried once; returns None when no reply arrives.
+        """
+        with self.cloud_sock_lock:
+            for attempt in range(2):
+                try:
+                    if self.cloud_sock is None:
+                        self.cloud_sock = self.connect_cloud()
+                    if self.send_message(self.cloud_sock, data):
+                        response_data = self.recv_message(self.cloud_sock)
+                        if response_data:
+                            return self.decode_message(response_data)
+                except OSError:
+                    self.close_cloud_sock()
+                    if attempt:
+                        raise
+                    continue
+                self.close_cloud_sock()
+            return None
+    
+    def connect_cloud(self):
+        """Open a tuned connection to the Cloud Gateway"""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         try:
-            data = self.recv_message(conn)
-            if not data:
-                return
-            
-            request = json.loads(data.decode('utf-8'))
-            if request.get('type') != 'store_chunk':
-                return
-            
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
+            sock.settimeout(5)
+            sock.connect((self.cloud_host, self.cloud_port))
+        except Exception:
+            sock.close()
+            raise
+        return sock
+    
+    def close_cloud_sock(self):
+        """Drop the gateway connection; the next request reconnects"""
+        if self.cloud_sock is not None:
+            self.cloud_sock.close()
+            self.cloud_sock = None
+    
+    def handle_chunk_storage(self, conn, addr, request):
+        """Handle chunk storage requests
+        
+        A chunk body cut short raises ConnectionError, so the caller drops
+        the connection instead of reading chunk bytes as the next frame.
+        """
+        try:
+            # The raw chunk bytes follow the request header on the socket
             chunk_id = request.get('chunk_id')
-            chunk_data = request.get('chunk_data').encode('latin1')  # Decode from string
-            
-            # Store chunk on disk
+            digest = hashlib.sha256()
+            chunk_data = self.recv_exact(conn, request.get('size', 0), digest)
+            if chunk_data is None:
+                raise ConnectionError("Chunk stream closed early")
+            
+            # Senders that know the digest get the chunk verified before it is kept
+            expected = request.get('sha256')
+            if expected and digest.hexdigest() != expected:
+                raise ValueError("Chunk digest mismatch")
+            
+            # Store chunk on disk. Each write goes to its own temporary file
+            # and is renamed into place, so concurrent stores need no lock
+            # and readers never see a partially written chunk.
             chunk_path = os.path.join(self.storage_dir, f"{chunk_id}.chunk")
+            tmp_path = f"{chunk_path}.{uuid.uuid4().hex}.tmp"
             
-            with self.storage_lock:
-                with open(chunk_path, 'wb') as f:
-                    f.write(chunk_data)
-                
-                # Update statistics
-                with self.stats_lock:
-                    self.stats['chunks_stored'] += 1
-                    self.stats['total_storage_used'] += len(chunk_data)
-                    self.stats['total_requests'] += 1
-                    self.stats['successful_requests'] += 1
+            try:
+                self.write_chunk_file(tmp_path, chunk_data)
+                os.replace(tmp_path, chunk_path)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+            
+            # Update statistics
+            stats = self.thread_stats()
+            stats['chunks_stored'] += 1
+            stats['total_storage_used'] += len(chunk_data)
+            stats['total_requests'] += 1
+            stats['successful_requests'] += 1
             
             print(f"[STORAGE] Chunk stored: {chunk_id} ({len(chunk_data)} bytes)")
             
-            # Send ACK
+            # Send ACK with the content digest so the gateway can verify retrievals
             response = {
                 'type': 'store_ack',
                 'status': 'success',
-                'chunk_id': chunk_id
+                'chunk_id': chunk_id,
+                'sha256': digest.hexdigest()
             }
-            self.send_message(conn, json.dumps(response).encode('utf-8'))
+            self.send_message(conn, self.encode_message(response))
             
+        except ConnectionError:
+            # Body cut short: the connection is out of step, drop it
+            self.thread_stats()['total_requests'] += 1
+            raise
         except Exception as e:
             print(f"[ERROR] Chunk storage error: {e}")
-            with self.stats_lock:
-                self.stats['total_requests'] += 1
+            self.thread_stats()['total_requests'] += 1
             
             # Send error response
             response = {
@@ -217,173 +310,334 @@ class StorageNode:
                 'status': 'error',
                 'message': str(e)
             }
-            self.send_message(conn, json.dumps(response).encode('utf-8'))
+            self.send_message(conn, self.encode_message(response))
+    
+    def write_chunk_file(self, path, chunk_data):
+        """Write a received chunk to a new file with unbuffered os.write calls
+        
+        The whole buffer goes to the kernel in as few write(2) calls as it
+        accepts, without passing through a Python file buffer, and the GIL
+        is released while each call runs.
+        """
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        try:
+            view = memoryview(chunk_data)
+            written = 0
+            while written < len(view):
+                written += os.write(fd, view[written:])
+            
+            # Large chunks are rarely read back soon: start writeback
+            # and let their pages leave the cache for hotter data
+            if len(view) >= LARGE_CHUNK_SIZE and hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
         finally:
-            conn.close()
+            os.close(fd)
     
-    def handle_retrieve_chunk(self, conn, addr):
-        """Handle chunk retrieval requests"""
+    def thread_stats(self):
+        """Counters owned by the calling thread, created on first use
+        
+        Only the owning thread writes its counters, so the store path
+        updates them without taking a lock.
+        """
+        counters = getattr(self.local_stats, 'counters', None)
+        if counters is None:
+            counters = dict.fromkeys(STAT_COUNTERS, 0)
+            with self.stats_lock:
+                self.stats_shards.append(counters)
+            self.local_stats.counters = counters
+        return counters
+    
+    def get_stats(self):
+        """Snapshot of node statistics with the per-thread counters summed"""
+        with self.stats_lock:
+            shards = list(self.stats_shards)
+        stats = dict(self.stats)
+        for key in STAT_COUNTERS:
+            stats[key] = sum(shard[key] for shard in shards)
+        return stats
+    
+    def handle_retrieve_chunk(self, conn, addr, request):
+        """Handle chunk retrieval requests
+        
+        Mirrors store_chunk framing: a small retrieve_ack header with the
+        chunk size, then the chunk bytes unframed.
+        """
+        header_sent = False
         try:
-            data = self.recv_message(conn)
-            if not data:
-                return
-            
-            request = json.loads(data.decode('utf-8'))
-            if request.get('type') != 'retrieve_chunk':
-                return
-            
             chunk_id = request.get('chunk_id')
             chunk_path = os.path.join(self.storage_dir, f"{chunk_id}.chunk")
             
-            if os.path.exists(chunk_path):
-                with self.storage_lock:
-                    with open(chunk_path, 'rb') as f:
-                        chunk_data = f.read()
-                
-                response = {
-                    'type': 'retrieve_ack',
-                    'status': 'success',
-                    'chunk_id': chunk_id,
-                    'chunk_data': chunk_data.decode('latin1')  # Encode binary as string
-                }
-                print(f"[RETRIEVE] Chunk retrieved: {chunk_id}")
-            else:
+            # Ask, don't check: one open() instead of stat() + open()
+            try:
+                f = open(chunk_path, 'rb')
+            except FileNotFoundError:
                 response = {
                     'type': 'retrieve_ack',
                     'status': 'error',
                     'message': 'Chunk not found'
                 }
                 print(f"[ERROR] Chunk not found: {chunk_id}")
+                self.send_message(conn, self.encode_message(response))
+                return
             
-            self.send_message(conn, json.dumps(response).encode('utf-8'))
+            # Chunks are replaced by rename, so an open file stays consistent
+            with f:
+                chunk_size = os.fstat(f.fileno()).st_size
+                
+                # Header carries the size; the file bytes follow it
+                response = {
+                    'type': 'retrieve_ack',
+                    'status': 'success',
+                    'chunk_id': chunk_id,
+                    'size': chunk_size
+                }
+                if self.send_message(conn, self.encode_message(response)):
+                    header_sent = True
+                    if chunk_size:
+                        # Read once front to back: let the kernel read ahead aggressively
+                        if hasattr(os, 'posix_fadvise'):
+                            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                        
+                        if hasattr(os, 'sendfile'):
+                            # sendfile(2) copies file pages straight to the socket
+                            conn.sendfile(f, 0, chunk_size)
+                        else:
+                            # Map the file and send its pages without a read() copy
+                            with mmap.mmap(f.fileno(), chunk_size, access=mmap.ACCESS_READ) as mm:
+                                conn.sendall(memoryview(mm))
+            print(f"[RETRIEVE] Chunk retrieved: {chunk_id}")
             
         except Exception as e:
             print(f"[ERROR] Chunk retrieval error: {e}")
+            if header_sent:
+                # Body cut short: the connection is out of step, drop it
+                raise
             response = {
                 'type': 'retrieve_ack',
                 'status': 'error',
                 'message': str(e)
             }
-            self.send_message(conn, json.dumps(response).encode('utf-8'))
+            self.send_message(conn, self.encode_message(response))
+    
+    def handle_connection(self, conn, addr):
+        """Serve chunk requests on one connection until the peer closes it
+        
+        The gateway keeps connections open and reuses them for later
+        chunks, so each connection carries a sequence of requests. One left
+        idle for CONNECTION_TIMEOUT seconds is closed to free its worker.
+        """
+        with self.connections_lock:
+            self.connections.add(conn)
+        try:
+            while self.running:
+                data = self.recv_message(conn)
+                if not data:
+                    break
+                
+                request = self.decode_message(data)
+                request_type = request.get('type')
+                
+                if request_type == 'store_chunk':
+                    self.handle_chunk_storage(conn, addr, request)
+                elif request_type == 'retrieve_chunk':
+                    self.handle_retrieve_chunk(conn, addr, request)
+                else:
+                    break
+        except Exception as e:
+            print(f"[ERROR] Connection error from {addr}: {e}")
         finally:
+            with self.connections_lock:
+                self.connections.discard(conn)
             conn.close()
     
     def display_status(self):
-        """Display node status and statistics"""
+        """Display node status and statistics
+        
+        Renders only when stdout is a terminal; otherwise it just keeps the
+        node's main thread alive.
+        """
+        interactive = sys.stdout.isatty()
         while self.running:
-            os.system('clear' if os.name == 'posix' else 'cls')
-            
-            uptime = datetime.now() - self.stats['uptime_start']
-            
-            print("=" * 60)
-            print(f"        STORAGE NODE - {self.node_id}")
-            print("=" * 60)
-            print(f"Node ID: {self.node_id}")
-            print(f"Address: {self.host}:{self.port}")
-            print(f"Cloud Gateway: {self.cloud_host}:{self.cloud_port}")
-            print(f"Registration Status: {'[REGISTERED]' if self.registered else '[NOT REGISTERED]'}")
-            print(f"Uptime: {str(uptime).split('.')[0]}")
-            print()
-            
-            print("HARDWARE CONFIGURATION:")
-            print(f"  Storage Capacity: {self.storage_capacity / (1024**3):.2f} GB")
-            print(f"  CPU Cores: {self.cpu_cores}")
-            print(f"  Bandwidth: {self.bandwidth}")
-            print(f"  Storage Directory: {self.storage_dir}")
-            print()
-            
-            print("PERFORMANCE STATISTICS:")
-            print(f"  Chunks Stored: {self.stats['chunks_stored']}")
-            print(f"  Storage Used: {self.stats['total_storage_used'] / (1024**2):.2f} MB")
-            print(f"  Total Requests: {self.stats['total_requests']}")
-            print(f"  Successful Requests: {self.stats['successful_requests']}")
-            if self.stats['total_requests'] > 0:
-                success_rate = (self.stats['successful_requests'] / self.stats['total_requests']) * 100
-                print(f"  Success Rate: {success_rate:.1f}%")
-            print()
-            
-            print("SYSTEM STATUS:")
-            print(f"  Status: {'[ONLINE]' if self.registered else '[OFFLINE]'}")
-            if self.last_heartbeat > 0:
-                print(f"  Last Heartbeat: {int(time.time() - self.last_heartbeat)}s ago")
-            print()
-            
-            print("Commands: Ctrl+C to stop")
-            print("=" * 60)
+            if interactive:
+                self.render_status()
             
             time.sleep(5)  # Update every 5 seconds
     
+    def render_status(self):
+        """Redraw the status screen with a single write"""
+        stats = self.get_stats()
+        uptime = datetime.now() - stats['uptime_start']
+        
+        parts = []
+        parts.append("=" * 60)
+        parts.append(f"        STORAGE NODE - {self.node_id}")
+        parts.append("=" * 60)
+        parts.append(f"Node ID: {self.node_id}")
+        parts.append(f"Address: {self.host}:{self.port}")
+        parts.append(f"Cloud Gateway: {self.cloud_host}:{self.cloud_port}")
+        parts.append(f"Registration Status: {'[REGISTERED]' if self.registered else '[NOT REGISTERED]'}")
+        parts.append(f"Uptime: {str(uptime).split('.')[0]}")
+        parts.append("")
+        
+        parts.append("HARDWARE CONFIGURATION:")
+        parts.append(f"  Storage Capacity: {self.storage_capacity / (1024**3):.2f} GB")
+        parts.append(f"  CPU Cores: {self.cpu_cores}")
+        parts.append(f"  Bandwidth: {self.bandwidth}")
+        parts.append(f"  Storage Directory: {self.storage_dir}")
+        parts.append("")
+        
+        parts.append("PERFORMANCE STATISTICS:")
+        parts.append(f"  Chunks Stored: {stats['chunks_stored']}")
+        parts.append(f"  Storage Used: {stats['total_storage_used'] / (1024**2):.2f} MB")
+        parts.append(f"  Total Requests: {stats['total_requests']}")
+        parts.append(f"  Successful Requests: {stats['successful_requests']}")
+        if stats['total_requests'] > 0:
+            success_rate = (stats['successful_requests'] / stats['total_requests']) * 100
+            parts.append(f"  Success Rate: {success_rate:.1f}%")
+        parts.append("")
+        
+        parts.append("SYSTEM STATUS:")
+        parts.append(f"  Status: {'[ONLINE]' if self.registered else '[OFFLINE]'}")
+        if self.last_heartbeat > 0:
+            parts.append(f"  Last Heartbeat: {int(time.time() - self.last_heartbeat)}s ago")
+        parts.append("")
+        
+        parts.append("Commands: Ctrl+C to stop")
+        parts.append("=" * 60)
+        
+        # ANSI clear + one write instead of forking clear/cls and a print per line
+        sys.stdout.write(CLEAR_SCREEN + '\n'.join(parts) + '\n')
+        sys.stdout.flush()
+    
+    def encode_message(self, message):
+        """Serialize a protocol message to a versioned MessagePack frame"""
+        return bytes((PROTOCOL_VERSION,)) + msgpack.packb(message, use_bin_type=True)
+    
+    def decode_message(self, data):
+        """Deserialize a versioned MessagePack frame"""
+        if data[0] != PROTOCOL_VERSION:
+            raise ValueError(f"Unsupported protocol version: {data[0]}")
+        return msgpack.unpackb(memoryview(data)[1:], raw=False)
+    
     def recv_message(self, sock):
         """Receive a message with length prefix"""
         try:
-            # First receive the message length
-            length_data = sock.recv(4)
-            if not length_data:
+            # First receive the message length (recv may return fewer than 4 bytes)
+            length_data = self.recv_exact(sock, 4)
+            if length_data is None:
                 return None
             
-            msg_length = struct.unpack('!I', length_data)[0]
+            msg_length = LENGTH_PREFIX.unpack(length_data)[0]
+            if msg_length > MAX_MESSAGE_SIZE:
+                print(f"[ERROR] Oversized message ({msg_length} bytes), closing connection")
+                return None
             
-            # Then receive the message data
-            data = b''
-            while len(data) < msg_length:
-                chunk = sock.recv(min(msg_length - len(data), 4096))
-                if not chunk:
+            # Then receive the message data straight into a buffer of its final size
+            return self.recv_exact(sock, msg_length)
+        except Exception:
+            return None
+    
+    def recv_exact(self, sock, size, digest=None):
+        """Receive exactly size raw bytes that follow a message header
+        
+        When a hashlib digest is given, each received slice is fed to it
+        while still hot in cache, so hashing needs no second pass.
+        """
+        try:
+            buf = bytearray(size)
+            view = memoryview(buf)
+            received = 0
+            while received < size:
+                n = sock.recv_into(view[received:], size - received)
+                if not n:
                     return None
-                data += chunk
-            
-            return data
+                if digest is not None:
+                    digest.update(view[received:received + n])
+                received += n
+            return buf
         except Exception:
             return None
     
     def send_message(self, sock, data):
         """Send a message with length prefix"""
         try:
-            # Send message length first
-            msg_length = len(data)
-            sock.sendall(struct.pack('!I', msg_length))
-            
-            # Then send the message data
-            sock.sendall(data)
+            header = LENGTH_PREFIX.pack(len(data))
+            if not hasattr(sock, 'sendmsg'):
+                sock.sendall(header + data)
+                return True
+            
+            # Length and payload leave in one gathered sendmsg(2); only a
+            # short write falls back to sending the remainder
+            sent = sock.sendmsg([header, data])
+            if sent < len(header):
+                sock.sendall(header[sent:])
+                sock.sendall(data)
+            elif sent < len(header) + len(data):
+                sock.sendall(memoryview(data)[sent - len(header):])
             return True
         except Exception:
             return False
     
     def start_listener(self):
-        """Start node listener for chunk operations"""
+        """Start node listener for chunk operations
+        
+        Where SO_REUSEPORT exists, several sockets bind the same port and
+        each gets its own accept thread; the kernel spreads incoming
+        connections across their separate accept queues.
+        """
         try:
-            server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            server.bind((self.host, self.port))
-            server.listen(10)
-            
-            print(f"[LISTEN] Node listener started on {self.host}:{self.port}")
-            
-            while self.running:
-                try:
-                    conn, addr = server.accept()
-                    
-                    # Handle different request types
-                    data = self.recv_message(conn)
-                    if data:
-                        request = json.loads(data.decode('utf-8'))
-                        request_type = request.get('type')
-                        
-                        if request_type == 'store_chunk':
-                            threading.Thread(target=self.handle_chunk_storage, args=(conn, addr)).start()
-                        elif request_type == 'retrieve_chunk':
-                            threading.Thread(target=self.handle_retrieve_chunk, args=(conn, addr)).start()
-                        else:
-                            conn.close()
-                    else:
-                        conn.close()
-                        
-                except Exception as e:
-                    if self.running:
-                        print(f"[ERROR] Listener error: {e}")
+            reuse_port = hasattr(socket, 'SO_REUSEPORT')
+            if reuse_port:
+                self.claim_port()
+            servers = []
+            for _ in range(max(2, self.cpu_cores) if reuse_port else 1):
+                server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                if reuse_port:
+                    server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+                server.bind((self.host, self.port))
+                server.listen(10)
+                servers.append(server)
+            
+            print(f"[LISTEN] Node listener started on {self.host}:{self.port} ({len(servers)} accept queue(s))")
+            
+            for server in servers[1:]:
+                threading.Thread(target=self.accept_loop, args=(server,), daemon=True).start()
+            self.accept_loop(servers[0])
                         
         except Exception as e:
             print(f"[ERROR] Failed to start listener: {e}")
     
+    def claim_port(self):
+        """Raise EADDRINUSE if another process already holds the node port
+        
+        Any socket with SO_REUSEPORT may join the port, so a second node
+        started on it would bind silently and share its connections; a
+        plain bind fails as it did before the port was shared.
+        """
+        probe = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            probe.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            probe.bind((self.host, self.port))
+        finally:
+            probe.close()
+    
+    def accept_loop(self, server):
+        """Accept connections on one listening socket and hand them to the pool"""
+        while self.running:
+            try:
+                conn, addr = server.accept()
+                conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                
+                # The accept thread only accepts; a slow or idle peer ties up
+                # at most one worker, and only until the timeout
+                conn.settimeout(CONNECTION_TIMEOUT)
+                self.pool.submit(self.handle_connection, conn, addr)
+                    
+            except Exception as e:
+                if self.running:
+                    print(f"[ERROR] Listener error: {e}")
+    
     def heartbeat_loop(self):
         """Send periodic heartbeats to Cloud Gateway"""
         while self.running:
@@ -395,11 +649,13 @@ class StorageNode:
                         print(f"[ERROR] Heartbeat failed - Cloud may be unreachable")
                         self.registered = False
                 else:
-                    # Try to register if not registered
-                    if self.check_cloud_availability():
+                    # Try to register if not registered; an unreachable cloud waits for the next round
+                    try:
                         if self.register_with_cloud():
                             self.registered = True
                             print(f"[SUCCESS] Re-registered with Cloud Gateway")
+                    except OSError:
+                        pass
                 
                 time.sleep(30)  # Send heartbeat every 30 seconds
                 
@@ -425,11 +681,26 @@ class StorageNode:
             self.display_status()
         except KeyboardInterrupt:
             print(f"\n[STOP] Shutting down Node {self.node_id}...")
-            self.running = False
+            self.stop()
+    
+    def stop(self):
+        """Stop serving: release pool workers and the gateway connection"""
+        self.running = False
+        
+        # Workers block reading idle connections; shutting those down wakes them
+        with self.connections_lock:
+            for conn in self.connections:
+                try:
+                    conn.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+        self.pool.shutdown(wait=False)
+        
+        with self.cloud_sock_lock:
+            self.close_cloud_sock()
+        self.udp_sock.close()
 
 if __name__ == "__main__":
-    import sys
-    
     if len(sys.argv) < 2:
         print("Usage: python storage_node.py <node_id> [host] [port] [storage_gb]")
         sys.exit(1)
@@ -217,6 +217,81 @@ class SystemTester:
             self.log_result("JSON Functionality Test", False, f"Exception: {e}")
             return False
     
+    def test_wire_format(self):
+        """Test MessagePack message framing with raw binary fields"""
+        try:
+            from upload_client import UploadClient
+            
+            client = UploadClient()
+            payload = bytes(range(256))
+            message = {'type': 'upload', 'filename': 'test.bin', 'data': payload}
+            
+            encoded = client.encode_message(message)
+            decoded = client.decode_message(encoded)
+            
+            # bin fields must round-trip as bytes without any text expansion
+            if decoded == message and len(encoded) < len(payload) + 64:
+                self.log_result("Wire Format Test", True, "MessagePack framing working")
+                return True
+            else:
+                self.log_result("Wire Format Test", False, "MessagePack round-trip mismatch")
+                return False
+                
+        except Exception as e:
+            self.log_result("Wire Format Test", False, f"Exception: {e}")
+            return False
+    
+    def test_upload_sessions(self):
+        """Test that resumed parallel uploads stay with their own file"""
+        try:
+            import cloud_gateway
+            from cloud_gateway import CloudGateway
+            
+            gateway = CloudGateway()
+            
+            def probe(filename):
+                return gateway.handle_upload_probe({
+                    'type': 'upload_probe',
+                    'filename': filename,
+                    'file_size': 1000,
+                    'chunk_size': 100,
+                    'sha256': 'ab' * 32
+                })['file_id']
+            
+            def abandon(file_id, idle):
+                gateway.uploads[file_id]['last_active'] = time.time() - idle
+            
+            first = probe('a.bin')
+            
+            # An identical upload running alongside must not share the session
+            if probe('a.bin') == first:
+                self.log_result("Upload Session Test", False, "Concurrent identical uploads share a session")
+                return False
+            
+            # Once abandoned, a.bin resumes but the same bytes as b.bin do not
+            abandon(first, cloud_gateway.UPLOAD_CLAIM_TIMEOUT + 1)
+            renamed = probe('b.bin')
+            if renamed == first or gateway.uploads[renamed]['filename'] != 'b.bin':
+                self.log_result("Upload Session Test", False, "Renamed upload resumed another file's session")
+                return False
+            if probe('a.bin') != first:
+                self.log_result("Upload Session Test", False, "Abandoned upload was not resumed")
+                return False
+            
+            # Sessions idle past the TTL are dropped
+            abandon(first, cloud_gateway.UPLOAD_SESSION_TTL + 1)
+            probe('c.bin')
+            if first in gateway.uploads:
+                self.log_result("Upload Session Test", False, "Abandoned session never expired")
+                return False
+            
+            self.log_result("Upload Session Test", True, "Sessions resume by name and content, never while in use")
+            return True
+            
+        except Exception as e:
+            self.log_result("Upload Session Test", False, f"Exception: {e}")
+            return False
+    
     def test_storage_allocation(self):
         """Test storage directory creation"""
         try:
@@ -282,7 +357,7 @@ class SystemTester:
         """Clean up test artifacts"""
         try:
             # Clean up test files
-            test_files = ['nodes_config.json', 'cloud_db.pkl']
+            test_files = ['nodes_config.json', 'cloud_db.json']
             for file in test_files:
                 if os.path.exists(file):
                     os.remove(file)
@@ -313,6 +388,8 @@ class SystemTester:
             self.test_upload_client,
             self.test_network_communication,
             self.test_json_functionality,
+            self.test_wire_format,
+            self.test_upload_sessions,
             self.test_storage_allocation,
             self.test_multi_threading
         ]
@@ -4,54 +4,144 @@
 File Upload Client - Upload files to the distributed cloud storage system
 """
 
+import asyncio
+import hashlib
 import socket
-import json
 import os
-import struct
+import mmap
+import select
 import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+import msgpack
+
+try:
+    import zstandard
+except ImportError:
+    # Optional: uploads are sent uncompressed without it
+    zstandard = None  # type: ignore[assignment]
+
+# Leading byte of every message payload, bumped on wire format changes
+PROTOCOL_VERSION = 1
+
+# Chunk size and worker count used by upload_file_parallel by default
+PARALLEL_CHUNK_SIZE = 16 << 20
+PARALLEL_UPLOADS = 8
+
+# Times a failed chunk is sent before the parallel upload gives up
+CHUNK_ATTEMPTS = 3
+
+# Bytes read per step when hashing a file for a resumable upload
+HASH_BLOCK_SIZE = 1 << 20
+
+# zstd level for compressed uploads; low levels keep up with the network
+ZSTD_LEVEL = 3
+
+# Files smaller than this are sent as-is
+MIN_COMPRESS_SIZE = 4096
+
+# Extensions whose contents are already compressed
+COMPRESSED_EXTENSIONS = frozenset({
+    '.zst', '.gz', '.bz2', '.xz', '.zip', '.7z', '.rar',
+    '.jpg', '.jpeg', '.png', '.gif', '.webp',
+    '.mp3', '.mp4', '.mkv', '.mov', '.avi', '.webm',
+})
+
+# Connect attempts slower than this count a gateway as unreachable
+GATEWAY_PROBE_TIMEOUT = 0.5
+
+# Uploads between gateway probes, so a degraded link is dropped
+GATEWAY_REPROBE_INTERVAL = 50
+
+# Kernel send/receive buffer requested on gateway sockets
+SOCKET_BUFFER_SIZE = 4 << 20
+
+# Options applied to every gateway socket unless the caller passes its own
+DEFAULT_SOCKET_OPTIONS = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    # The connection is kept open between uploads
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    # Set before connect() so the window scale covers the larger buffers
+    (socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE),
+    (socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE),
+]
+
 class UploadClient:
-    def __init__(self, cloud_host='localhost', cloud_port=8000):
-        self.cloud_host = cloud_host
+    def __init__(self, cloud_host='localhost', cloud_port=8000, socket_options=None, cloud_hosts=None):
+        # With several gateways, uploads go to whichever connects fastest
+        self.cloud_hosts = list(cloud_hosts) if cloud_hosts else None
+        self.cloud_host = self.cloud_hosts[0] if self.cloud_hosts else cloud_host
         self.cloud_port = cloud_port
+        self._uploads_since_probe = 0
+        # (level, option, value) tuples passed to setsockopt before connecting
+        self.socket_options = list(DEFAULT_SOCKET_OPTIONS if socket_options is None else socket_options)
+        # Gateway connection shared by successive requests, opened lazily
+        self._sock = None
+    
+    def __enter__(self):
+        return self
     
-    def upload_file(self, file_path):
-        """Upload a file to the cloud storage"""
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def upload_file(self, file_path, compress=True):
+        """Upload a file to the cloud storage
+        
+        With compress set (and the zstandard package installed), files that
+        are not already compressed are sent zstd-compressed when that makes
+        them smaller.
+        """
         try:
-            if not os.path.exists(file_path):
+            self.choose_gateway()
+            
+            # One stat(2) both checks the file exists and gives its size
+            try:
+                file_size = os.stat(file_path).st_size
+            except FileNotFoundError:
                 print(f"[ERROR] File not found: {file_path}")
                 return False
             
             filename = os.path.basename(file_path)
-            file_size = os.path.getsize(file_path)
+            print(f"[FILE] Uploading: {filename}\n"
+                  f"[INFO] Size: {file_size} bytes ({file_size / (1024**2):.2f} MB)")
             
-            print(f"[FILE] Uploading: {filename}")
-            print(f"[INFO] Size: {file_size} bytes ({file_size / (1024**2):.2f} MB)")
-            
-            # Read file data
             with open(file_path, 'rb') as f:
-                file_data = f.read()
-            
-            # Connect to cloud gateway
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.connect((self.cloud_host, self.cloud_port))
-            
-            # Send upload request
-            request = {
-                'type': 'upload',
-                'filename': filename,
-                'file_size': file_size,
-                'file_data': file_data.decode('latin1')  # Convert bytes to string for JSON
-            }
-            
-            print(f"[NETWORK] Connecting to Cloud Gateway...")
-            self.send_message(sock, json.dumps(request).encode('utf-8'))
+                # Digest of the original content, recorded for downloads to verify
+                sha256 = self.file_sha256(f)
+                
+                body, body_size, encoding = f, file_size, None
+                if compress and self.should_compress(filename, file_size):
+                    compressed, compressed_size = self.compress_file(f, file_size)
+                    if compressed:
+                        body, body_size, encoding = compressed, compressed_size, 'zstd'
+                        print(f"[INFO] Compressed: {body_size} bytes ({body_size / file_size:.0%})")
+                
+                # Closing body also closes a temporary compressed copy
+                with body:
+                    # Connect to cloud gateway, reusing the open connection if any
+                    sock = self._ensure_connected()
+                    
+                    # Send upload header; the file body follows as raw bytes
+                    print(f"[NETWORK] Connecting to Cloud Gateway...")
+                    header = self.upload_header(filename, body_size, encoding, file_size, sha256)
+                    self.send_header(sock, header, body_size)
+                    
+                    # Stream the file body; memory use stays bounded by one block
+                    try:
+                        if body_size:
+                            self.send_file_body(sock, body, body_size)
+                    except Exception:
+                        # A partial body leaves the stream unusable
+                        self.close()
+                        raise
             
             # Wait for response
             response_data = self.recv_message(sock)
             if response_data:
-                response = json.loads(response_data.decode('utf-8'))
+                response = self.decode_message(response_data)
                 
                 if response.get('type') == 'upload_complete':
                     file_id = response.get('file_id')
@@ -62,34 +152,433 @@ class UploadClient:
                     print(f"[INFO] File ID: {file_id}")
                     print(f"[INFO] Chunks: {chunks_stored}/{total_chunks} stored successfully")
                     print(f"[TIME] Upload time: {datetime.now().strftime('%H:%M:%S')}")
-                    
-                    sock.close()
                     return True
                 
                 elif response.get('type') == 'upload_error':
                     error_msg = response.get('message', 'Unknown error')
                     print(f"[ERROR] Upload failed: {error_msg}")
-                    
-                    sock.close()
                     return False
             
             print(f"[ERROR] No response from Cloud Gateway")
-            sock.close()
+            self.close()
+            return False
+            
+        except Exception as e:
+            print(f"[ERROR] Upload error: {e}")
+            return False
+    
+    def upload_file_parallel(self, file_path, chunk_size=PARALLEL_CHUNK_SIZE, parallelism=PARALLEL_UPLOADS,
+                             resume=True):
+        """Upload a file as independent chunks over parallel connections
+        
+        The gateway opens an upload session, each worker streams one chunk
+        at a time on its own socket, and a final commit records the file.
+        With resume set, the file's sha256 is sent first so that an earlier
+        unfinished upload of the same content is continued: only the chunks
+        the gateway is missing are sent.
+        """
+        try:
+            self.choose_gateway()
+            
+            try:
+                file_size = os.stat(file_path).st_size
+            except FileNotFoundError:
+                print(f"[ERROR] File not found: {file_path}")
+                return False
+            
+            filename = os.path.basename(file_path)
+            print(f"[FILE] Uploading: {filename}\n"
+                  f"[INFO] Size: {file_size} bytes ({file_size / (1024**2):.2f} MB)")
+            print(f"[NETWORK] Connecting to Cloud Gateway...")
+            
+            # Open the upload session, or find the one to resume
+            request = {
+                'type': 'upload_init',
+                'filename': filename,
+                'file_size': file_size,
+                'chunk_size': chunk_size
+            }
+            if resume:
+                request['type'] = 'upload_probe'
+                with open(file_path, 'rb') as f:
+                    request['sha256'] = self.file_sha256(f)
+            
+            response = self.request(request)
+            if not response or response.get('type') != 'upload_ready':
+                error_msg = response.get('message', 'Unknown error') if response else 'No response from Cloud Gateway'
+                print(f"[ERROR] Upload failed: {error_msg}")
+                return False
+            
+            file_id = response.get('file_id')
+            total_chunks = response.get('total_chunks')
+            missing_chunks = response.get('missing_chunks', range(total_chunks))
+            if len(missing_chunks) < total_chunks:
+                print(f"[INFO] Resuming: {total_chunks - len(missing_chunks)}/{total_chunks} chunks already stored")
+            
+            # Stream chunks concurrently, one connection per in-flight chunk
+            with ThreadPoolExecutor(max_workers=parallelism) as pool:
+                futures = [
+                    pool.submit(self.upload_chunk, file_path, file_id, i,
+                                i * chunk_size, min(chunk_size, file_size - i * chunk_size))
+                    for i in missing_chunks
+                ]
+                results = [future.result() for future in futures]
+            
+            failed = results.count(False)
+            if failed:
+                print(f"[ERROR] Upload failed: {failed}/{total_chunks} chunks not stored")
+                return False
+            
+            # Record the file once every chunk is stored
+            response = self.request({'type': 'upload_commit', 'file_id': file_id})
+            if response and response.get('type') == 'upload_complete':
+                print(f"[SUCCESS] Upload complete!")
+                print(f"[INFO] File ID: {file_id}")
+                print(f"[INFO] Chunks: {response.get('chunks_stored')}/{response.get('total_chunks')} stored successfully")
+                print(f"[TIME] Upload time: {datetime.now().strftime('%H:%M:%S')}")
+                return True
+            
+            error_msg = response.get('message', 'Unknown error') if response else 'No response from Cloud Gateway'
+            print(f"[ERROR] Upload failed: {error_msg}")
+            return False
+            
+        except Exception as e:
+            print(f"[ERROR] Upload error: {e}")
+            return False
+    
+    def upload_chunk(self, file_path, file_id, index, offset, length, attempts=CHUNK_ATTEMPTS):
+        """Send one chunk of a parallel upload, retrying just this chunk on failure"""
+        for attempt in range(1, attempts + 1):
+            if self.send_chunk(file_path, file_id, index, offset, length):
+                return True
+            if attempt < attempts:
+                print(f"[RETRY] Chunk {index}: attempt {attempt + 1}/{attempts}")
+        return False
+    
+    def send_chunk(self, file_path, file_id, index, offset, length):
+        """Send one chunk of a parallel upload on its own connection"""
+        try:
+            # Each worker has its own file object, so offsets never race
+            with open(file_path, 'rb') as f, self.connect() as sock:
+                # The node checks the chunk against this before storing it
+                header = {
+                    'type': 'upload_chunk',
+                    'file_id': file_id,
+                    'index': index,
+                    'size': length,
+                    'sha256': self.file_sha256(f, offset, length)
+                }
+                self.send_header(sock, header, length)
+                self.send_file_body(sock, f, length, offset)
+                
+                response_data = self.recv_message(sock)
+            
+            if response_data and self.decode_message(response_data).get('type') == 'chunk_stored':
+                return True
+            print(f"[ERROR] Chunk {index} was not stored")
+            return False
+        except Exception as e:
+            print(f"[ERROR] Chunk {index} upload error: {e}")
+            return False
+    
+    async def upload_file_async(self, file_path, compress=True):
+        """Upload a file on its own asyncio connection
+        
+        Same protocol and output as upload_file; many of these can run
+        concurrently on one event loop (see upload_many).
+        """
+        writer = None
+        try:
+            try:
+                file_size = os.stat(file_path).st_size
+            except FileNotFoundError:
+                print(f"[ERROR] File not found: {file_path}")
+                return False
+            
+            loop = asyncio.get_running_loop()
+            filename = os.path.basename(file_path)
+            print(f"[FILE] Uploading: {filename}\n"
+                  f"[INFO] Size: {file_size} bytes ({file_size / (1024**2):.2f} MB)")
+            
+            with open(file_path, 'rb') as f:
+                # Hashing and compression are CPU-bound, so keep them off the event loop
+                sha256 = await loop.run_in_executor(None, self.file_sha256, f)
+                
+                body, body_size, encoding = f, file_size, None
+                if compress and self.should_compress(filename, file_size):
+                    compressed, compressed_size = await loop.run_in_executor(None, self.compress_file, f, file_size)
+                    if compressed:
+                        body, body_size, encoding = compressed, compressed_size, 'zstd'
+                        print(f"[INFO] Compressed: {body_size} bytes ({body_size / file_size:.0%})")
+                
+                # Closing body also closes a temporary compressed copy
+                with body:
+                    reader, writer = await self.connect_async()
+                    
+                    # Send upload header; the file body follows as raw bytes
+                    header = self.upload_header(filename, body_size, encoding, file_size, sha256)
+                    writer.write(self.frame_message(self.encode_message(header)))
+                    
+                    # loop.sendfile uses sendfile(2) where it can
+                    if body_size:
+                        await loop.sendfile(writer.transport, body, 0, body_size)
+                    await writer.drain()
+            
+            # Wait for response
+            length_data = await reader.readexactly(4)
+            response = self.decode_message(await reader.readexactly(int.from_bytes(length_data, 'big')))
+            
+            if response.get('type') == 'upload_complete':
+                print(f"[SUCCESS] Upload complete: {filename}")
+                print(f"[INFO] File ID: {response.get('file_id')}")
+                print(f"[INFO] Chunks: {response.get('chunks_stored')}/{response.get('total_chunks')} stored successfully")
+                return True
+            
+            print(f"[ERROR] Upload failed: {response.get('message', 'Unknown error')}")
             return False
             
+        except asyncio.IncompleteReadError:
+            print(f"[ERROR] No response from Cloud Gateway")
+            return False
         except Exception as e:
             print(f"[ERROR] Upload error: {e}")
             return False
+        finally:
+            if writer is not None:
+                writer.close()
+    
+    async def upload_many_async(self, file_paths, compress=True):
+        """Upload several files concurrently; returns one result per path"""
+        if self.cloud_hosts:
+            self.use_fastest_gateway(await self.probe_gateways())
+        return await asyncio.gather(*(self.upload_file_async(path, compress) for path in file_paths))
+    
+    def upload_many(self, file_paths, compress=True):
+        """Upload several files concurrently from synchronous code"""
+        return asyncio.run(self.upload_many_async(file_paths, compress))
+    
+    def choose_gateway(self):
+        """Pick the fastest configured gateway, re-probing every GATEWAY_REPROBE_INTERVAL uploads"""
+        if not self.cloud_hosts:
+            return
+        if self._uploads_since_probe == 0:
+            self.use_fastest_gateway(asyncio.run(self.probe_gateways()))
+        self._uploads_since_probe = (self._uploads_since_probe + 1) % GATEWAY_REPROBE_INTERVAL
+    
+    async def probe_gateways(self):
+        """Time a TCP connect to every configured gateway at once
+        
+        Returns {host: seconds} for the gateways that answered in time.
+        """
+        rtts = await asyncio.gather(*(self.connect_time(host) for host in self.cloud_hosts))
+        return {host: rtt for host, rtt in zip(self.cloud_hosts, rtts) if rtt is not None}
+    
+    async def connect_time(self, host):
+        """Seconds a TCP connect to one gateway takes, or None if it fails"""
+        start = time.perf_counter()
+        try:
+            _, writer = await asyncio.wait_for(asyncio.open_connection(host, self.cloud_port), GATEWAY_PROBE_TIMEOUT)
+        except (OSError, asyncio.TimeoutError):
+            return None
+        rtt = time.perf_counter() - start
+        writer.close()
+        return rtt
+    
+    def use_fastest_gateway(self, rtts):
+        """Switch to the gateway with the lowest connect time"""
+        if not rtts:
+            print(f"[ERROR] No gateway answered the probe, staying on {self.cloud_host}")
+            return
+        
+        host = min(rtts, key=rtts.get)
+        if host != self.cloud_host:
+            # The shared connection belongs to the old gateway
+            self.close()
+            self.cloud_host = host
+        print(f"[NETWORK] Using gateway {host}:{self.cloud_port} (connect {rtts[host] * 1000:.1f} ms)")
+    
+    async def connect_async(self):
+        """Open an asyncio connection to the gateway with the configured socket options"""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            for level, option, value in self.socket_options:
+                sock.setsockopt(level, option, value)
+            sock.setblocking(False)
+            await asyncio.get_running_loop().sock_connect(sock, (self.cloud_host, self.cloud_port))
+        except Exception:
+            sock.close()
+            raise
+        return await asyncio.open_connection(sock=sock)
+    
+    def file_sha256(self, f, offset=0, length=None):
+        """Hash length bytes (default: the rest) of an open file from offset through one reusable buffer"""
+        digest = hashlib.sha256()
+        view = memoryview(bytearray(HASH_BLOCK_SIZE))
+        f.seek(offset)
+        remaining = length
+        while remaining is None or remaining > 0:
+            n = f.readinto(view if remaining is None else view[:min(remaining, HASH_BLOCK_SIZE)])
+            if not n:
+                break
+            digest.update(view[:n])
+            if remaining is not None:
+                remaining -= n
+        return digest.hexdigest()
+    
+    def should_compress(self, filename, file_size):
+        """Whether an upload is worth compressing"""
+        if zstandard is None or file_size < MIN_COMPRESS_SIZE:
+            return False
+        return os.path.splitext(filename)[1].lower() not in COMPRESSED_EXTENSIONS
+    
+    def compress_file(self, f, file_size):
+        """Compress an open file, from its start, into a temporary file with zstd
+        
+        The compressed size must be known before the upload header is sent,
+        so the output is spooled to disk first. Returns the temporary file,
+        rewound, and its size; or (None, 0) if compression did not help.
+        """
+        tmp = tempfile.TemporaryFile()
+        try:
+            f.seek(0)
+            # threads=-1 compresses on every core
+            cctx = zstandard.ZstdCompressor(level=ZSTD_LEVEL, threads=-1)
+            _, compressed_size = cctx.copy_stream(f, tmp, size=file_size)
+            if compressed_size >= file_size:
+                tmp.close()
+                return None, 0
+            tmp.seek(0)
+            return tmp, compressed_size
+        except Exception:
+            tmp.close()
+            raise
+    
+    def request(self, message):
+        """Send one header-only request on the shared connection and return the reply"""
+        sock = self._ensure_connected()
+        response_data = None
+        if self.send_header(sock, message):
+            response_data = self.recv_message(sock)
+        if not response_data:
+            self.close()
+            return None
+        return self.decode_message(response_data)
+    
+    def _ensure_connected(self):
+        """Return the shared gateway connection, reconnecting if it was closed"""
+        if self._sock is not None:
+            # An idle connection is only readable once the gateway has closed it
+            readable, _, _ = select.select([self._sock], [], [], 0)
+            if not readable:
+                return self._sock
+            self.close()
+        
+        self._sock = self.connect()
+        return self._sock
+    
+    def close(self):
+        """Close the shared gateway connection"""
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+    
+    def connect(self):
+        """Open a socket to the gateway with the configured socket options
+        
+        By default TCP_NODELAY is on, so the small upload header does not
+        sit in Nagle's buffer waiting for the body, and the kernel buffers
+        are enlarged to keep a fast link full.
+        """
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            for level, option, value in self.socket_options:
+                sock.setsockopt(level, option, value)
+            sock.connect((self.cloud_host, self.cloud_port))
+        except Exception:
+            sock.close()
+            raise
+        return sock
+    
+    def send_file_body(self, sock, f, file_size, offset=0):
+        """Send file_size bytes of an open file, from offset, as the raw upload body"""
+        if hasattr(os, 'sendfile'):
+            # sendfile(2): pages go from the page cache to the socket. Explicit
+            # offsets leave the file position alone, so no seeks are needed
+            out_fd, in_fd = sock.fileno(), f.fileno()
+            sent = 0
+            while sent < file_size:
+                n = os.sendfile(out_fd, in_fd, offset + sent, file_size - sent)
+                if not n:
+                    raise EOFError(f"File ended {file_size - sent} bytes early")
+                sent += n
+            return
+        
+        # Elsewhere map the file and send a view of the page cache, so the
+        # body is never copied into a Python buffer
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                memoryview(mm)[offset:offset + file_size] as view:
+            if len(view) < file_size:
+                raise EOFError(f"File ended {file_size - len(view)} bytes early")
+            sock.sendall(view)
+    
+    def upload_header(self, filename, body_size, encoding=None, original_size=None, sha256=None):
+        """Build the header of a whole-file upload
+        
+        Only this small dict is serialized; the body_size bytes of the
+        body are streamed after it unframed.
+        """
+        header = {
+            'type': 'upload',
+            'filename': filename,
+            'file_size': body_size
+        }
+        if encoding:
+            header['encoding'] = encoding
+            header['original_size'] = original_size
+        if sha256:
+            header['sha256'] = sha256
+        return header
+    
+    def send_header(self, sock, header, body_size=0):
+        """Send a request header, which body_size raw bytes will follow"""
+        return self.send_message(sock, self.encode_message(header), more=body_size > 0)
+    
+    def encode_message(self, message):
+        """Serialize a protocol message to a versioned MessagePack frame"""
+        return bytes((PROTOCOL_VERSION,)) + msgpack.packb(message, use_bin_type=True)
+    
+    def decode_message(self, data):
+        """Deserialize a versioned MessagePack frame"""
+        if data[0] != PROTOCOL_VERSION:
+            raise ValueError(f"Unsupported protocol version: {data[0]}")
+        return msgpack.unpackb(memoryview(data)[1:], raw=False)
     
-    def send_message(self, sock, data):
-        """Send a message with length prefix"""
+    def frame_message(self, data):
+        """Prefix a message with its length, ready to write to a stream"""
+        return len(data).to_bytes(4, 'big') + data
+    
+    def send_message(self, sock, data, more=False):
+        """Send a message with length prefix
+        
+        Set more when a raw body follows: where MSG_MORE exists the kernel
+        then holds the header back and sends it in the same packet as the
+        start of the body.
+        """
         try:
-            # Send message length first
-            msg_length = len(data)
-            sock.sendall(struct.pack('!I', msg_length))
+            header = len(data).to_bytes(4, 'big')
+            if not hasattr(sock, 'sendmsg'):
+                sock.sendall(header + data)
+                return True
             
-            # Then send the message data
-            sock.sendall(data)
+            # Length and payload leave in one gathered sendmsg(2); only a
+            # short write falls back to sending the remainder
+            flags = socket.MSG_MORE if more and hasattr(socket, 'MSG_MORE') else 0
+            sent = sock.sendmsg([header, data], [], flags)
+            if sent < len(header):
+                sock.sendall(header[sent:], flags)
+                sock.sendall(data, flags)
+            elif sent < len(header) + len(data):
+                sock.sendall(memoryview(data)[sent - len(header):], flags)
             return True
         except Exception as e:
             print(f"Send error: {e}")
@@ -98,43 +587,85 @@ class UploadClient:
     def recv_message(self, sock):
         """Receive a message with length prefix"""
         try:
-            # First receive the message length
-            length_data = sock.recv(4)
-            if not length_data:
+            # First receive the message length (recv may return fewer than 4 bytes)
+            length_data = self.recv_exact(sock, 4)
+            if length_data is None:
                 return None
             
-            msg_length = struct.unpack('!I', length_data)[0]
-            
-            # Then receive the message data
-            data = b''
-            while len(data) < msg_length:
-                chunk = sock.recv(min(msg_length - len(data), 4096))
-                if not chunk:
-                    return None
-                data += chunk
+            msg_length = int.from_bytes(length_data, 'big')
             
-            return data
+            # Then receive the message data straight into a buffer of its final size
+            return self.recv_exact(sock, msg_length)
         except Exception as e:
             print(f"Receive error: {e}")
             return None
+    
+    def recv_exact(self, sock, size):
+        """Receive exactly size bytes, or None if the connection closes first"""
+        buf = bytearray(size)
+        view = memoryview(buf)
+        received = 0
+        while received < size:
+            n = sock.recv_into(view[received:], size - received)
+            if not n:
+                return None
+            received += n
+        return buf
 
 def main():
     if len(sys.argv) < 2:
-        print("Usage: python upload_client.py <file_path> [cloud_host] [cloud_port]")
+        print("Usage: python upload_client.py <file_path> [cloud_host] [cloud_port] [options]")
+        print("Options:")
+        print(f"  --parallel <n>        Upload chunks over n connections (default: {PARALLEL_UPLOADS})")
+        print(f"  --chunk-size <mb>     Chunk size for parallel uploads (default: {PARALLEL_CHUNK_SIZE >> 20})")
+        print()
+        print("A failed parallel upload resumes where it stopped when run again.")
+        print()
         print("Example: python upload_client.py photo.jpg")
         print("Example: python upload_client.py document.pdf remote_host 8000")
+        print("Example: python upload_client.py document.pdf gw1,gw2,gw3 8000")
+        print("Example: python upload_client.py video.mp4 --parallel 8 --chunk-size 16")
+        sys.exit(1)
+    
+    # Parse command line arguments
+    args = []
+    parallel = False
+    parallelism = PARALLEL_UPLOADS
+    chunk_size = PARALLEL_CHUNK_SIZE
+    
+    i = 1
+    while i < len(sys.argv):
+        if sys.argv[i] == '--parallel' and i + 1 < len(sys.argv):
+            parallel = True
+            parallelism = int(sys.argv[i + 1])
+            i += 2
+        elif sys.argv[i] == '--chunk-size' and i + 1 < len(sys.argv):
+            parallel = True
+            chunk_size = int(float(sys.argv[i + 1]) * (1 << 20))
+            i += 2
+        else:
+            args.append(sys.argv[i])
+            i += 1
+    
+    if not args:
+        print("[ERROR] No file given")
         sys.exit(1)
     
-    file_path = sys.argv[1]
-    cloud_host = sys.argv[2] if len(sys.argv) > 2 else 'localhost'
-    cloud_port = int(sys.argv[3]) if len(sys.argv) > 3 else 8000
+    file_path = args[0]
+    cloud_host = args[1] if len(args) > 1 else 'localhost'
+    cloud_port = int(args[2]) if len(args) > 2 else 8000
     
-    client = UploadClient(cloud_host, cloud_port)
+    # A comma-separated host list lets the client pick the fastest gateway
+    cloud_hosts = cloud_host.split(',') if ',' in cloud_host else None
     
     print("[START] File Upload Client")
     print("=" * 50)
     
-    success = client.upload_file(file_path)
+    with UploadClient(cloud_host, cloud_port, cloud_hosts=cloud_hosts) as client:
+        if parallel:
+            success = client.upload_file_parallel(file_path, chunk_size, parallelism)
+        else:
+            success = client.upload_file(file_path)
     
     if success:
         print("\n[SUCCESS] File uploaded successfully!")
@@ -143,4 +674,6 @@ def main():
         sys.exit(1)
 
 if __name__ == "__main__":
-    main()
+    # Importing by name picks up the mypyc build (setup.py --compile) when present
+    import importlib
+    importlib.import_module('upload_client').main()